@@ -26,6 +26,7 @@ from strands.agent.hooks import AfterInvocationEvent, BeforeInvocationEvent
 from ulid import ULID
 
 from shared.config import AgentConfig
+from shared.dedup import create_dedup_store
 from shared.models.event import EventEnvelope, EventType
 from shared.models.run import Run, RunStatus
 from shared.tools.a2a import call_specialist_agent, get_agent_card
@@ -43,6 +44,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger("observer")
 
+# Idempotency layer: drops redelivered envelopes before any model call
+dedup_store = create_dedup_store()
+
 # ============================================
 # System Prompt
 # ============================================
@@ -336,19 +340,52 @@ observer.on("after_invocation", on_after_invocation)
 # ============================================
 # Entry Point (for AgentCore Runtime)
 # ============================================
+def _extract_envelope_id(payload: dict[str, Any], event: Any) -> str | None:
+    """Find the idempotency key for an incoming event.
+
+    Accepts the Observer envelope (``envelope_id``) as well as the
+    simulator envelope and A2A emitter payload (``event_id``).
+    """
+    if isinstance(event, str) and event:
+        try:
+            event = json.loads(event)
+        except json.JSONDecodeError:
+            event = None
+
+    for source in (event, payload):
+        if isinstance(source, dict):
+            key = source.get("envelope_id") or source.get("event_id")
+            if key:
+                return str(key)
+    return None
+
+
 def invoke(payload: dict[str, Any]) -> dict[str, Any]:
     """Entry point for AgentCore Runtime invocation.
 
+    Envelopes already seen within the dedup TTL are acknowledged
+    without invoking the model, so retries never start duplicate runs.
+
     Args:
         payload: Input payload with event data
 
     Returns:
         Processing result
     """
+    envelope_id: str | None = None
     try:
         # Extract event from payload
         event_json = payload.get("event") or payload.get("inputText", "")
 
+        envelope_id = _extract_envelope_id(payload, event_json)
+        if envelope_id and not dedup_store.claim(envelope_id):
+            logger.info(f"Duplicate envelope skipped: {envelope_id}")
+            return {
+                "success": True,
+                "duplicate": True,
+                "envelope_id": envelope_id,
+            }
+
         if isinstance(event_json, dict):
             event_json = json.dumps(event_json)
 
@@ -374,11 +411,15 @@ Report the result."""
         return {
             "success": True,
             "session_id": session_id,
+            "envelope_id": envelope_id,
             "output": result.message if hasattr(result, "message") else str(result),
         }
 
     except Exception as e:
         logger.error(f"Invocation failed: {e!s}")
+        # Let a retry of a failed envelope through
+        if envelope_id:
+            dedup_store.release(envelope_id)
         return {
             "success": False,
             "error": str(e),
@@ -0,0 +1,188 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Shared Dedup Store - Idempotent Event Intake
+# ============================================
+#
+# Retries and A2A redelivery can hand the same envelope to an
+# agent more than once. The dedup store remembers envelope ids
+# for a TTL window so duplicates are dropped BEFORE any model call.
+#
+# Backends:
+# - InMemoryDedupStore: bounded LRU with TTL (default, local mode)
+# - DynamoDBDedupStore: conditional put on a TTL table, fronted by
+#   the in-memory LRU so hot duplicates never leave the process
+# ============================================
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+logger = logging.getLogger("dedup")
+
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class InMemoryDedupStore:
+    """Bounded LRU of seen keys with per-entry expiry.
+
+    All operations are O(1): lookups hit the dict, recency updates
+    use ``move_to_end`` and eviction pops from the LRU end.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            ttl_seconds: How long a key is remembered
+            max_entries: Maximum keys kept before LRU eviction
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def claim(self, key: str) -> bool:
+        """Mark a key as seen.
+
+        Args:
+            key: Idempotency key (envelope id)
+
+        Returns:
+            True if the key was new (caller should process it),
+            False if it was already seen within the TTL window
+        """
+        now = time.monotonic()
+        with self._lock:
+            expires_at = self._entries.get(key)
+            if expires_at is not None and expires_at > now:
+                self._entries.move_to_end(key)
+                return False
+
+            self._entries[key] = now + self.ttl_seconds
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True
+
+    def release(self, key: str) -> None:
+        """Forget a key so a later retry is processed again.
+
+        Args:
+            key: Idempotency key to forget
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DynamoDBDedupStore:
+    """Dedup store shared across runtime instances via DynamoDB.
+
+    Uses a conditional ``put_item`` so exactly one instance wins the
+    claim. Items carry an epoch ``ttl`` attribute for DynamoDB TTL.
+    If DynamoDB is unavailable the store fails open to the local LRU
+    so event processing is never blocked by the dedup layer.
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        table: Any | None = None,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            table_name: DynamoDB table with ``dedup_key`` hash key
+            ttl_seconds: How long a key is remembered
+            max_entries: Size of the in-process LRU front
+            table: Pre-built table resource (for tests)
+        """
+        self.table_name = table_name
+        self.ttl_seconds = ttl_seconds
+        self._local = InMemoryDedupStore(ttl_seconds=ttl_seconds, max_entries=max_entries)
+        self._table = table
+
+    def _get_table(self) -> Any:
+        """Get (and cache) the DynamoDB table resource."""
+        if self._table is None:
+            import boto3
+
+            dynamodb = boto3.resource(
+                "dynamodb",
+                region_name=os.environ.get("AWS_REGION", "us-east-2"),
+            )
+            self._table = dynamodb.Table(self.table_name)
+        return self._table
+
+    def claim(self, key: str) -> bool:
+        """Mark a key as seen across all instances.
+
+        Args:
+            key: Idempotency key (envelope id)
+
+        Returns:
+            True if this caller won the claim, False for duplicates
+        """
+        if not self._local.claim(key):
+            return False
+
+        now = int(time.time())
+        try:
+            self._get_table().put_item(
+                Item={"dedup_key": key, "ttl": now + int(self.ttl_seconds)},
+                ConditionExpression="attribute_not_exists(dedup_key) OR #ttl < :now",
+                ExpressionAttributeNames={"#ttl": "ttl"},
+                ExpressionAttributeValues={":now": now},
+            )
+            return True
+        except Exception as e:
+            code = getattr(e, "response", {}).get("Error", {}).get("Code")
+            if code == "ConditionalCheckFailedException":
+                return False
+            logger.warning(f"Dedup table unavailable, using local store: {e}")
+            return True
+
+    def release(self, key: str) -> None:
+        """Forget a key locally and in DynamoDB.
+
+        Args:
+            key: Idempotency key to forget
+        """
+        self._local.release(key)
+        try:
+            self._get_table().delete_item(Key={"dedup_key": key})
+        except Exception as e:
+            logger.warning(f"Failed to release dedup key {key}: {e}")
+
+
+def create_dedup_store() -> InMemoryDedupStore | DynamoDBDedupStore:
+    """Build the dedup store configured by environment variables.
+
+    DEDUP_TABLE_NAME selects the DynamoDB backend; otherwise the
+    in-memory LRU is used. DEDUP_TTL_SECONDS and DEDUP_MAX_ENTRIES
+    tune both backends.
+    """
+    ttl_seconds = float(os.environ.get("DEDUP_TTL_SECONDS", DEFAULT_TTL_SECONDS))
+    max_entries = int(os.environ.get("DEDUP_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+    table_name = os.environ.get("DEDUP_TABLE_NAME")
+
+    if table_name:
+        return DynamoDBDedupStore(
+            table_name=table_name,
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+        )
+    return InMemoryDedupStore(ttl_seconds=ttl_seconds, max_entries=max_entries)
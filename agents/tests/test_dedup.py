@@ -0,0 +1,142 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Agents - Dedup Store Tests
+# ============================================
+
+"""Tests for the idempotent event intake store."""
+
+import time
+
+import pytest
+
+from shared.dedup import DynamoDBDedupStore, InMemoryDedupStore
+
+
+class _ConditionalCheckFailed(Exception):
+    """Stand-in for botocore's ConditionalCheckFailedException."""
+
+    response = {"Error": {"Code": "ConditionalCheckFailedException"}}
+
+
+class _FakeTable:
+    """Minimal DynamoDB table honouring attribute_not_exists."""
+
+    def __init__(self):
+        self.items: dict[str, dict] = {}
+
+    def put_item(self, Item, **_conditions):
+        if Item["dedup_key"] in self.items:
+            raise _ConditionalCheckFailed()
+        self.items[Item["dedup_key"]] = Item
+
+    def delete_item(self, Key):
+        self.items.pop(Key["dedup_key"], None)
+
+
+class TestInMemoryDedupStore:
+    """Tests for InMemoryDedupStore."""
+
+    def test_first_claim_wins(self):
+        """Test that only the first claim for a key succeeds."""
+        store = InMemoryDedupStore()
+        assert store.claim("ENV-001") is True
+        assert store.claim("ENV-001") is False
+        assert store.claim("ENV-002") is True
+
+    def test_release_allows_retry(self):
+        """Test that a released key can be claimed again."""
+        store = InMemoryDedupStore()
+        store.claim("ENV-001")
+        store.release("ENV-001")
+        assert store.claim("ENV-001") is True
+
+    def test_expired_key_is_reclaimable(self):
+        """Test that keys are forgotten after the TTL."""
+        store = InMemoryDedupStore(ttl_seconds=0.01)
+        store.claim("ENV-001")
+        time.sleep(0.02)
+        assert store.claim("ENV-001") is True
+
+    def test_lru_bound(self):
+        """Test that the store never grows past max_entries."""
+        store = InMemoryDedupStore(max_entries=3)
+        for i in range(10):
+            store.claim(f"ENV-{i}")
+        assert len(store) == 3
+        assert store.claim("ENV-9") is False
+        assert store.claim("ENV-0") is True
+
+
+class TestDynamoDBDedupStore:
+    """Tests for DynamoDBDedupStore with a fake table."""
+
+    def test_duplicate_across_instances(self):
+        """Test that a second runtime instance sees the first claim."""
+        table = _FakeTable()
+        first = DynamoDBDedupStore("dedup", table=table)
+        second = DynamoDBDedupStore("dedup", table=table)
+        assert first.claim("ENV-001") is True
+        assert second.claim("ENV-001") is False
+
+    def test_release_clears_table(self):
+        """Test that release removes the key from the table."""
+        table = _FakeTable()
+        store = DynamoDBDedupStore("dedup", table=table)
+        store.claim("ENV-001")
+        store.release("ENV-001")
+        assert "ENV-001" not in table.items
+
+
+class _FakeObserver:
+    """Stands in for the Observer's Strands agent, counting model calls."""
+
+    class _State(dict):
+        def set(self, key, value):
+            self[key] = value
+
+    def __init__(self):
+        self.state = self._State()
+        self.prompts: list[str] = []
+        self.error: Exception | None = None
+
+    def __call__(self, prompt):
+        self.prompts.append(prompt)
+        if self.error:
+            raise self.error
+        return "routed"
+
+
+class TestObserverInvokeDedup:
+    """Tests that the Observer entry point drops redelivered envelopes."""
+
+    @pytest.fixture
+    def observer_agent(self, monkeypatch):
+        agent = pytest.importorskip("observer.agent")
+        fake = _FakeObserver()
+        monkeypatch.setattr(agent, "observer", fake)
+        monkeypatch.setattr(agent, "dedup_store", InMemoryDedupStore())
+        return agent, fake
+
+    def test_duplicate_envelope_skips_agent(self, observer_agent):
+        """Test that a second invoke with the same envelope_id never reaches the agent."""
+        agent, fake = observer_agent
+        payload = {"event": {"envelope_id": "ENV-001", "event": {"case_id": "TW-1"}}}
+
+        first = agent.invoke(payload)
+        second = agent.invoke(payload)
+
+        assert first["success"] is True
+        assert "duplicate" not in first
+        assert second == {"success": True, "duplicate": True, "envelope_id": "ENV-001"}
+        assert len(fake.prompts) == 1
+
+    def test_failed_envelope_is_retried(self, observer_agent):
+        """Test that a failed invocation releases the key so a retry runs."""
+        agent, fake = observer_agent
+        payload = {"event_id": "ENV-002", "inputText": "{}"}
+
+        fake.error = RuntimeError("model unavailable")
+        assert agent.invoke(payload)["success"] is False
+        fake.error = None
+        assert agent.invoke(payload)["success"] is True
+        assert len(fake.prompts) == 2
@@ -0,0 +1,109 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Benchmark - Columnar Case Analytics
+# ============================================
+#
+# Compares "complaints per brand per day by category for
+# the last 90 days" computed by a Python loop over Case
+# objects with the NumPy columnar mirror, plus the cost of
+# building the mirror and of an incremental sync.
+#
+# Run:
+#   uv run --extra analytics python -m benchmarks.case_analytics --cases 1000000
+#
+# ============================================
+
+import argparse
+import random
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from src.simulator.analytics import CaseColumns, analytics_available
+from src.simulator.models import (
+    GALDERMA_PRODUCTS,
+    Case,
+    CaseSeverity,
+    CaseStatus,
+    CaseType,
+    ComplaintCategory,
+)
+
+
+def _cases(count: int, now: datetime) -> list[Case]:
+    rng = random.Random(7)
+    products = [(brand, name) for brand, names in GALDERMA_PRODUCTS.items() for name in names]
+    categories = list(ComplaintCategory)
+    severities = list(CaseSeverity)
+    statuses = list(CaseStatus)
+    types = list(CaseType)
+    cases = []
+    for i in range(count):
+        brand, name = rng.choice(products)
+        cases.append(Case.model_construct(
+            case_id=f"TW-{i:08X}",
+            product_brand=brand,
+            product_name=name,
+            category=rng.choice(categories),
+            severity=rng.choice(severities),
+            status=rng.choice(statuses),
+            case_type=rng.choice(types),
+            created_at=now - timedelta(seconds=rng.randrange(180 * 86400)),
+        ))
+    return cases
+
+
+def _python_loop(cases: list[Case], since: datetime) -> Counter:
+    counts: Counter = Counter()
+    for case in cases:
+        if case.case_type == CaseType.COMPLAINT and case.created_at >= since:
+            counts[(case.product_brand, case.category, case.created_at.date())] += 1
+    return counts
+
+
+def _timed(fn, repeat: int = 5) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Columnar case analytics benchmark")
+    parser.add_argument("--cases", type=int, default=1_000_000)
+    parser.add_argument("--changed", type=int, default=1000)
+    args = parser.parse_args()
+
+    if not analytics_available():
+        print("numpy not installed; install the analytics extra")
+        return
+
+    now = datetime.utcnow()
+    since = now - timedelta(days=90)
+    cases = _cases(args.cases, now)
+
+    columns = CaseColumns()
+    start = time.perf_counter()
+    columns.sync(1, cases, full=True)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    changed = cases[: args.changed]
+    sync_ms, _ = _timed(lambda: columns.sync(2, changed), repeat=3)
+
+    loop_ms, expected = _timed(lambda: _python_loop(cases, since), repeat=3)
+    numpy_ms, groups = _timed(lambda: columns.aggregate(
+        ["brand", "category"], bucket="day", since=since, filters={"case_type": "COMPLAINT"}
+    ))
+    assert sum(g["count"] for g in groups) == sum(expected.values())
+
+    print(f"cases: {args.cases:,}  groups: {len(groups):,}")
+    print(f"{'build mirror':>24} {build_ms:>10.1f} ms")
+    print(f"{f'sync {args.changed} changed':>24} {sync_ms:>10.1f} ms")
+    print(f"{'python loop':>24} {loop_ms:>10.1f} ms")
+    print(f"{'numpy aggregate':>24} {numpy_ms:>10.1f} ms  ({loop_ms / numpy_ms:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
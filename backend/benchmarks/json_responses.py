@@ -0,0 +1,101 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Benchmark - JSON Response Encoding
+# ============================================
+#
+# Times the hot read routes end to end through the ASGI
+# app (routing, validation, encoding), in process so no
+# socket or HTTP client overhead is measured. Fills the
+# simulator with demo batches first; admission control is
+# switched off so the token buckets do not interfere.
+#
+# Run:
+#   uv run python -m benchmarks.json_responses --cases 2000
+#
+# ============================================
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import time
+from typing import Any
+
+from src.admission import admission_controller
+from src.main import app
+from src.simulator.api import simulator_api
+from src.simulator.models import BatchCreate
+
+
+ROUTES = [
+    ("GET", "/api/cases", "page_size=100", None),
+    ("GET", "/api/events", "limit=1000", None),
+    ("GET", "/api/runs", "", None),
+    ("POST", "/invocations", "", {"action": "list_cases", "page_size": 100}),
+]
+
+
+async def _request(method: str, path: str, query: str, body: Any) -> bytes:
+    payload = json.dumps(body).encode() if body is not None else b""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 1),
+        "server": ("127.0.0.1", 8080),
+    }
+    chunks: list[bytes] = []
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, message
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(chunks)
+
+
+async def _bench(repeat: int) -> None:
+    for method, path, query, body in ROUTES:
+        await _request(method, path, query, body)  # warm caches
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            response = await _request(method, path, query, body)
+            samples.append(time.perf_counter() - start)
+        label = f"{method} {path}{'?' + query if query else ''}"
+        print(
+            f"{label:>34} {statistics.median(samples) * 1000:>9.2f} ms"
+            f"  {len(response) / 1024:>8.0f} KiB"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JSON response encoding benchmark")
+    parser.add_argument("--cases", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    admission_controller.enabled = False
+    while len(simulator_api._cases) < args.cases:
+        simulator_api.create_batch(BatchCreate(count=50))
+
+    print(f"cases: {len(simulator_api._cases):,}  events: {len(simulator_api._events):,}")
+    asyncio.run(_bench(args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Benchmark - Timeline Frame Coalescing
+# ============================================
+#
+# Replays a burst (e.g. a 500-case batch) to N clients and
+# compares one-frame-per-event delivery with negotiated
+# coalescing: frames written, frames per second saved and
+# wall time until every client has received the burst.
+#
+# Sockets are in-process stand-ins that count frames, so the
+# numbers isolate server-side per-frame overhead.
+#
+# Run:
+#   uv run python -m benchmarks.timeline_coalescing
+#
+# ============================================
+
+import argparse
+import asyncio
+import logging
+import time
+
+from src.bridge.websocket import WebSocketManager
+
+
+class _CountingSocket:
+    """Socket stand-in that counts frames and the events inside them."""
+
+    def __init__(self) -> None:
+        self.frames = 0
+        self.events = 0
+        self.done = asyncio.Event()
+        self.expected = 0
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, text: str) -> None:
+        self.frames += 1
+        self.events += text.count('"case_created"')
+        if self.events >= self.expected:
+            self.done.set()
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+
+async def _run(connections: int, events: int, coalesce: str | None) -> dict[str, float]:
+    manager = WebSocketManager(send_queue_size=events + 1, coalesce_max_events=events)
+    sockets = [_CountingSocket() for _ in range(connections)]
+    for socket in sockets:
+        socket.expected = events
+        await manager.connect(socket)
+        if coalesce:
+            manager.set_coalescing(socket, coalesce)
+    await asyncio.sleep(0.01)
+    for socket in sockets:
+        socket.frames = 0
+
+    start = time.perf_counter()
+    for i in range(events):
+        await manager.broadcast({"type": "case_created", "case_id": f"TW-{i:08d}"})
+    await asyncio.gather(*(socket.done.wait() for socket in sockets))
+    elapsed = time.perf_counter() - start
+
+    for socket in sockets:
+        manager.disconnect(socket)
+    await asyncio.sleep(0)
+
+    frames = sum(socket.frames for socket in sockets)
+    return {"frames": frames, "elapsed_ms": elapsed * 1000, "fps": frames / elapsed}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Timeline frame coalescing benchmark")
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--coalesce", default="20,200", help="<ms>[,<events>] to negotiate")
+    args = parser.parse_args()
+    logging.getLogger("websocket").setLevel(logging.WARNING)
+
+    plain = asyncio.run(_run(args.connections, args.events, None))
+    packed = asyncio.run(_run(args.connections, args.events, args.coalesce))
+    saved = plain["frames"] - packed["frames"]
+
+    print(f"{args.events} events x {args.connections} connections")
+    print(f"{'mode':>16} {'frames':>10} {'elapsed ms':>12} {'frames/s':>12}")
+    for name, result in (("per-event", plain), (f"coalesce {args.coalesce}", packed)):
+        print(
+            f"{name:>16} {result['frames']:>10} "
+            f"{result['elapsed_ms']:>12.1f} {result['fps']:>12.0f}"
+        )
+    print(f"frames saved: {saved} ({saved / plain['frames']:.1%}), "
+          f"{saved / (plain['elapsed_ms'] / 1000):.0f} frames/s at the per-event rate")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Benchmark - Timeline Frame Encodings
+# ============================================
+#
+# Compares bytes on the wire and server CPU per event for
+# JSON and MessagePack frames, each raw and with
+# permessage-deflate (raw DEFLATE + sync flush per message,
+# with and without context takeover), over the typical
+# event mix: case_created with a full case, tool_called
+# and run_completed.
+#
+# Run:
+#   uv run --extra msgpack python -m benchmarks.timeline_encoding
+#
+# ============================================
+
+import argparse
+import time
+import zlib
+from collections.abc import Callable
+from datetime import datetime
+
+from src.bridge.websocket import FrameEncoding, encode_frame, supported_encodings
+
+
+def _case_created(i: int) -> dict:
+    case_id = f"TW-{i:08X}"
+    return {
+        "type": "case_created",
+        "case_id": case_id,
+        "message": "CaseCreated",
+        "data": {
+            "case_id": case_id,
+            "case": {
+                "case_id": case_id,
+                "product_brand": "CETAPHIL",
+                "product_name": "Gentle Skin Cleanser",
+                "complaint_text": "The seal on my CETAPHIL Gentle Skin Cleanser was broken when I received it.",
+                "customer_name": "Maria Silva",
+                "customer_email": "maria.silva@example.com",
+                "case_type": "COMPLAINT",
+                "category": "PACKAGING",
+                "status": "OPEN",
+                "severity": "MEDIUM",
+                "lot_number": f"LOT-{i % 1000:05d}",
+                "created_at": "2026-02-04T12:00:00",
+                "updated_at": "2026-02-04T12:00:00",
+            },
+        },
+    }
+
+
+def _tool_called(i: int) -> dict:
+    return {
+        "type": "tool_called",
+        "run_id": f"run-{i // 10:06d}",
+        "agent": "case_understanding",
+        "tool": "get_case",
+        "args_preview": f'{{"case_id": "TW-{i:08X}", "include_history": true}}',
+    }
+
+
+def _run_completed(i: int) -> dict:
+    return {
+        "type": "run_completed",
+        "run_id": f"run-{i // 10:06d}",
+        "case_id": f"TW-{i:08X}",
+        "result": "AUTO_CLOSED",
+        "duration_ms": 1200 + i % 500,
+    }
+
+
+MIXES: dict[str, Callable[[int], dict]] = {
+    "case_created": _case_created,
+    "tool_called": _tool_called,
+    "run_completed": _run_completed,
+}
+
+
+def _events(factory: Callable[[int], dict], count: int) -> list[dict]:
+    stamp = datetime(2026, 2, 4, 12, 0, 0).isoformat()
+    events = []
+    for i in range(count):
+        event = factory(i)
+        event["timestamp"] = stamp
+        event["seq"] = i + 1
+        events.append(event)
+    return events
+
+
+def _measure(events: list[dict], encoding: str) -> dict[str, float]:
+    start = time.perf_counter()
+    frames = [encode_frame(dict(event), encoding) for event in events]
+    encode_us = (time.perf_counter() - start) * 1e6 / len(events)
+    raw = [f.encode() if isinstance(f, str) else f for f in frames]
+
+    def deflate(context_takeover: bool) -> tuple[float, float]:
+        compressor = zlib.compressobj(wbits=-15)
+        total = 0
+        start = time.perf_counter()
+        for frame in raw:
+            if not context_takeover:
+                compressor = zlib.compressobj(wbits=-15)
+            # permessage-deflate strips the trailing 00 00 ff ff
+            total += len(compressor.compress(frame) + compressor.flush(zlib.Z_SYNC_FLUSH)) - 4
+        return total / len(raw), (time.perf_counter() - start) * 1e6 / len(raw)
+
+    takeover_bytes, takeover_us = deflate(True)
+    fresh_bytes, fresh_us = deflate(False)
+    return {
+        "raw_bytes": sum(len(f) for f in raw) / len(raw),
+        "encode_us": encode_us,
+        "deflate_bytes": takeover_bytes,
+        "deflate_us": takeover_us,
+        "deflate_fresh_bytes": fresh_bytes,
+        "deflate_fresh_us": fresh_us,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Timeline frame encoding benchmark")
+    parser.add_argument("--events", type=int, default=2000)
+    args = parser.parse_args()
+
+    encodings = supported_encodings()
+    if FrameEncoding.MSGPACK not in encodings:
+        print("msgpack not installed; showing JSON only")
+
+    print(
+        f"{'event':>14} {'encoding':>9} {'raw B':>7} {'encode us':>10} "
+        f"{'deflate B':>10} {'+us':>6} {'no-ctx B':>9} {'+us':>6}"
+    )
+    for name, factory in MIXES.items():
+        events = _events(factory, args.events)
+        for encoding in encodings:
+            r = _measure(events, encoding)
+            print(
+                f"{name:>14} {encoding:>9} {r['raw_bytes']:>7.0f} {r['encode_us']:>10.2f} "
+                f"{r['deflate_bytes']:>10.0f} {r['deflate_us']:>6.2f} "
+                f"{r['deflate_fresh_bytes']:>9.0f} {r['deflate_fresh_us']:>6.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Benchmark - Timeline Fan-out Cost
+# ============================================
+#
+# Measures the broadcaster's per-event cost at 1k, 5k and
+# 10k connections, comparing encode-per-socket (old path)
+# with encode-once (current WebSocketManager.broadcast).
+#
+# Sockets are in-process stand-ins, so the numbers isolate
+# server-side CPU: encoding plus queue hand-off.
+#
+# Run:
+#   uv run python -m benchmarks.timeline_fanout
+#
+# ============================================
+
+import argparse
+import asyncio
+import json
+import time
+
+from src.bridge.websocket import WebSocketManager
+
+
+class _NullSocket:
+    """Socket stand-in that accepts and discards frames."""
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, text: str) -> None:
+        pass
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+
+def _sample_event() -> dict:
+    """A case_created event with a full case payload."""
+    return {
+        "type": "case_created",
+        "case_id": "TW-1A2B3C4D",
+        "message": "CaseCreated",
+        "data": {
+            "case_id": "TW-1A2B3C4D",
+            "case": {
+                "case_id": "TW-1A2B3C4D",
+                "product_brand": "CETAPHIL",
+                "product_name": "Gentle Skin Cleanser",
+                "complaint_text": "The seal on my CETAPHIL Gentle Skin Cleanser was broken when I received it.",
+                "customer_name": "Maria Silva",
+                "customer_email": "maria.silva@example.com",
+                "case_type": "COMPLAINT",
+                "category": "PACKAGING",
+                "status": "OPEN",
+                "severity": "MEDIUM",
+                "lot_number": "LOT-12345",
+                "created_at": "2026-02-04T12:00:00",
+                "updated_at": "2026-02-04T12:00:00",
+            },
+        },
+    }
+
+
+async def _run(connections: int, events: int) -> dict[str, float]:
+    manager = WebSocketManager(send_queue_size=events + 1)
+    for _ in range(connections):
+        await manager.connect(_NullSocket())
+    await asyncio.sleep(0)
+
+    sockets = list(manager._connections.values())
+    event = _sample_event()
+
+    # Old path: json.dumps once per socket
+    start = time.perf_counter()
+    for _ in range(events):
+        for connection in sockets:
+            connection.queue.put_nowait(json.dumps(event))
+            connection.queue.get_nowait()
+    per_socket_ms = (time.perf_counter() - start) * 1000 / events
+
+    # Current path: encode once, share the payload
+    start = time.perf_counter()
+    for _ in range(events):
+        await manager.broadcast(event)
+        for connection in sockets:
+            connection.queue.get_nowait()
+    encode_once_ms = (time.perf_counter() - start) * 1000 / events
+
+    for connection in sockets:
+        manager.disconnect(connection.websocket)
+    await asyncio.sleep(0)
+
+    return {"per_socket_ms": per_socket_ms, "encode_once_ms": encode_once_ms}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Timeline fan-out benchmark")
+    parser.add_argument("--connections", type=int, nargs="+", default=[1000, 5000, 10000])
+    parser.add_argument("--events", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'connections':>12} {'encode/socket ms':>18} {'encode once ms':>16} {'speedup':>8}")
+    for n in args.connections:
+        result = asyncio.run(_run(n, args.events))
+        speedup = result["per_socket_ms"] / result["encode_once_ms"]
+        print(
+            f"{n:>12} {result['per_socket_ms']:>18.2f} "
+            f"{result['encode_once_ms']:>16.2f} {speedup:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Benchmark - Timeline WebSocket Load Test
+# ============================================
+#
+# Opens thousands of /ws/timeline connections against one
+# simulator instance while driving case creation, and reports
+# how the bridge holds up:
+#
+# - p50/p99 delivery latency (POST /api/cases -> case_created
+#   frame received), for healthy readers only
+# - server memory per connection (RSS delta / connections)
+# - dropped frames and evictions (server counters) plus the
+#   events fast clients actually missed
+#
+# Client mix: firehose readers, type-filtered readers,
+# case-filtered readers that should receive nothing, and a
+# fraction of deliberately slow readers.
+#
+# By default a server is started on a free port; pass --url
+# to test an already running instance (memory is then only
+# reported when --pid is given). All clients share one
+# Python process, so at high connection counts part of the
+# measured latency is client-side parsing.
+#
+# Run:
+#   uv run python -m benchmarks.timeline_loadtest --connections 2000
+#
+# ============================================
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import websockets
+
+
+# ============================================
+# Server Process
+# ============================================
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_server(port: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "TIMELINE_BUS": "inprocess",
+        "ADMISSION_ENABLED": "false",
+        "A2A_ENABLED": "false",
+    }
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "src.main:app",
+            "--port", str(port), "--log-level", "warning",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _rss_bytes(pid: int) -> int:
+    """Resident set size of a process (Linux /proc)."""
+    with Path(f"/proc/{pid}/status").open() as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+async def _wait_ready(base: str, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(f"{base}/ping")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+# ============================================
+# Clients
+# ============================================
+class _Reader:
+    """One timeline client and what it received."""
+
+    def __init__(self, kind: str, subscription: str | None, read_delay: float) -> None:
+        self.kind = kind
+        self.subscription = subscription
+        self.read_delay = read_delay
+        self.received: dict[str, float] = {}
+        self.connected = False
+
+    async def run(self, url: str, stop: asyncio.Event) -> None:
+        try:
+            async with websockets.connect(url, max_size=None, open_timeout=60) as ws:
+                await ws.recv()  # welcome
+                if self.subscription:
+                    await ws.send(f"subscribe:{self.subscription}")
+                self.connected = True
+                while not stop.is_set():
+                    try:
+                        frame = await asyncio.wait_for(ws.recv(), 0.2)
+                    except TimeoutError:
+                        continue
+                    now = time.monotonic()
+                    event = json.loads(frame)
+                    if event.get("type") == "case_created":
+                        self.received[event["case_id"]] = now
+                    if self.read_delay:
+                        await asyncio.sleep(self.read_delay)
+        except (TimeoutError, websockets.ConnectionClosed, OSError):
+            pass
+
+
+def _build_readers(connections: int, slow_fraction: float) -> list[_Reader]:
+    readers = []
+    for i in range(connections):
+        if i < connections * slow_fraction:
+            readers.append(_Reader("slow", None, read_delay=0.5))
+        elif i % 3 == 0:
+            readers.append(_Reader("firehose", None, 0.0))
+        elif i % 3 == 1:
+            readers.append(_Reader("typed", "type=case_created", 0.0))
+        else:
+            readers.append(_Reader("unmatched", "case_id=TW-NOPE", 0.0))
+    return readers
+
+
+# ============================================
+# Load Test
+# ============================================
+async def _drive_cases(base: str, cases: int, rate: float) -> dict[str, float]:
+    body = {
+        "product_brand": "CETAPHIL",
+        "product_name": "Gentle Skin Cleanser",
+        "complaint_text": "The seal on my Cetaphil Gentle Skin Cleanser was broken.",
+        "customer_name": "Maria Silva",
+        "case_type": "COMPLAINT",
+    }
+    sent: dict[str, float] = {}
+    async with httpx.AsyncClient(timeout=30) as http:
+        for _ in range(cases):
+            start = time.monotonic()
+            response = await http.post(f"{base}/api/cases", json=body)
+            sent[response.json()["case_id"]] = start
+            await asyncio.sleep(1 / rate)
+    return sent
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return float("nan")
+    return values[min(len(values) - 1, int(len(values) * pct))]
+
+
+async def _load_test(base: str, pid: int | None, args: argparse.Namespace) -> None:
+    await _wait_ready(base)
+    ws_url = base.replace("http", "ws", 1) + "/ws/timeline"
+    rss_before = _rss_bytes(pid) if pid else 0
+
+    readers = _build_readers(args.connections, args.slow_fraction)
+    stop = asyncio.Event()
+    tasks = []
+    for start in range(0, len(readers), args.connect_batch):
+        batch = readers[start : start + args.connect_batch]
+        tasks += [asyncio.create_task(r.run(ws_url, stop)) for r in batch]
+        await asyncio.sleep(0.05)
+    await asyncio.sleep(2.0)
+
+    connected = sum(r.connected for r in readers)
+    rss_connected = _rss_bytes(pid) if pid else 0
+
+    sent = await _drive_cases(base, args.cases, args.rate)
+    await asyncio.sleep(args.settle)
+
+    async with httpx.AsyncClient() as http:
+        server_stats = (await http.get(f"{base}/api/timeline/stats")).json()
+
+    stop.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    latencies = sorted(
+        (received_at - sent[case_id]) * 1000
+        for r in readers
+        if r.kind in ("firehose", "typed")
+        for case_id, received_at in r.received.items()
+        if case_id in sent
+    )
+    healthy = [r for r in readers if r.kind in ("firehose", "typed") and r.connected]
+    expected = len(healthy) * len(sent)
+    missed = expected - sum(len(r.received.keys() & sent.keys()) for r in healthy)
+    leaked = sum(len(r.received) for r in readers if r.kind == "unmatched")
+
+    print(f"connections: {connected}/{args.connections} connected "
+          f"({args.slow_fraction:.0%} slow readers), {len(sent)} cases at {args.rate}/s")
+    print(f"delivery latency: p50 {_percentile(latencies, 0.50):.1f} ms, "
+          f"p99 {_percentile(latencies, 0.99):.1f} ms, max {_percentile(latencies, 1.0):.1f} ms")
+    if pid:
+        per_conn = (rss_connected - rss_before) / max(connected, 1)
+        print(f"server memory: {rss_before / 2**20:.1f} MiB idle, "
+              f"{rss_connected / 2**20:.1f} MiB connected, {per_conn / 1024:.1f} KiB/connection")
+    print(f"dropped frames (server): {server_stats.get('dropped_frames')}, "
+          f"dropped events: {server_stats.get('dropped_events')}, "
+          f"evicted: {server_stats.get('evicted_connections')}")
+    print(f"missed by healthy readers: {missed}/{expected}, "
+          f"leaked to unmatched filters: {leaked}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Timeline WebSocket load test")
+    parser.add_argument("--url", help="Existing server base URL (default: start one)")
+    parser.add_argument("--pid", type=int, help="Server PID for memory readings with --url")
+    parser.add_argument("--connections", type=int, default=2000)
+    parser.add_argument("--slow-fraction", type=float, default=0.05)
+    parser.add_argument("--cases", type=int, default=200)
+    parser.add_argument("--rate", type=float, default=50.0, help="Cases created per second")
+    parser.add_argument("--connect-batch", type=int, default=200)
+    parser.add_argument(
+        "--settle", type=float, default=3.0, help="Seconds to wait after the last case"
+    )
+    args = parser.parse_args()
+
+    if args.url:
+        asyncio.run(_load_test(args.url, args.pid, args))
+        return
+
+    port = _free_port()
+    server = _start_server(port)
+    try:
+        asyncio.run(_load_test(f"http://127.0.0.1:{port}", server.pid, args))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
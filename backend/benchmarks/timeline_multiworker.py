@@ -0,0 +1,167 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Benchmark - Cross-Worker Timeline Latency
+# ============================================
+#
+# Starts the simulator under uvicorn with several workers,
+# spreads WebSocket clients across them (the kernel balances
+# accepts), creates cases on random workers and measures
+# end-to-end latency from POST to every client receiving the
+# case_created event.
+#
+# Runs once per bus backend so the in-process baseline shows
+# what clients miss without a bus.
+#
+# Run:
+#   uv run python -m benchmarks.timeline_multiworker
+#
+# ============================================
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+import websockets
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_server(port: int, workers: int, bus: str, bus_path: str) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "TIMELINE_BUS": bus,
+        "TIMELINE_BUS_PATH": bus_path,
+        "ADMISSION_ENABLED": "false",
+        "A2A_ENABLED": "false",
+    }
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "src.main:app",
+            "--port", str(port), "--workers", str(workers), "--log-level", "warning",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def _wait_ready(base: str, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(f"{base}/ping")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+async def _client(
+    url: str,
+    received: dict[str, list[float]],
+    streams: set[str],
+    stop: asyncio.Event,
+) -> None:
+    async with websockets.connect(url, max_size=None) as ws:
+        welcome = json.loads(await ws.recv())
+        streams.add(welcome.get("stream_id", ""))
+        await ws.send("subscribe:type=case_created")
+        while not stop.is_set():
+            try:
+                frame = await asyncio.wait_for(ws.recv(), 0.1)
+            except TimeoutError:
+                continue
+            event = json.loads(frame)
+            if event.get("type") == "case_created":
+                received.setdefault(event["case_id"], []).append(time.monotonic())
+
+
+async def _run(port: int, clients: int, cases: int) -> dict[str, float]:
+    base = f"http://127.0.0.1:{port}"
+    await _wait_ready(base)
+
+    received: dict[str, list[float]] = {}
+    streams: set[str] = set()
+    stop = asyncio.Event()
+    readers = [
+        asyncio.create_task(_client(f"ws://127.0.0.1:{port}/ws/timeline", received, streams, stop))
+        for _ in range(clients)
+    ]
+    await asyncio.sleep(1.0)
+
+    sent: dict[str, float] = {}
+    body = {
+        "product_brand": "CETAPHIL",
+        "product_name": "Gentle Skin Cleanser",
+        "complaint_text": "The seal on my Cetaphil Gentle Skin Cleanser was broken.",
+        "customer_name": "Maria Silva",
+        "case_type": "COMPLAINT",
+    }
+    # No keep-alive, so consecutive POSTs land on different workers
+    async with httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=0)) as http:
+        for _ in range(cases):
+            start = time.monotonic()
+            response = await http.post(f"{base}/api/cases", json=body)
+            sent[response.json()["case_id"]] = start
+            await asyncio.sleep(0.005)
+
+    await asyncio.sleep(1.0)
+    stop.set()
+    await asyncio.gather(*readers, return_exceptions=True)
+
+    latencies = sorted(
+        (t - sent[case_id]) * 1000
+        for case_id, times in received.items()
+        if case_id in sent
+        for t in times
+    )
+    return {
+        "workers_reached": len(streams),
+        "delivered": len(latencies) / (clients * cases),
+        "p50_ms": statistics.median(latencies) if latencies else float("nan"),
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] if latencies else float("nan"),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cross-worker timeline latency benchmark")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--clients", type=int, default=40)
+    parser.add_argument("--cases", type=int, default=200)
+    parser.add_argument("--bus", nargs="+", default=["inprocess", "unix"])
+    args = parser.parse_args()
+
+    print(f"{args.workers} workers, {args.clients} clients, {args.cases} cases")
+    print(f"{'bus':>10} {'workers hit':>12} {'delivered':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    for bus in args.bus:
+        port = _free_port()
+        bus_path = str(Path(tempfile.mkdtemp()) / "timeline.sock")
+        server = _start_server(port, args.workers, bus, bus_path)
+        try:
+            result = asyncio.run(_run(port, args.clients, args.cases))
+        finally:
+            server.terminate()
+            server.wait()
+        print(
+            f"{bus:>10} {result['workers_reached']:>12} {result['delivered']:>10.1%} "
+            f"{result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# TrackWise Simulator - Admission Control
+# ============================================
+#
+# Keeps latency bounded when the dispatch pipeline or
+# downstream agents fall behind. New work is rejected
+# with 429 + Retry-After (or briefly delayed) once a
+# registered queue is too deep or too far behind.
+#
+# UI reads and agent writes draw from separate token
+# buckets, so a write storm never starves dashboards.
+#
+# ============================================
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import HTTPException
+
+from .config import settings
+
+
+# ============================================
+# Logger
+# ============================================
+logger = logging.getLogger("admission")
+
+READ = "read"
+WRITE = "write"
+
+
+# ============================================
+# Token Bucket
+# ============================================
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens per second, up to ``burst``."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Refill rate in tokens per second
+            burst: Bucket capacity
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_take(self) -> bool:
+        """Take one token if available."""
+        self._refill()
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+    def retry_after(self) -> float:
+        """Seconds until the next token is available."""
+        self._refill()
+        if self._tokens >= 1.0 or self.rate <= 0:
+            return 0.0
+        return (1.0 - self._tokens) / self.rate
+
+
+# ============================================
+# Admission Controller
+# ============================================
+class AdmissionController:
+    """Decides whether a read or write request may proceed."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        mode: str = "reject",
+        max_queue_depth: int = 500,
+        max_lag_seconds: float = 5.0,
+        max_delay_seconds: float = 2.0,
+        read_rate: float = 200.0,
+        read_burst: int = 400,
+        write_rate: float = 50.0,
+        write_burst: int = 100,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            enabled: Master switch; when False everything is admitted
+            mode: "reject" answers 429 immediately, "delay" waits first
+            max_queue_depth: Pending items above which writes are shed
+            max_lag_seconds: Oldest-item age above which writes are shed
+            max_delay_seconds: Longest wait in "delay" mode before rejecting
+            read_rate: UI read budget (requests per second)
+            read_burst: UI read burst size
+            write_rate: Write budget (requests per second)
+            write_burst: Write burst size
+        """
+        self.enabled = enabled
+        self.mode = mode
+        self.max_queue_depth = max_queue_depth
+        self.max_lag_seconds = max_lag_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self._buckets = {
+            READ: TokenBucket(read_rate, read_burst),
+            WRITE: TokenBucket(write_rate, write_burst),
+        }
+        self._sources: dict[str, tuple[Callable[[], int], Callable[[], float]]] = {}
+        self._admitted = {READ: 0, WRITE: 0}
+        self._rejected = {READ: 0, WRITE: 0}
+
+    def add_source(
+        self,
+        name: str,
+        depth: Callable[[], int],
+        lag: Callable[[], float],
+    ) -> None:
+        """Register a queue whose depth and lag gate new writes.
+
+        Args:
+            name: Source name (shown in stats)
+            depth: Returns the number of pending items
+            lag: Returns the age of the oldest pending item in seconds
+        """
+        self._sources[name] = (depth, lag)
+
+    def pressure(self) -> dict[str, dict[str, float]]:
+        """Current depth and lag of every registered source."""
+        return {
+            name: {"depth": depth(), "lag_seconds": round(lag(), 3)}
+            for name, (depth, lag) in self._sources.items()
+        }
+
+    def _overload_retry_after(self) -> float:
+        """Seconds a writer should back off, or 0 when not overloaded."""
+        retry_after = 0.0
+        for depth_fn, lag_fn in self._sources.values():
+            depth, lag = depth_fn(), lag_fn()
+            if depth > self.max_queue_depth or lag > self.max_lag_seconds:
+                retry_after = max(retry_after, lag, 1.0)
+        return retry_after
+
+    def check(self, kind: str) -> float:
+        """Try to admit one request without waiting.
+
+        Args:
+            kind: READ or WRITE
+
+        Returns:
+            0 when admitted, otherwise the suggested Retry-After in seconds
+        """
+        if not self.enabled:
+            return 0.0
+
+        if kind == WRITE:
+            retry_after = self._overload_retry_after()
+            if retry_after:
+                return retry_after
+
+        bucket = self._buckets[kind]
+        if bucket.try_take():
+            return 0.0
+        return max(bucket.retry_after(), 0.001)
+
+    async def admit(self, kind: str) -> float:
+        """Admit a request, waiting up to max_delay_seconds in delay mode.
+
+        Args:
+            kind: READ or WRITE
+
+        Returns:
+            0 when admitted, otherwise the suggested Retry-After in seconds
+        """
+        retry_after = self.check(kind)
+        if retry_after and self.mode == "delay":
+            deadline = time.monotonic() + self.max_delay_seconds
+            while retry_after and time.monotonic() + min(retry_after, 0.05) <= deadline:
+                await asyncio.sleep(min(retry_after, 0.05))
+                retry_after = self.check(kind)
+
+        if retry_after:
+            self._rejected[kind] += 1
+        else:
+            self._admitted[kind] += 1
+        return retry_after
+
+    def stats(self) -> dict[str, Any]:
+        """Admission counters and current queue pressure."""
+        return {
+            "enabled": self.enabled,
+            "mode": self.mode,
+            "admitted": dict(self._admitted),
+            "rejected": dict(self._rejected),
+            "pressure": self.pressure(),
+        }
+
+
+def too_many_requests(retry_after: float) -> HTTPException:
+    """Build the 429 response for a rejected request."""
+    return HTTPException(
+        status_code=429,
+        detail="Server is busy, retry later",
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+# ============================================
+# FastAPI Dependencies
+# ============================================
+async def admit_read() -> None:
+    """Dependency that budgets UI reads."""
+    retry_after = await admission_controller.admit(READ)
+    if retry_after:
+        raise too_many_requests(retry_after)
+
+
+async def admit_write() -> None:
+    """Dependency that budgets writes and sheds them under backpressure."""
+    retry_after = await admission_controller.admit(WRITE)
+    if retry_after:
+        logger.warning(f"Write rejected (retry after {retry_after:.2f}s)")
+        raise too_many_requests(retry_after)
+
+
+# ============================================
+# Singleton Instance
+# ============================================
+admission_controller = AdmissionController(
+    enabled=settings.admission_enabled,
+    mode=settings.admission_mode,
+    max_queue_depth=settings.admission_max_queue_depth,
+    max_lag_seconds=settings.admission_max_lag_seconds,
+    max_delay_seconds=settings.admission_max_delay_seconds,
+    read_rate=settings.admission_read_rate,
+    read_burst=settings.admission_read_burst,
+    write_rate=settings.admission_write_rate,
+    write_burst=settings.admission_write_burst,
+)
@@ -2,7 +2,14 @@
 # Provides WebSocket connection to frontend for real-time timeline updates
 
 from .routes import router as bridge_router
+from .stats import StatsPublisher, stats_publisher
 from .websocket import WebSocketManager, timeline_manager
 
 
-__all__ = ["WebSocketManager", "bridge_router", "timeline_manager"]
+__all__ = [
+    "StatsPublisher",
+    "WebSocketManager",
+    "bridge_router",
+    "stats_publisher",
+    "timeline_manager",
+]
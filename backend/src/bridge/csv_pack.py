@@ -0,0 +1,341 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# UI Bridge - CSV Pack Jobs
+# ============================================
+#
+# Builds CSV (Computer System Validation) packs in the
+# background instead of inside the request. Each artifact is
+# one step, built off the event loop, and every finished step
+# is pushed over /ws/timeline as a "csv_pack_progress" event.
+#
+# Finished packs are cached by a digest of their inputs (case
+# versions, ledger tail hash and pack date), so asking again
+# for an unchanged pack completes immediately. Packs download
+# as a ZIP that is streamed one artifact at a time.
+#
+# ============================================
+
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import zipfile
+from collections.abc import Callable, Iterator, Mapping
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from ..simulator.api import simulator_api, synced_ledger
+from ..simulator.demo_data import csv_pack_id, csv_pack_steps, csv_pack_summary
+from ..simulator.models import Case, generate_ulid
+from .websocket import TimelineEventType, timeline_manager
+
+
+if TYPE_CHECKING:
+    from typing_extensions import Buffer
+
+
+# ============================================
+# Logger
+# ============================================
+logger = logging.getLogger("bridge.csv_pack")
+
+# (cases, case versions, ledger entries, ledger tail hash)
+PackInputs = tuple[list[Case], Mapping[str, int], list[dict[str, Any]], str]
+
+
+def pack_input_hash(versions: Mapping[str, int], tail_hash: str, now: datetime) -> str:
+    """Digest of everything a pack is built from.
+
+    Case versions change on every case mutation and the tail hash on
+    every ledger append; the date is part of the pack ID.
+
+    Args:
+        versions: case_id -> version of the analyzed cases
+        tail_hash: Hash of the last ledger entry
+        now: Generation time
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256(now.strftime("%Y%m%d").encode())
+    digest.update(tail_hash.encode())
+    for case_id, version in sorted(versions.items()):
+        digest.update(f"|{case_id}:{version}".encode())
+    return digest.hexdigest()
+
+
+# ============================================
+# Jobs
+# ============================================
+class CSVPackStatus:
+    """Lifecycle of a pack job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETE = "complete"
+    FAILED = "failed"
+
+
+class CSVPackJob:
+    """One pack generation request and its progress."""
+
+    def __init__(self, input_hash: str, total_steps: int) -> None:
+        """Initialize a queued job.
+
+        Args:
+            input_hash: Digest from ``pack_input_hash``
+            total_steps: Number of artifacts to build
+        """
+        self.job_id = f"job-{generate_ulid()}"
+        self.input_hash = input_hash
+        self.status = CSVPackStatus.QUEUED
+        self.completed_steps = 0
+        self.total_steps = total_steps
+        self.current_step: str | None = None
+        self.cached = False
+        self.result: dict[str, Any] | None = None
+        self.error: str | None = None
+        self.done = asyncio.Event()
+
+    def to_dict(self, include_result: bool = True) -> dict[str, Any]:
+        """Job state for the API and timeline.
+
+        Args:
+            include_result: Attach the finished pack
+
+        Returns:
+            Job dict
+        """
+        data: dict[str, Any] = {
+            "job_id": self.job_id,
+            "status": self.status,
+            "completed_steps": self.completed_steps,
+            "total_steps": self.total_steps,
+            "current_step": self.current_step,
+            "cached": self.cached,
+            "input_hash": self.input_hash,
+            "error": self.error,
+        }
+        if include_result and self.result is not None:
+            data["result"] = self.result
+        return data
+
+
+class CSVPackJobs:
+    """Runs pack jobs and caches finished packs by input digest."""
+
+    def __init__(
+        self,
+        inputs: Callable[[], PackInputs],
+        publish: Callable[[dict[str, Any]], None],
+        cache_size: int = 8,
+        history_size: int = 32,
+    ) -> None:
+        """Initialize the job manager.
+
+        Args:
+            inputs: Snapshots the cases and ledger a pack is built from
+            publish: Broadcasts one timeline event
+            cache_size: Finished packs kept, least recently used dropped
+            history_size: Jobs kept for status lookups
+        """
+        self._inputs = inputs
+        self._publish = publish
+        self.cache_size = cache_size
+        self.history_size = history_size
+        self._jobs: dict[str, CSVPackJob] = {}
+        self._running: dict[str, CSVPackJob] = {}
+        self._cache: dict[str, dict[str, Any]] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def submit(self) -> CSVPackJob:
+        """Start a pack job for the current data.
+
+        Returns an already complete job when an identical pack is cached,
+        and the in-flight job when one is building the same inputs.
+        """
+        now = datetime.utcnow()
+        cases, versions, ledger_entries, tail_hash = self._inputs()
+        input_hash = pack_input_hash(versions, tail_hash, now)
+
+        if input_hash in self._running:
+            return self._running[input_hash]
+
+        cached = self._cache.pop(input_hash, None)
+        if cached is not None:
+            self._cache[input_hash] = cached
+            self.hits += 1
+            job = self._remember(CSVPackJob(input_hash, len(cached["artifacts"])))
+            job.cached = True
+            job.completed_steps = job.total_steps
+            self._finish(job, cached)
+            return job
+
+        # Steps run in worker threads while the live cases keep changing;
+        # build from copies so the pack matches the hashed versions
+        cases = [case.model_copy(deep=True) for case in cases]
+        pack_id = csv_pack_id(now)
+        steps = csv_pack_steps(pack_id, cases, ledger_entries)
+        job = self._remember(CSVPackJob(input_hash, len(steps)))
+        self.misses += 1
+        self._running[input_hash] = job
+        task = asyncio.get_running_loop().create_task(
+            self._run(job, pack_id, now, cases, ledger_entries, steps)
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    def get(self, job_id: str) -> CSVPackJob | None:
+        """Look up a job by ID."""
+        return self._jobs.get(job_id)
+
+    async def wait(self, job: CSVPackJob) -> CSVPackJob:
+        """Wait until a job completes or fails."""
+        await job.done.wait()
+        return job
+
+    async def _run(
+        self,
+        job: CSVPackJob,
+        pack_id: str,
+        now: datetime,
+        cases: list[Case],
+        ledger_entries: list[dict[str, Any]],
+        steps: list[tuple[str, Callable[[], dict[str, Any]]]],
+    ) -> None:
+        """Build the artifacts one by one, reporting each step."""
+        job.status = CSVPackStatus.RUNNING
+        artifacts = []
+        try:
+            for artifact_type, build in steps:
+                job.current_step = artifact_type
+                self._progress(job)
+                artifacts.append(await asyncio.to_thread(build))
+                job.completed_steps += 1
+
+            pack = csv_pack_summary(pack_id, now, cases, ledger_entries, artifacts)
+            self._cache[job.input_hash] = pack
+            while len(self._cache) > self.cache_size:
+                del self._cache[next(iter(self._cache))]
+            self._finish(job, pack)
+        except Exception as e:
+            logger.error(f"CSV pack job {job.job_id} failed: {e}")
+            job.status = CSVPackStatus.FAILED
+            job.error = str(e)
+            job.done.set()
+            self._progress(job)
+        finally:
+            self._running.pop(job.input_hash, None)
+
+    def _finish(self, job: CSVPackJob, pack: dict[str, Any]) -> None:
+        job.status = CSVPackStatus.COMPLETE
+        job.current_step = None
+        job.result = pack
+        job.done.set()
+        self._progress(job)
+
+    def _progress(self, job: CSVPackJob) -> None:
+        self._publish({
+            "type": TimelineEventType.CSV_PACK_PROGRESS,
+            "message": f"CSV pack {job.status} ({job.completed_steps}/{job.total_steps})",
+            "data": job.to_dict(include_result=False),
+        })
+
+    def _remember(self, job: CSVPackJob) -> CSVPackJob:
+        self._jobs[job.job_id] = job
+        while len(self._jobs) > self.history_size:
+            del self._jobs[next(iter(self._jobs))]
+        return job
+
+    def clear(self) -> None:
+        """Forget cached packs and finished jobs."""
+        self._cache.clear()
+        self._jobs = {job.job_id: job for job in self._running.values()}
+
+    def stats(self) -> dict[str, int]:
+        """Job and cache counters."""
+        return {
+            "jobs": len(self._jobs),
+            "running": len(self._running),
+            "cached_packs": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# ============================================
+# ZIP Export
+# ============================================
+class _ChunkSink(io.RawIOBase):
+    """Write-only stream that hands back what was written since the last drain."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: "Buffer") -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        return len(chunk)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_pack_zip(pack: dict[str, Any]) -> Iterator[bytes]:
+    """Stream a pack as a ZIP archive.
+
+    The archive is written to a non-seekable sink, so zipfile emits
+    data descriptors and each artifact can be sent as soon as it is
+    compressed; the whole archive is never held in memory.
+
+    Args:
+        pack: Finished pack from a job result
+
+    Yields:
+        ZIP bytes, one chunk per archived file
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as archive:
+        names = []
+        for position, artifact in enumerate(pack["artifacts"], start=1):
+            name = f"{position:02d}-{artifact['artifact_type']}.json"
+            names.append(name)
+            with archive.open(name, "w") as member:
+                member.write(json.dumps(artifact, ensure_ascii=False, indent=2).encode())
+            yield sink.drain()
+
+        manifest = {key: value for key, value in pack.items() if key != "artifacts"}
+        manifest["files"] = names
+        archive.writestr("manifest.json", json.dumps(manifest, ensure_ascii=False, indent=2))
+        yield sink.drain()
+    yield sink.drain()
+
+
+# ============================================
+# Singleton Instance
+# ============================================
+def _current_inputs() -> PackInputs:
+    ledger = synced_ledger()
+    return (
+        list(simulator_api._cases.values()),
+        dict(simulator_api.get_case_versions()),
+        ledger.entries(),
+        ledger.stats()["tail_hash"],
+    )
+
+
+csv_pack_jobs = CSVPackJobs(
+    inputs=_current_inputs,
+    # Jobs live in this worker's memory, so progress stays local
+    publish=timeline_manager.publish_local,
+)
@@ -0,0 +1,59 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# UI Bridge - NDJSON Export
+# ============================================
+#
+# Streams cases, events and ledger entries as newline-
+# delimited JSON. Records come from generators over the
+# store and are encoded a small batch at a time, so memory
+# stays flat however large the export is and the client
+# receives the first lines right away.
+#
+# Batches are pulled on the event loop and the stream yields
+# between them; the store generators tolerate mutations in
+# those gaps.
+#
+# ============================================
+
+import json
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from itertools import islice
+from typing import Any
+
+from pydantic import BaseModel
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Records encoded per chunk
+EXPORT_BATCH_SIZE = 200
+
+
+def encode_record(record: BaseModel | dict[str, Any]) -> str:
+    """One NDJSON line (without the newline)."""
+    if isinstance(record, BaseModel):
+        return record.model_dump_json()
+    return json.dumps(record, ensure_ascii=False, default=str)
+
+
+async def iter_ndjson(
+    records: Iterable[Any],
+    encode: Callable[[Any], str] = encode_record,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[bytes]:
+    """Encode records as NDJSON chunks.
+
+    Args:
+        records: Records to export, typically a store generator
+        encode: Turns one record into a JSON line
+        batch_size: Records per yielded chunk
+
+    Yields:
+        UTF-8 chunks of complete lines
+    """
+    iterator: Iterator[Any] = iter(records)
+    while True:
+        lines = [encode(record) for record in islice(iterator, batch_size)]
+        if not lines:
+            return
+        yield ("\n".join(lines) + "\n").encode()
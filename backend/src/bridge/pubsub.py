@@ -0,0 +1,379 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# UI Bridge - Cross-Process Timeline Bus
+# ============================================
+#
+# With several uvicorn workers each process has its own
+# timeline_manager, so a client on worker A would never see
+# events produced on worker B. A bus carries every published
+# event to every worker's broadcaster exactly once
+# (including the worker that produced it).
+#
+# Backends (TIMELINE_BUS):
+# - "inprocess" : no bus (default), single-worker deployments
+# - "unix"      : local Unix-socket broker. The first worker
+#                 to take the lock file hosts the broker; if
+#                 it dies another worker takes over. The socket
+#                 lives in the temp dir, named after the server
+#                 process unless TIMELINE_BUS_PATH is set.
+# - "redis"     : Redis PUBLISH/SUBSCRIBE (needs the redis extra,
+#                 imported when the bus starts, not at startup)
+#
+# ============================================
+
+import asyncio
+import contextlib
+import fcntl
+import importlib.util
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from ..config import settings
+
+
+# ============================================
+# Logger
+# ============================================
+logger = logging.getLogger("bridge.pubsub")
+
+# Broker drops a worker whose unsent backlog exceeds this (it reconnects)
+MAX_PEER_BACKLOG_BYTES = 8 * 1024 * 1024
+# Longest single encoded event accepted on the stream
+MAX_EVENT_BYTES = 16 * 1024 * 1024
+RECONNECT_DELAY_SECONDS = 0.2
+# Redis resubscribe backoff doubles up to this
+MAX_RECONNECT_DELAY_SECONDS = 5.0
+
+
+# ============================================
+# Unix-Socket Broker
+# ============================================
+class UnixSocketBus:
+    """Newline-delimited JSON fan-out over a local Unix socket."""
+
+    name = "unix"
+
+    def __init__(self, path: str) -> None:
+        """Initialize the bus.
+
+        Args:
+            path: Socket path shared by all workers; ``<path>.lock``
+                elects the broker host
+        """
+        self.path = path
+        self._deliver: Callable[[dict[str, Any]], None] | None = None
+        self._task: asyncio.Task | None = None
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock_fd: int | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._peers: set[asyncio.StreamWriter] = set()
+        self._published = 0
+        self._received = 0
+        self._local_fallbacks = 0
+
+    async def start(self, deliver: Callable[[dict[str, Any]], None]) -> None:
+        """Join the bus; ``deliver`` receives every event from every worker.
+
+        Args:
+            deliver: Hands one event to this worker's broadcaster
+        """
+        self._deliver = deliver
+        await self._maybe_host_broker()
+        await self._connect()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Leave the bus and, if hosting it, shut the broker down."""
+        task, self._task = self._task, None
+        if task:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+        if self._server:
+            self._server.close()
+            self._server = None
+            # Let just-accepted peers register so they are closed too
+            await asyncio.sleep(0)
+            for peer in list(self._peers):
+                peer.close()
+            self._peers.clear()
+            Path(self.path).unlink(missing_ok=True)
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+        self._deliver = None
+
+    def publish(self, event: dict[str, Any]) -> None:
+        """Send an event to every worker (must run on the event loop).
+
+        While the broker is unreachable the event is delivered locally
+        only, so this worker's clients keep receiving its own events.
+        """
+        writer = self._writer
+        if writer is None or writer.is_closing():
+            self._local_fallbacks += 1
+            if self._deliver:
+                self._deliver(event)
+            return
+        writer.write(json.dumps(event).encode() + b"\n")
+        self._published += 1
+
+    # ----- worker side -----
+    async def _connect(self) -> None:
+        try:
+            self._reader, self._writer = await asyncio.open_unix_connection(
+                self.path, limit=MAX_EVENT_BYTES
+            )
+        except (FileNotFoundError, ConnectionRefusedError):
+            self._reader, self._writer = None, None
+
+    async def _run(self) -> None:
+        """Read events from the broker, reconnecting (or taking over) on loss."""
+        while True:
+            reader, writer = self._reader, self._writer
+            if reader is None or writer is None:
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+                await self._maybe_host_broker()
+                await self._connect()
+                continue
+
+            try:
+                line = await reader.readline()
+            except (ConnectionError, ValueError):
+                line = b""
+            if not line:
+                logger.warning("Timeline bus connection lost, reconnecting")
+                writer.close()
+                self._writer = None
+                continue
+
+            self._received += 1
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if self._deliver:
+                self._deliver(event)
+
+    # ----- broker side -----
+    async def _maybe_host_broker(self) -> None:
+        """Host the broker if no other live worker holds the lock.
+
+        The lock is released by the OS when its holder exits, so the
+        next worker to lose its connection takes over.
+        """
+        if self._server is not None:
+            return
+        fd = os.open(self.path + ".lock", os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return
+        self._lock_fd = fd
+
+        # Holding the lock means any existing socket file is stale
+        Path(self.path).unlink(missing_ok=True)
+        self._server = await asyncio.start_unix_server(
+            self._handle_peer, path=self.path, limit=MAX_EVENT_BYTES
+        )
+        logger.info(f"Timeline bus broker listening on {self.path} (pid {os.getpid()})")
+
+    async def _handle_peer(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Relay every line from one worker to all workers."""
+        if self._server is None:
+            writer.close()
+            return
+        self._peers.add(writer)
+        try:
+            while line := await reader.readline():
+                for peer in list(self._peers):
+                    if peer.transport.get_write_buffer_size() > MAX_PEER_BACKLOG_BYTES:
+                        logger.warning("Dropping timeline bus peer that fell behind")
+                        self._peers.discard(peer)
+                        peer.close()
+                        continue
+                    peer.write(line)
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            self._peers.discard(writer)
+            writer.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Bus counters."""
+        return {
+            "backend": self.name,
+            "path": self.path,
+            "connected": self._writer is not None,
+            "broker_host": self._server is not None,
+            "broker_peers": len(self._peers),
+            "published": self._published,
+            "received": self._received,
+            "local_fallbacks": self._local_fallbacks,
+        }
+
+
+# ============================================
+# Redis Pub/Sub
+# ============================================
+class RedisBus:
+    """Fan-out through a Redis (or Redis-compatible) PUBLISH channel."""
+
+    name = "redis"
+
+    def __init__(self, url: str, channel: str = "trackwise:timeline") -> None:
+        """Initialize the bus.
+
+        Args:
+            url: Redis connection URL
+            channel: Pub/sub channel shared by all workers
+        """
+        self.url = url
+        self.channel = channel
+        self._deliver: Callable[[dict[str, Any]], None] | None = None
+        self._client: Any = None
+        self._outbox: asyncio.Queue[str] | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._published = 0
+        self._received = 0
+        self._dropped = 0
+        self._reconnects = 0
+
+    async def start(self, deliver: Callable[[dict[str, Any]], None]) -> None:
+        """Subscribe to the channel; ``deliver`` receives every event.
+
+        Raises:
+            RuntimeError: If the redis package is not installed
+        """
+        # Imported here: redis (and the tracing it loads) costs ~0.1 s
+        # of startup that in-process and Unix-socket deployments skip
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError as e:  # optional: pip install galderma-trackwise-backend[redis]
+            raise RuntimeError("redis package not installed") from e
+        self._deliver = deliver
+        self._client = redis_asyncio.from_url(self.url)
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.channel)
+        # A single sender task keeps this worker's events in order
+        self._outbox = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._receive(pubsub)),
+            asyncio.create_task(self._send(self._outbox)),
+        ]
+
+    async def stop(self) -> None:
+        """Unsubscribe and close the connection."""
+        for task in self._tasks:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._deliver = None
+
+    def publish(self, event: dict[str, Any]) -> None:
+        """Queue an event for every worker (must run on the event loop)."""
+        if self._outbox is not None:
+            self._outbox.put_nowait(json.dumps(event))
+
+    async def _send(self, outbox: asyncio.Queue[str]) -> None:
+        while True:
+            message = await outbox.get()
+            try:
+                await self._client.publish(self.channel, message)
+                self._published += 1
+            except Exception as e:
+                logger.error(f"Redis publish failed: {e}")
+
+    async def _receive(self, pubsub: Any) -> None:
+        """Deliver channel messages, resubscribing with backoff on loss."""
+        delay = RECONNECT_DELAY_SECONDS
+        while True:
+            try:
+                if pubsub is None:
+                    pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+                    await pubsub.subscribe(self.channel)
+                    logger.info("Timeline bus resubscribed to Redis")
+                delay = RECONNECT_DELAY_SECONDS
+                async for message in pubsub.listen():
+                    self._handle(message)
+                logger.warning("Redis subscription ended, resubscribing")
+            except Exception as e:
+                logger.warning(f"Redis subscription lost: {e}; retrying in {delay:.1f}s")
+            if pubsub is not None:
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()
+            pubsub = None
+            self._reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY_SECONDS)
+
+    def _handle(self, message: dict[str, Any]) -> None:
+        # One bad message must not end the subscription
+        self._received += 1
+        try:
+            event = json.loads(message["data"])
+            if self._deliver:
+                self._deliver(event)
+        except Exception as e:
+            self._dropped += 1
+            logger.error(f"Dropped timeline bus message: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        """Bus counters."""
+        return {
+            "backend": self.name,
+            "channel": self.channel,
+            "published": self._published,
+            "received": self._received,
+            "dropped": self._dropped,
+            "reconnects": self._reconnects,
+        }
+
+
+# ============================================
+# Factory
+# ============================================
+def default_bus_path() -> str:
+    """Unix socket path shared by the workers of one server.
+
+    Workers are children of the same uvicorn (or gunicorn) supervisor,
+    so its pid keeps independent servers on one host apart.
+    """
+    return str(Path(tempfile.gettempdir()) / f"trackwise-timeline-{os.getppid()}.sock")
+
+
+def create_timeline_bus() -> UnixSocketBus | RedisBus | None:
+    """Build the bus selected by TIMELINE_BUS (None for in-process).
+
+    Raises:
+        ValueError: On an unknown TIMELINE_BUS value
+    """
+    backend = settings.timeline_bus
+    if backend == "inprocess":
+        return None
+    if backend == "redis":
+        # Checked without importing redis; RedisBus.start imports it
+        if importlib.util.find_spec("redis") is not None:
+            return RedisBus(settings.redis_url)
+        logger.warning("redis package not installed, using the Unix-socket timeline bus")
+    elif backend != "unix":
+        raise ValueError(
+            f"Unknown TIMELINE_BUS: {backend!r} (expected inprocess, unix or redis)"
+        )
+    return UnixSocketBus(settings.timeline_bus_path or default_bus_path())
@@ -11,7 +11,7 @@ import logging
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from .websocket import timeline_manager
+from .websocket import FrameEncoding, TimelineEventType, timeline_manager
 
 
 # ============================================
@@ -31,8 +31,34 @@ async def websocket_timeline(websocket: WebSocket) -> None:
     """WebSocket endpoint for real-time timeline updates.
 
     Clients connect here to receive live agent events and run progress.
+    By default a client receives every event. Sending
+    ``subscribe:<field>=<value>`` (field: type, case_id, run_id, agent)
+    narrows delivery to matching events; filters are OR-ed together.
+    ``unsubscribe:<field>=<value>`` removes one, ``subscribe:*`` resets.
+
+    Every broadcast event carries a ``seq``; the welcome message reports
+    the server's ``stream_id`` and current ``seq``. After reconnecting, a
+    client sends ``resume:<stream_id>:<seq>`` (or ``resume:<seq>``) with
+    the last seq it saw and receives only the missed events, followed by
+    a ``resumed`` message. If the gap is no longer buffered it receives a
+    ``resync_required`` message and should refetch from the REST API.
+    Connecting with ``?resume=1`` holds live events until the ``resume``
+    arrives (for a few seconds at most), so the replayed events are never
+    overtaken by newer ones.
+
+    ``coalesce:<ms>[,<events>]`` opts into coalesced delivery: bursts
+    arrive as JSON array frames flushed every ``ms`` milliseconds or at
+    ``events`` events (single events are still sent bare);
+    ``coalesce:off`` restores one frame per event.
+
+    Frames are JSON text by default. Connecting with ``?encoding=msgpack``
+    switches to binary MessagePack frames when the server has msgpack
+    installed (the welcome message reports the encoding in effect).
+    permessage-deflate is negotiated by the server when the client offers it.
     """
-    await timeline_manager.connect(websocket)
+    encoding = websocket.query_params.get("encoding", FrameEncoding.JSON)
+    hold = websocket.query_params.get("resume") == "1"
+    await timeline_manager.connect(websocket, encoding, hold=hold)
 
     try:
         # Keep connection alive and handle incoming messages
@@ -43,10 +69,60 @@ async def websocket_timeline(websocket: WebSocket) -> None:
             if data == "ping":
                 await websocket.send_text("pong")
 
-            # Handle subscription filters (future feature)
-            elif data.startswith("subscribe:"):
-                filter_type = data.split(":", 1)[1] if ":" in data else ""
-                logger.info(f"Client subscribed to: {filter_type}")
+            # Handle subscription filters
+            elif data.startswith(("subscribe:", "unsubscribe:")):
+                command, spec = data.split(":", 1)
+                if command == "subscribe":
+                    applied = timeline_manager.subscribe(websocket, spec)
+                else:
+                    applied = timeline_manager.unsubscribe(websocket, spec)
+
+                timeline_manager.send(
+                    websocket,
+                    {
+                        "type": (
+                            TimelineEventType.SYSTEM_MESSAGE
+                            if applied
+                            else TimelineEventType.ERROR
+                        ),
+                        "message": f"{command}d: {spec}" if applied else f"Invalid filter: {spec}",
+                    },
+                )
+                logger.info(f"Client {command}: {spec} (applied={applied})")
+
+            # Handle frame coalescing negotiation
+            elif data.startswith("coalesce:"):
+                spec = data.split(":", 1)[1]
+                applied = timeline_manager.set_coalescing(websocket, spec)
+                timeline_manager.send(
+                    websocket,
+                    {
+                        "type": (
+                            TimelineEventType.SYSTEM_MESSAGE
+                            if applied
+                            else TimelineEventType.ERROR
+                        ),
+                        "message": (
+                            f"coalescing: {spec}" if applied else f"Invalid coalescing: {spec}"
+                        ),
+                    },
+                )
+
+            # Handle resume after reconnect
+            elif data.startswith("resume:"):
+                spec = data.split(":", 1)[1]
+                replayed = timeline_manager.resume(websocket, spec)
+                timeline_manager.send(
+                    websocket,
+                    {
+                        "type": TimelineEventType.SYSTEM_MESSAGE,
+                        "message": "resumed" if replayed is not None else "resync_required",
+                        "resync": replayed is None,
+                        "replayed": replayed or 0,
+                        "stream_id": timeline_manager.stream_id,
+                    },
+                )
+                logger.info(f"Client resume from {spec} (replayed={replayed})")
 
     except WebSocketDisconnect:
         timeline_manager.disconnect(websocket)
@@ -0,0 +1,242 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# UI Bridge - Streaming Spike Detection
+# ============================================
+#
+# The recurring detector looks at one case at a time; this
+# engine watches the stream. Every new complaint increments
+# a sliding-window counter for its (brand, product, lot,
+# category) key. The window is a ring of sub-buckets, and an
+# EWMA of the buckets leaving the window gives the key's
+# normal rate. When the window count crosses both an absolute
+# floor and a multiple of that baseline, a "pattern_matched"
+# alert goes out on /ws/timeline.
+#
+# Each event costs O(1): a dict lookup, at most one ring
+# pass of fixed size, and closed-form decay for idle gaps.
+# Keys live in an LRU dict capped at ``max_keys``.
+#
+# ============================================
+
+import logging
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from ..config import settings
+from ..simulator.models import CaseType, EventEnvelope, EventType
+from .websocket import TimelineEventType, timeline_manager
+
+
+# ============================================
+# Logger
+# ============================================
+logger = logging.getLogger("bridge.spikes")
+
+# Key fields, in alert order
+SPIKE_KEY_FIELDS = ("product_brand", "product_name", "lot_number", "category")
+
+SpikeKey = tuple[str, str, str, str]
+
+
+# ============================================
+# Windowed Counter
+# ============================================
+class WindowedCounter:
+    """Sliding-window count with an EWMA baseline for one key."""
+
+    __slots__ = ("alerting", "baseline", "bucket", "count", "ring")
+
+    def __init__(self, buckets: int, bucket: int) -> None:
+        """Initialize an empty counter.
+
+        Args:
+            buckets: Sub-buckets per window
+            bucket: Index of the current sub-bucket (time // width)
+        """
+        self.ring = [0] * buckets
+        self.bucket = bucket
+        self.count = 0
+        self.baseline = 0.0
+        self.alerting = False
+
+    def advance(self, bucket: int, alpha: float) -> None:
+        """Move the window forward to ``bucket``.
+
+        Each sub-bucket sliding out of the window folds into the
+        baseline (per-bucket EWMA), so the baseline only reflects
+        traffic older than the window and a burst never raises its
+        own threshold. Runs of empty buckets decay it in closed form.
+
+        Args:
+            bucket: Index of the sub-bucket now current
+            alpha: EWMA smoothing factor
+        """
+        steps = bucket - self.bucket
+        if steps <= 0:
+            return
+        size = len(self.ring)
+        for i in range(1, min(steps, size) + 1):
+            slot = (self.bucket + i) % size
+            expired = self.ring[slot]
+            self.baseline += alpha * (expired - self.baseline)
+            self.count -= expired
+            self.ring[slot] = 0
+        if steps > size:
+            self.baseline *= (1 - alpha) ** (steps - size)
+        self.bucket = bucket
+
+    def add(self) -> None:
+        """Count one event in the current sub-bucket."""
+        self.ring[self.bucket % len(self.ring)] += 1
+        self.count += 1
+
+
+# ============================================
+# Spike Detector
+# ============================================
+class SpikeDetector:
+    """Watches new complaints for per-key bursts."""
+
+    def __init__(
+        self,
+        publish: Callable[[dict[str, Any]], None],
+        window_seconds: float = 3600.0,
+        buckets: int = 12,
+        alpha: float = 0.1,
+        min_count: int = 5,
+        factor: float = 3.0,
+        max_keys: int = 10_000,
+    ) -> None:
+        """Initialize the detector.
+
+        Args:
+            publish: Broadcasts one timeline event
+            window_seconds: Sliding window length
+            buckets: Sub-buckets per window (window resolution)
+            alpha: EWMA smoothing factor for the per-bucket baseline
+            min_count: Window count an alert needs at minimum
+            factor: Window count must exceed ``factor`` times the
+                baseline expected over a window
+            max_keys: Keys tracked before the least recently seen
+                one is dropped
+        """
+        self._publish = publish
+        self.window_seconds = window_seconds
+        self.buckets = buckets
+        self.bucket_seconds = window_seconds / buckets
+        self.alpha = alpha
+        self.min_count = min_count
+        self.factor = factor
+        self.max_keys = max_keys
+        self._counters: dict[SpikeKey, WindowedCounter] = {}
+        self.events = 0
+        self.alerts = 0
+        self.evicted = 0
+
+    def on_event(self, envelope: EventEnvelope) -> None:
+        """Simulator event listener: count new complaints."""
+        if envelope.event_type != EventType.CASE_CREATED:
+            return
+        case = envelope.payload.get("case") or {}
+        if case.get("case_type") == CaseType.INQUIRY:
+            return
+        brand, product, lot, category = (str(case.get(f) or "-") for f in SPIKE_KEY_FIELDS)
+        self.observe(
+            (brand, product, lot, category),
+            envelope.timestamp,
+            case_id=envelope.payload.get("case_id"),
+        )
+
+    def observe(
+        self, key: SpikeKey, timestamp: datetime, case_id: str | None = None
+    ) -> dict[str, Any] | None:
+        """Count one event for a key and alert on a spike.
+
+        Args:
+            key: (brand, product, lot, category)
+            timestamp: Event time
+            case_id: Case that triggered the event
+
+        Returns:
+            The published alert, or None
+        """
+        self.events += 1
+        bucket = int(timestamp.timestamp() // self.bucket_seconds)
+
+        counter = self._counters.pop(key, None)
+        if counter is None:
+            counter = WindowedCounter(self.buckets, bucket)
+            if len(self._counters) >= self.max_keys:
+                del self._counters[next(iter(self._counters))]
+                self.evicted += 1
+        self._counters[key] = counter
+
+        counter.advance(bucket, self.alpha)
+        counter.add()
+
+        threshold = max(self.min_count, self.factor * counter.baseline * self.buckets)
+        if counter.count < threshold:
+            counter.alerting = False
+            return None
+        if counter.alerting:
+            return None
+        counter.alerting = True
+        self.alerts += 1
+        return self._alert(key, counter, threshold, case_id)
+
+    def _alert(
+        self, key: SpikeKey, counter: WindowedCounter, threshold: float, case_id: str | None
+    ) -> dict[str, Any]:
+        brand, product, lot, category = key
+        minutes = round(self.window_seconds / 60)
+        event = {
+            "type": TimelineEventType.PATTERN_MATCHED,
+            "case_id": case_id,
+            "message": (
+                f"Spike: {counter.count} {category} complaints for {brand} {product} "
+                f"lot {lot} in {minutes} min"
+            ),
+            "data": {
+                "kind": "spike",
+                "brand": brand,
+                "product": product,
+                "lot_number": lot,
+                "category": category,
+                "window_count": counter.count,
+                "window_seconds": self.window_seconds,
+                "baseline": round(counter.baseline * self.buckets, 3),
+                "threshold": round(threshold, 3),
+            },
+        }
+        logger.info(event["message"])
+        self._publish(event)
+        return event
+
+    def clear(self) -> None:
+        """Forget every key."""
+        self._counters.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Detector counters."""
+        return {
+            "keys": len(self._counters),
+            "events": self.events,
+            "alerts": self.alerts,
+            "evicted": self.evicted,
+        }
+
+
+# ============================================
+# Singleton Instance
+# ============================================
+spike_detector = SpikeDetector(
+    # Counts describe this worker's simulator, so alerts stay local
+    publish=timeline_manager.publish_local,
+    window_seconds=settings.spike_window_seconds,
+    buckets=settings.spike_window_buckets,
+    alpha=settings.spike_ewma_alpha,
+    min_count=settings.spike_min_count,
+    factor=settings.spike_factor,
+    max_keys=settings.spike_max_keys,
+)
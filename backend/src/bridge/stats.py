@@ -0,0 +1,154 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# UI Bridge - Live Stats Channel
+# ============================================
+#
+# Pushes dashboard counters over /ws/timeline instead of
+# having every open tab poll /api/stats. Mutations only mark
+# the stats dirty; at most once per interval the counters are
+# recomputed and the keys that changed are broadcast as a
+# "stats_delta" event. Server cost is one recompute per
+# interval, independent of the number of open dashboards.
+#
+# ============================================
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from ..config import settings
+from ..simulator.api import simulator_api
+from .websocket import TimelineEventType, timeline_manager
+
+
+# ============================================
+# Logger
+# ============================================
+logger = logging.getLogger("bridge.stats")
+
+
+# ============================================
+# Stats Publisher
+# ============================================
+class StatsPublisher:
+    """Throttled publisher of stats deltas."""
+
+    def __init__(
+        self,
+        snapshot: Callable[[], dict[str, dict[str, Any]]],
+        publish: Callable[[dict[str, Any]], None],
+        interval_seconds: float = 1.0,
+    ) -> None:
+        """Initialize the publisher.
+
+        Args:
+            snapshot: Returns the current counters grouped by section
+                (e.g. {"stats": {...}, "executive": {...}})
+            publish: Broadcasts one timeline event
+            interval_seconds: Minimum time between two pushes
+        """
+        self._snapshot = snapshot
+        self._publish = publish
+        self.interval_seconds = interval_seconds
+        self._last: dict[str, dict[str, Any]] = {}
+        self._version = 0
+        self._dirty: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the throttle loop on the running event loop."""
+        if self._task and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._dirty = asyncio.Event()
+        self._last = self._snapshot()
+        self._task = self._loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the throttle loop."""
+        task, self._task = self._task, None
+        if task:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._dirty = None
+        self._loop = None
+
+    def mark_dirty(self, *_: Any) -> None:
+        """Note that counters may have changed.
+
+        Cheap and thread-safe, so it can be registered directly as a
+        simulator event listener.
+        """
+        loop, dirty = self._loop, self._dirty
+        if loop is None or dirty is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            dirty.set()
+        else:
+            loop.call_soon_threadsafe(dirty.set)
+
+    async def _run(self) -> None:
+        """Push at most one delta per interval while mutations keep coming."""
+        dirty = self._dirty
+        assert dirty is not None
+        while True:
+            await dirty.wait()
+            dirty.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Stats push failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def flush(self) -> dict[str, Any] | None:
+        """Recompute the counters and publish the ones that changed.
+
+        Returns:
+            The published event, or None if nothing changed
+        """
+        current = self._snapshot()
+        delta = {
+            section: changed
+            for section, values in current.items()
+            if (changed := _changed(self._last.get(section, {}), values))
+        }
+        self._last = current
+        if not delta:
+            return None
+
+        self._version += 1
+        event = {
+            "type": TimelineEventType.STATS_DELTA,
+            "message": "stats",
+            "version": self._version,
+            "data": delta,
+        }
+        self._publish(event)
+        return event
+
+
+def _changed(before: dict[str, Any], after: dict[str, Any]) -> dict[str, Any]:
+    """Keys of ``after`` whose values differ from ``before`` (new values)."""
+    return {key: value for key, value in after.items() if before.get(key) != value}
+
+
+# ============================================
+# Singleton Instance
+# ============================================
+stats_publisher = StatsPublisher(
+    snapshot=lambda: {
+        "stats": simulator_api.get_stats(),
+        "executive": simulator_api.get_executive_stats(),
+    },
+    # Counters describe this worker's simulator, so they stay local
+    publish=timeline_manager.publish_local,
+    interval_seconds=settings.stats_push_interval_seconds,
+)
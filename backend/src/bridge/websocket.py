@@ -9,21 +9,31 @@
 # ============================================
 
 import asyncio
+import contextlib
 import json
 import logging
+import time
+import uuid
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from typing import Any
 
 from fastapi import WebSocket
 
+from ..config import settings
+from ..simulator.models import EventEnvelope, EventType
+
+
+try:
+    import msgpack
+except ImportError:  # optional: pip install galderma-trackwise-backend[msgpack]
+    msgpack = None
+
 
 # ============================================
 # Logger
 # ============================================
-logging.basicConfig(
-    level=logging.INFO,
-    format='{"timestamp": "%(asctime)s", "service": "websocket", "level": "%(levelname)s", "message": "%(message)s"}',
-)
 logger = logging.getLogger("websocket")
 
 
@@ -61,90 +71,851 @@ class TimelineEventType:
     HUMAN_REVIEW_REQUESTED = "human_review_requested"
     HUMAN_FEEDBACK_RECEIVED = "human_feedback_received"
 
+    # Dashboard counters (changed keys only)
+    STATS_DELTA = "stats_delta"
+
+    # CSV pack job steps
+    CSV_PACK_PROGRESS = "csv_pack_progress"
+
     # System events
     SYSTEM_MESSAGE = "system_message"
     ERROR = "error"
 
 
+# Simulator event types mapped to timeline event types
+SIMULATOR_EVENT_MAP = {
+    EventType.CASE_CREATED: TimelineEventType.CASE_CREATED,
+    EventType.CASE_UPDATED: TimelineEventType.CASE_UPDATED,
+    EventType.CASE_CLOSED: TimelineEventType.CASE_CLOSED,
+    EventType.FACTORY_COMPLAINT_CLOSED: TimelineEventType.CASE_CLOSED,
+}
+
+
+def timeline_event_from_envelope(envelope: EventEnvelope) -> dict[str, Any]:
+    """Convert a simulator EventEnvelope into a timeline event.
+
+    Args:
+        envelope: Event emitted by the TrackWise simulator
+
+    Returns:
+        Timeline event dict for the frontend
+    """
+    payload = envelope.payload
+    return {
+        "type": SIMULATOR_EVENT_MAP.get(envelope.event_type, TimelineEventType.SYSTEM_MESSAGE),
+        "event_id": envelope.event_id,
+        "case_id": payload.get("case_id"),
+        "message": envelope.event_type.value,
+        "data": payload,
+        "timestamp": envelope.timestamp.isoformat(),
+    }
+
+
+def encode_event(event: dict[str, Any]) -> str:
+    """Stamp (if needed) and encode a timeline event exactly once.
+
+    The returned text is shared by every connection's send queue.
+
+    Args:
+        event: Timeline event dict
+
+    Returns:
+        JSON text frame
+    """
+    if "timestamp" not in event:
+        event["timestamp"] = datetime.utcnow().isoformat()
+    return json.dumps(event)
+
+
+# ============================================
+# Frame Encodings
+# ============================================
+class FrameEncoding:
+    """Wire encodings a client can request (``?encoding=`` on connect)."""
+
+    JSON = "json"  # text frames (default)
+    MSGPACK = "msgpack"  # binary frames, requires the msgpack package
+
+
+def supported_encodings() -> list[str]:
+    """Encodings available in this process."""
+    if msgpack is None:
+        return [FrameEncoding.JSON]
+    return [FrameEncoding.JSON, FrameEncoding.MSGPACK]
+
+
+def encode_frame(event: dict[str, Any], encoding: str = FrameEncoding.JSON) -> str | bytes:
+    """Encode a timeline event for one wire encoding.
+
+    Args:
+        event: Timeline event dict
+        encoding: FrameEncoding value
+
+    Returns:
+        JSON text or MessagePack bytes
+    """
+    if encoding == FrameEncoding.MSGPACK:
+        if "timestamp" not in event:
+            event["timestamp"] = datetime.utcnow().isoformat()
+        return msgpack.packb(event)
+    return encode_event(event)
+
+
+def join_frames(payloads: list[Any], encoding: str = FrameEncoding.JSON) -> str | bytes:
+    """Pack already-encoded payloads into one array frame.
+
+    Neither encoding needs re-serialization: a JSON array is the payloads
+    joined by commas, a MessagePack array is a header plus the payloads.
+    """
+    if encoding == FrameEncoding.MSGPACK:
+        return msgpack.Packer().pack_array_header(len(payloads)) + b"".join(payloads)
+    return "[" + ",".join(payloads) + "]"
+
+
+# ============================================
+# Subscriptions
+# ============================================
+# Event fields a client can filter on ("subscribe:<field>=<value>")
+SUBSCRIPTION_FIELDS = ("type", "case_id", "run_id", "agent")
+
+# Event types every client receives regardless of its filters
+UNFILTERED_EVENT_TYPES = {TimelineEventType.SYSTEM_MESSAGE, TimelineEventType.ERROR}
+
+
+def parse_subscription(spec: str) -> tuple[str, str] | None:
+    """Parse a ``<field>=<value>`` subscription filter.
+
+    Args:
+        spec: Filter text sent after ``subscribe:``/``unsubscribe:``
+
+    Returns:
+        (field, value) tuple, or None if the filter is invalid
+    """
+    field, sep, value = spec.partition("=")
+    field, value = field.strip(), value.strip()
+    if not sep or field not in SUBSCRIPTION_FIELDS or not value:
+        return None
+    return field, value
+
+
+def parse_resume(spec: str) -> tuple[str | None, int] | None:
+    """Parse a ``[<stream_id>:]<seq>`` resume request.
+
+    Args:
+        spec: Text sent after ``resume:``
+
+    Returns:
+        (stream_id or None, last seen seq) tuple, or None if invalid
+    """
+    stream_id, _, seq = spec.strip().rpartition(":")
+    try:
+        last_seq = int(seq)
+    except ValueError:
+        return None
+    if last_seq < 0:
+        return None
+    return stream_id or None, last_seq
+
+
+def parse_coalesce(spec: str, max_events: int) -> tuple[float, int] | None:
+    """Parse a ``<ms>[,<events>]`` coalescing request.
+
+    Args:
+        spec: Text sent after ``coalesce:``; ``off`` or ``0`` disables
+        max_events: Server cap on events per frame
+
+    Returns:
+        (flush interval in seconds, events per frame) tuple, with an
+        interval of 0 meaning disabled, or None if invalid
+    """
+    spec = spec.strip()
+    if spec in ("off", "0"):
+        return 0.0, 1
+    interval, _, events = spec.partition(",")
+    try:
+        interval_ms = float(interval)
+        batch = int(events) if events else max_events
+    except ValueError:
+        return None
+    if not 0 < interval_ms <= 1000 or batch < 1:
+        return None
+    return interval_ms / 1000, min(batch, max_events)
+
+
+# ============================================
+# Per-Connection State
+# ============================================
+class SlowConsumerPolicy:
+    """What to do when a client's send queue is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DISCONNECT = "disconnect"
+
+
+class TimelineConnection:
+    """One connected client: its socket, outbound queue and writer task."""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        send_queue_size: int,
+        encoding: str = FrameEncoding.JSON,
+    ) -> None:
+        """Initialize the connection state.
+
+        Args:
+            websocket: Accepted WebSocket
+            send_queue_size: Maximum frames buffered for this client
+            encoding: Negotiated FrameEncoding
+        """
+        self.websocket = websocket
+        self.encoding = encoding
+        self.queue: asyncio.Queue[str | bytes] = asyncio.Queue(maxsize=send_queue_size)
+        self.writer: asyncio.Task | None = None
+        self.dropped = 0
+        self.filters: set[tuple[str, str]] = set()
+        # Last seq broadcast before this client joined; anything newer
+        # was delivered live, so a resume never replays past it
+        self.joined_at_seq = 0
+        # A client that will resume can ask to have live events held
+        # until then, so the replay is never overtaken by newer events.
+        # Held events stay in the replay ring and are queued on release.
+        self.held = False
+        # Ends the hold if the resume never comes
+        self.hold_timer: asyncio.TimerHandle | None = None
+        # Set when the hold ended before the resume (too many held
+        # events, or the hold timed out); a late resume would arrive
+        # out of order
+        self.released_early = False
+        # Frame coalescing (negotiated per client, off by default)
+        self.coalesce_interval = 0.0
+        self.coalesce_max_events = 1
+
+
 # ============================================
 # WebSocket Manager
 # ============================================
 class WebSocketManager:
-    """Manages WebSocket connections and broadcasts events."""
+    """Manages WebSocket connections and broadcasts events.
+
+    Producers call ``publish`` (O(1), never awaits a socket). A single
+    background broadcaster task drains the event queue and hands each
+    event to every connection's bounded send queue; a writer task per
+    connection performs the actual socket writes, so one stalled browser
+    never delays the others.
+
+    Every broadcast event carries a monotonically increasing ``seq`` and
+    is kept in a bounded replay ring, so a reconnecting client can ask
+    for just the events it missed (``resume``). Clients that opt into
+    coalescing receive bursts as array frames instead of one frame per
+    event. With several workers, ``attach_bus`` routes published events
+    through a cross-process bus so every worker's broadcaster sees every
+    event once.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10_000,
+        send_queue_size: int = 256,
+        slow_consumer_policy: str = SlowConsumerPolicy.DROP_OLDEST,
+        replay_buffer_size: int = 1000,
+        coalesce_max_events: int = 200,
+        resume_hold_seconds: float = 5.0,
+    ) -> None:
+        """Initialize the WebSocket manager.
 
-    def __init__(self) -> None:
-        """Initialize the WebSocket manager."""
-        self._connections: list[WebSocket] = []
-        self._event_queue: asyncio.Queue[dict] = asyncio.Queue()
+        Args:
+            max_queue_size: Pending events kept before the oldest is dropped
+            send_queue_size: Per-connection outbound frame limit
+            slow_consumer_policy: "drop_oldest" or "disconnect" when a
+                connection's send queue is full
+            replay_buffer_size: Broadcast events kept for resuming clients
+            coalesce_max_events: Upper bound on events per coalesced frame
+            resume_hold_seconds: Longest a ``hold`` connection waits for
+                its resume before live events flow anyway
+        """
+        self._connections: dict[WebSocket, TimelineConnection] = {}
+        # Routing index: connections without filters get the firehose,
+        # filtered connections are reachable only via their (field, value)
+        self._firehose: set[TimelineConnection] = set()
+        self._routes: dict[tuple[str, str], set[TimelineConnection]] = {}
+        self._max_queue_size = max_queue_size
+        self._send_queue_size = send_queue_size
+        self._slow_consumer_policy = slow_consumer_policy
+        self._event_queue: asyncio.Queue[dict] | None = None
+        self._enqueued_at: deque[float] = deque()
         self._broadcast_task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._dropped_events = 0
+        self._evicted_connections = 0
+        # Closes of evicted sockets run in the background; referenced
+        # here until done so they are not garbage-collected mid-flight
+        self._close_tasks: set[asyncio.Task] = set()
+        # Sequence numbers restart with the process; the stream id lets a
+        # client tell a restarted server from one it can resume against
+        self.stream_id = uuid.uuid4().hex[:12]
+        self._seq = 0
+        self._replay: deque[tuple[int, dict[str, Any], dict[str, str | bytes]]] = deque(
+            maxlen=replay_buffer_size
+        )
+        self._replayed_events = 0
+        self._resyncs = 0
+        self._coalesce_max_events = coalesce_max_events
+        self._resume_hold_seconds = resume_hold_seconds
+        self._frames_sent = 0
+        self._frames_saved = 0
+        self._started_at = time.monotonic()
+        self._bus: Any = None
+
+    # ============================================
+    # Broadcast Pipeline
+    # ============================================
+    def start(self) -> None:
+        """Start the background broadcaster on the running event loop."""
+        if self._broadcast_task and not self._broadcast_task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._event_queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._enqueued_at.clear()
+        self._started_at = time.monotonic()
+        self._broadcast_task = self._loop.create_task(self._broadcast_loop())
+        logger.info("Timeline broadcaster started")
+
+    async def attach_bus(self, bus: Any) -> None:
+        """Route published events through a cross-process bus.
+
+        Args:
+            bus: UnixSocketBus or RedisBus (see bridge.pubsub); events it
+                receives from any worker are queued for local broadcast
+        """
+        await bus.start(self._enqueue)
+        self._bus = bus
 
-    async def connect(self, websocket: WebSocket) -> None:
+    async def stop(self) -> None:
+        """Stop the background broadcaster and leave the bus."""
+        bus, self._bus = self._bus, None
+        if bus:
+            await bus.stop()
+        task, self._broadcast_task = self._broadcast_task, None
+        if task:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._event_queue = None
+        self._loop = None
+        logger.info("Timeline broadcaster stopped")
+
+    def publish(self, event: dict[str, Any]) -> None:
+        """Queue an event for broadcast without waiting on any socket.
+
+        Safe to call from the event loop or from worker threads. With a bus
+        attached the event reaches the clients of every worker.
+
+        Args:
+            event: Event data to broadcast
+        """
+        self._publish(event, self._bus.publish if self._bus else self._enqueue)
+
+    def publish_local(self, event: dict[str, Any]) -> None:
+        """Queue an event for this worker's clients only (bypasses the bus).
+
+        Args:
+            event: Event data to broadcast
+        """
+        self._publish(event, self._enqueue)
+
+    def _publish(self, event: dict[str, Any], target: Any) -> None:
+        """Stamp an event and hand it to ``target`` on the event loop."""
+        loop = self._loop
+        if loop is None or self._event_queue is None:
+            return
+        if "timestamp" not in event:
+            event["timestamp"] = datetime.utcnow().isoformat()
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            target(event)
+        else:
+            loop.call_soon_threadsafe(target, event)
+
+    def publish_envelope(self, envelope: EventEnvelope) -> None:
+        """Publish a simulator event to the timeline.
+
+        Args:
+            envelope: Event emitted by the TrackWise simulator
+        """
+        self.publish(timeline_event_from_envelope(envelope))
+
+    def _enqueue(self, event: dict[str, Any]) -> None:
+        """Put an event on the queue, dropping the oldest when full."""
+        queue = self._event_queue
+        if queue is None:
+            return
+        if queue.full():
+            queue.get_nowait()
+            self._enqueued_at.popleft()
+            self._dropped_events += 1
+        queue.put_nowait(event)
+        self._enqueued_at.append(time.monotonic())
+
+    async def _broadcast_loop(self) -> None:
+        """Drain the event queue and fan out each event."""
+        queue = self._event_queue
+        assert queue is not None
+        while True:
+            event = await queue.get()
+            self._enqueued_at.popleft()
+            try:
+                await self.broadcast(event)
+            except Exception as e:
+                logger.error(f"Broadcast failed: {e}")
+
+    def pending_count(self) -> int:
+        """Number of events waiting for the broadcaster."""
+        return len(self._enqueued_at)
+
+    def lag_seconds(self) -> float:
+        """Age of the oldest event waiting for the broadcaster."""
+        if not self._enqueued_at:
+            return 0.0
+        return time.monotonic() - self._enqueued_at[0]
+
+    # ============================================
+    # Connections
+    # ============================================
+    async def connect(
+        self, websocket: WebSocket, encoding: str = FrameEncoding.JSON, hold: bool = False
+    ) -> None:
         """Accept a new WebSocket connection.
 
         Args:
             websocket: WebSocket connection to add
+            encoding: Requested FrameEncoding; unsupported values fall
+                back to JSON (the welcome message reports the result)
+            hold: Hold live events until the client's ``resume`` so the
+                replay reaches it first (at most ``resume_hold_seconds``)
         """
         await websocket.accept()
-        self._connections.append(websocket)
+        if encoding not in supported_encodings():
+            encoding = FrameEncoding.JSON
+        connection = TimelineConnection(websocket, self._send_queue_size, encoding)
+        connection.joined_at_seq = self._seq
+        connection.held = hold
+        if hold:
+            connection.hold_timer = asyncio.get_running_loop().call_later(
+                self._resume_hold_seconds, self._end_hold, connection
+            )
+        connection.writer = asyncio.create_task(self._writer_loop(connection))
+        self._connections[websocket] = connection
+        self._firehose.add(connection)
         logger.info(f"WebSocket connected. Total connections: {len(self._connections)}")
 
         # Send welcome message
-        await self._send_to_socket(
+        self.send(
             websocket,
             {
                 "type": TimelineEventType.SYSTEM_MESSAGE,
                 "message": "Connected to TrackWise Timeline",
-                "timestamp": datetime.utcnow().isoformat(),
+                "stream_id": self.stream_id,
+                "seq": self._seq,
+                "encoding": encoding,
             },
         )
 
     def disconnect(self, websocket: WebSocket) -> None:
-        """Remove a WebSocket connection.
+        """Remove a WebSocket connection and stop its writer.
 
         Args:
             websocket: WebSocket connection to remove
         """
-        if websocket in self._connections:
-            self._connections.remove(websocket)
-            logger.info(f"WebSocket disconnected. Total connections: {len(self._connections)}")
+        connection = self._connections.pop(websocket, None)
+        if connection is None:
+            return
+        self._firehose.discard(connection)
+        for key in connection.filters:
+            self._unroute(key, connection)
+        if connection.hold_timer:
+            connection.hold_timer.cancel()
+        writer = connection.writer
+        if writer and writer is not asyncio.current_task():
+            writer.cancel()
+        logger.info(f"WebSocket disconnected. Total connections: {len(self._connections)}")
 
     async def broadcast(self, event: dict[str, Any]) -> None:
         """Broadcast an event to all connected clients.
 
+        Called by the broadcaster task; producers should use ``publish``.
+        The event is encoded once per wire encoding in use and the same
+        payload is queued on every matching connection's send queue; no
+        socket is awaited here.
+
         Args:
             event: Event data to broadcast
         """
-        # Add timestamp if not present
-        if "timestamp" not in event:
-            event["timestamp"] = datetime.utcnow().isoformat()
+        self._seq += 1
+        event["seq"] = self._seq
+        frames: dict[str, str | bytes] = {FrameEncoding.JSON: encode_event(event)}
+        self._replay.append((self._seq, event, frames))
+        for connection in self._recipients(event):
+            if not connection.held:
+                self._offer(connection, self._frame_for(connection, event, frames))
+            elif self._seq - connection.joined_at_seq > connection.queue.maxsize // 2:
+                # Held too many events for the resume: deliver live from here on
+                self._end_hold(connection)
 
-        # Send to all connected clients
-        disconnected = []
-        for websocket in self._connections:
-            try:
-                await self._send_to_socket(websocket, event)
-            except Exception as e:
-                logger.warning(f"Failed to send to websocket: {e}")
-                disconnected.append(websocket)
+    def _frame_for(
+        self,
+        connection: TimelineConnection,
+        event: dict[str, Any],
+        frames: dict[str, str | bytes],
+    ) -> str | bytes:
+        """Payload of an event in a connection's encoding, encoding lazily."""
+        payload = frames.get(connection.encoding)
+        if payload is None:
+            payload = frames[connection.encoding] = encode_frame(event, connection.encoding)
+        return payload
+
+    def _recipients(self, event: dict[str, Any]) -> list[TimelineConnection]:
+        """Connections interested in an event, via the routing index.
+
+        Only the firehose set and the index buckets matching the event's
+        fields are touched, never the full connection list.
+        """
+        if event.get("type") in UNFILTERED_EVENT_TYPES:
+            return list(self._connections.values())
+
+        recipients = set(self._firehose)
+        for field in SUBSCRIPTION_FIELDS:
+            value = event.get(field)
+            if value is None:
+                continue
+            subscribers = self._routes.get((field, str(value)))
+            if subscribers:
+                recipients |= subscribers
+        return list(recipients)
+
+    def _wants(self, connection: TimelineConnection, event: dict[str, Any]) -> bool:
+        """Whether a connection's filters accept an event."""
+        if not connection.filters or event.get("type") in UNFILTERED_EVENT_TYPES:
+            return True
+        return any(
+            (field, str(event[field])) in connection.filters
+            for field in SUBSCRIPTION_FIELDS
+            if event.get(field) is not None
+        )
+
+    # ============================================
+    # Resume / Replay
+    # ============================================
+    def resume(self, websocket: WebSocket, spec: str) -> int | None:
+        """Replay the events a reconnecting client missed.
+
+        Only events the client's current filters accept are replayed, and
+        only those broadcast before it connected (later ones are delivered
+        live). A connection that connected with ``hold`` is released right
+        after the replay, so the client sees seq numbers in order; without
+        a hold, live frames may already be on their way ahead of it.
+
+        Args:
+            websocket: Reconnected client
+            spec: ``[<stream_id>:]<seq>`` of the last event it received
+
+        Returns:
+            Number of events replayed, or None if the gap cannot be
+            replayed and the client must resync from the REST API
+        """
+        connection = self._connections.get(websocket)
+        if connection is None:
+            return None
+        replayed = self._replay_missed(connection, spec)
+        if connection.held and not self._release(connection):
+            # Held events fell out of the ring before the resume came
+            replayed = None
+        if replayed is None:
+            self._resyncs += 1
+        else:
+            self._replayed_events += replayed
+        return replayed
+
+    def _replay_missed(self, connection: TimelineConnection, spec: str) -> int | None:
+        """Queue the frames between a resume point and the join, in order."""
+        parsed = parse_resume(spec)
+        if parsed is None or connection.released_early:
+            return None
+
+        stream_id, last_seq = parsed
+        until = connection.joined_at_seq
+        if (stream_id and stream_id != self.stream_id) or last_seq > until:
+            # Restarted server or a seq from the future
+            return None
+        if last_seq == until:
+            return 0
+
+        oldest = self._replay[0][0] if self._replay else self._seq + 1
+        if last_seq + 1 < oldest:
+            # Part of the gap has already fallen out of the ring
+            return None
+
+        missed = [
+            self._frame_for(connection, event, frames)
+            for seq, event, frames in islice(self._replay, last_seq + 1 - oldest, None)
+            if seq <= until and self._wants(connection, event)
+        ]
+        if len(missed) > connection.queue.maxsize - connection.queue.qsize():
+            # Replaying would overflow the send queue and drop frames anyway
+            return None
+
+        for payload in missed:
+            self._offer(connection, payload)
+        return len(missed)
 
-        # Remove disconnected clients
-        for ws in disconnected:
-            self.disconnect(ws)
+    def _end_hold(self, connection: TimelineConnection) -> None:
+        """Release a held connection whose resume did not come in time."""
+        if connection.held and self._connections.get(connection.websocket) is connection:
+            connection.released_early = True
+            self._release(connection)
 
-    async def _send_to_socket(self, websocket: WebSocket, data: dict) -> None:
-        """Send data to a specific WebSocket.
+    def _release(self, connection: TimelineConnection) -> bool:
+        """End a hold, queueing the live events broadcast during it.
+
+        Returns:
+            False if some held events already fell out of the replay ring
+        """
+        connection.held = False
+        if connection.hold_timer:
+            connection.hold_timer.cancel()
+            connection.hold_timer = None
+        first = connection.joined_at_seq + 1
+        if first > self._seq:
+            return True
+        oldest = self._replay[0][0] if self._replay else first
+        for _, event, frames in islice(self._replay, max(first - oldest, 0), None):
+            if self._wants(connection, event):
+                self._offer(connection, self._frame_for(connection, event, frames))
+        return oldest <= first
+
+    # ============================================
+    # Subscription Filters
+    # ============================================
+    def subscribe(self, websocket: WebSocket, spec: str) -> bool:
+        """Add a filter for a client; ``*`` restores the firehose.
+
+        Args:
+            websocket: Subscribing client
+            spec: ``<field>=<value>`` or ``*``
+
+        Returns:
+            True if the filter was applied
+        """
+        connection = self._connections.get(websocket)
+        if connection is None:
+            return False
+
+        if spec.strip() == "*":
+            for route in connection.filters:
+                self._unroute(route, connection)
+            connection.filters.clear()
+            self._firehose.add(connection)
+            return True
+
+        key = parse_subscription(spec)
+        if key is None:
+            return False
+        connection.filters.add(key)
+        self._routes.setdefault(key, set()).add(connection)
+        self._firehose.discard(connection)
+        return True
+
+    def unsubscribe(self, websocket: WebSocket, spec: str) -> bool:
+        """Remove a filter; a client left without filters gets the firehose.
+
+        Args:
+            websocket: Client to update
+            spec: ``<field>=<value>`` filter previously subscribed
+
+        Returns:
+            True if the filter was removed
+        """
+        connection = self._connections.get(websocket)
+        key = parse_subscription(spec)
+        if connection is None or key is None or key not in connection.filters:
+            return False
+        connection.filters.discard(key)
+        self._unroute(key, connection)
+        if not connection.filters:
+            self._firehose.add(connection)
+        return True
+
+    def _unroute(self, key: tuple[str, str], connection: TimelineConnection) -> None:
+        """Drop a connection from one routing index bucket."""
+        subscribers = self._routes.get(key)
+        if subscribers is None:
+            return
+        subscribers.discard(connection)
+        if not subscribers:
+            del self._routes[key]
+
+    # ============================================
+    # Frame Coalescing
+    # ============================================
+    def set_coalescing(self, websocket: WebSocket, spec: str) -> bool:
+        """Enable or disable array frames for one client.
+
+        Args:
+            websocket: Client to update
+            spec: ``<ms>[,<events>]`` or ``off``
+
+        Returns:
+            True if the setting was applied
+        """
+        connection = self._connections.get(websocket)
+        parsed = parse_coalesce(spec, self._coalesce_max_events)
+        if connection is None or parsed is None:
+            return False
+        connection.coalesce_interval, connection.coalesce_max_events = parsed
+        return True
+
+    async def _next_frame(self, connection: TimelineConnection) -> tuple[str | bytes, int]:
+        """Wait for the next frame to write to a client.
+
+        Without coalescing every payload is its own frame. With coalescing
+        the writer keeps collecting payloads until the flush interval
+        elapses or the batch is full, then joins them into one array frame
+        (payloads are already encoded, so no re-serialization happens).
+
+        Returns:
+            (frame text, number of events in it)
+        """
+        queue = connection.queue
+        payload = await queue.get()
+        if not connection.coalesce_interval:
+            return payload, 1
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + connection.coalesce_interval
+        batch = [payload]
+        while len(batch) < connection.coalesce_max_events:
+            if queue.empty():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except TimeoutError:
+                    break
+            else:
+                batch.append(queue.get_nowait())
+
+        if len(batch) == 1:
+            return payload, 1
+        return join_frames(batch, connection.encoding), len(batch)
+
+    def send(self, websocket: WebSocket, event: dict[str, Any]) -> None:
+        """Queue an event for a single client (e.g. acknowledgements).
+
+        Args:
+            websocket: Target client
+            event: Event data to send
+        """
+        connection = self._connections.get(websocket)
+        if connection is not None:
+            self._offer(connection, encode_frame(event, connection.encoding))
+
+    def _offer(self, connection: TimelineConnection, payload: str | bytes) -> None:
+        """Queue a frame for one client, applying the slow-consumer policy.
+
+        Args:
+            connection: Target connection
+            payload: Encoded frame to send
+        """
+        queue = connection.queue
+        if queue.full():
+            if self._slow_consumer_policy == SlowConsumerPolicy.DISCONNECT:
+                self._evict(connection)
+                return
+            queue.get_nowait()
+            connection.dropped += 1
+        queue.put_nowait(payload)
+
+    def _evict(self, connection: TimelineConnection) -> None:
+        """Disconnect a client that cannot keep up."""
+        self._evicted_connections += 1
+        logger.warning("Evicting slow WebSocket consumer")
+        self.disconnect(connection.websocket)
+        task = asyncio.create_task(self._close_quietly(connection.websocket))
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+
+    async def _close_quietly(self, websocket: WebSocket) -> None:
+        """Close a socket, ignoring errors from already-closed clients."""
+        with contextlib.suppress(Exception):
+            await websocket.close(code=1013)
+
+    async def _writer_loop(self, connection: TimelineConnection) -> None:
+        """Write queued frames to one client until it fails or disconnects."""
+        try:
+            while True:
+                frame, events = await self._next_frame(connection)
+                await self._send_to_socket(connection.websocket, frame)
+                self._frames_sent += 1
+                self._frames_saved += events - 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to send to websocket: {e}")
+            self.disconnect(connection.websocket)
+
+    async def _send_to_socket(self, websocket: WebSocket, payload: str | bytes) -> None:
+        """Send an encoded frame to a specific WebSocket.
 
         Args:
             websocket: Target WebSocket
-            data: Data to send
+            payload: Pre-encoded JSON text or MessagePack bytes
         """
-        await websocket.send_text(json.dumps(data))
+        if isinstance(payload, bytes):
+            await websocket.send_bytes(payload)
+        else:
+            await websocket.send_text(payload)
 
     @property
     def connection_count(self) -> int:
         """Get the number of active connections."""
         return len(self._connections)
 
+    def stats(self) -> dict[str, Any]:
+        """Broadcast pipeline counters."""
+        return {
+            "connections": len(self._connections),
+            "pending_events": self.pending_count(),
+            "dropped_events": self._dropped_events,
+            "dropped_frames": sum(c.dropped for c in self._connections.values()),
+            "evicted_connections": self._evicted_connections,
+            "firehose_connections": len(self._firehose),
+            "subscription_routes": len(self._routes),
+            "slow_consumer_policy": self._slow_consumer_policy,
+            "stream_id": self.stream_id,
+            "seq": self._seq,
+            "replay_buffered": len(self._replay),
+            "replayed_events": self._replayed_events,
+            "resyncs": self._resyncs,
+            "coalescing_connections": sum(
+                1 for c in self._connections.values() if c.coalesce_interval
+            ),
+            "msgpack_connections": sum(
+                1 for c in self._connections.values() if c.encoding == FrameEncoding.MSGPACK
+            ),
+            "frames_sent": self._frames_sent,
+            "frames_saved": self._frames_saved,
+            "frames_saved_per_second": round(
+                self._frames_saved / max(time.monotonic() - self._started_at, 1e-9), 2
+            ),
+            "bus": self._bus.stats() if self._bus else {"backend": "inprocess"},
+        }
+
     # ============================================
     # Timeline Event Helpers
     # ============================================
@@ -161,7 +932,7 @@ class WebSocketManager:
             case_id: Associated case ID
             trigger: Event that triggered the run
         """
-        await self.broadcast(
+        self.publish(
             {
                 "type": TimelineEventType.RUN_STARTED,
                 "run_id": run_id,
@@ -185,7 +956,7 @@ class WebSocketManager:
             result: Run result (AUTO_CLOSED, HUMAN_REVIEW, etc.)
             duration_ms: Run duration in milliseconds
         """
-        await self.broadcast(
+        self.publish(
             {
                 "type": TimelineEventType.RUN_COMPLETED,
                 "run_id": run_id,
@@ -208,7 +979,7 @@ class WebSocketManager:
             agent: Agent name
             input_preview: Preview of input (truncated)
         """
-        await self.broadcast(
+        self.publish(
             {
                 "type": TimelineEventType.AGENT_INVOKED,
                 "run_id": run_id,
@@ -232,7 +1003,7 @@ class WebSocketManager:
             output_preview: Preview of output (truncated)
             latency_ms: Agent latency in milliseconds
         """
-        await self.broadcast(
+        self.publish(
             {
                 "type": TimelineEventType.AGENT_COMPLETED,
                 "run_id": run_id,
@@ -257,7 +1028,7 @@ class WebSocketManager:
             tool: Tool name
             args_preview: Preview of arguments
         """
-        await self.broadcast(
+        self.publish(
             {
                 "type": TimelineEventType.TOOL_CALLED,
                 "run_id": run_id,
@@ -282,7 +1053,7 @@ class WebSocketManager:
             similarity: Similarity score
             recommendation: Recommended action
         """
-        await self.broadcast(
+        self.publish(
             {
                 "type": TimelineEventType.PATTERN_MATCHED,
                 "run_id": run_id,
@@ -307,7 +1078,7 @@ class WebSocketManager:
             reason: Reason for review
             agent: Agent that requested review
         """
-        await self.broadcast(
+        self.publish(
             {
                 "type": TimelineEventType.HUMAN_REVIEW_REQUESTED,
                 "run_id": run_id,
@@ -332,7 +1103,7 @@ class WebSocketManager:
             auto_closed: Whether it was auto-closed
             latency_ms: Total processing time
         """
-        await self.broadcast(
+        self.publish(
             {
                 "type": TimelineEventType.CASE_CLOSED,
                 "run_id": run_id,
@@ -346,4 +1117,11 @@ class WebSocketManager:
 # ============================================
 # Singleton Instance
 # ============================================
-timeline_manager = WebSocketManager()
+timeline_manager = WebSocketManager(
+    max_queue_size=settings.timeline_queue_size,
+    send_queue_size=settings.timeline_send_queue_size,
+    slow_consumer_policy=settings.timeline_slow_consumer_policy,
+    replay_buffer_size=settings.timeline_replay_buffer_size,
+    coalesce_max_events=settings.timeline_coalesce_max_events,
+    resume_hold_seconds=settings.timeline_resume_hold_seconds,
+)
@@ -34,6 +34,46 @@ class Settings(BaseSettings):
     # Server settings
     host: str = "0.0.0.0"
     port: int = 8080
+    ws_per_message_deflate: bool = True  # negotiate permessage-deflate
+
+    # Admission control (backpressure on new work)
+    admission_enabled: bool = True
+    admission_mode: str = "reject"  # "reject" (429) or "delay"
+    admission_max_queue_depth: int = 500
+    admission_max_lag_seconds: float = 5.0
+    admission_max_delay_seconds: float = 2.0
+    admission_read_rate: float = 200.0  # UI reads per second
+    admission_read_burst: int = 400
+    admission_write_rate: float = 50.0  # case/agent writes per second
+    admission_write_burst: int = 100
+
+    # /invocations batch form
+    invocation_max_batch: int = 100  # actions per request
+
+    # Timeline WebSocket fan-out
+    timeline_queue_size: int = 10_000  # events waiting for the broadcaster
+    timeline_send_queue_size: int = 256  # frames buffered per connection
+    timeline_slow_consumer_policy: str = "drop_oldest"  # or "disconnect"
+    timeline_replay_buffer_size: int = 1000  # broadcast events kept for resume
+    timeline_coalesce_max_events: int = 200  # cap on events per coalesced frame
+    timeline_resume_hold_seconds: float = 5.0  # longest live-event hold awaiting a resume
+    stats_push_interval_seconds: float = 1.0  # throttle for stats_delta pushes
+
+    # Cross-worker timeline bus: "inprocess" (single worker), "unix" or "redis"
+    timeline_bus: str = "inprocess"
+    timeline_bus_path: str | None = None  # unix socket; default derived per server
+    redis_url: str = "redis://localhost:6379/0"
+
+    # Ledger verification
+    ledger_verify_workers: int = 0  # process pool size for full checks (0 = CPU count)
+
+    # Spike detection (per brand/product/lot/category bursts)
+    spike_window_seconds: float = 3600.0
+    spike_window_buckets: int = 12  # window resolution
+    spike_ewma_alpha: float = 0.1  # baseline smoothing per bucket
+    spike_min_count: int = 5  # window count an alert needs at minimum
+    spike_factor: float = 3.0  # window count vs. baseline expected over a window
+    spike_max_keys: int = 10_000  # least recently seen keys dropped beyond this
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,251 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# TrackWise Simulator - Invocation Dispatch
+# ============================================
+#
+# AgentCore reaches the simulator through POST /invocations.
+# Each action is a handler registered under its name; a
+# request carries either one ``action`` or an ``actions``
+# list that runs in order, so an agent's whole writeback
+# (get -> update -> close) costs one runtime round-trip.
+#
+# Batch items succeed or fail on their own unless the batch
+# is ``atomic``: then every item must be a transactional
+# action and the first failure rolls back the simulator
+# changes of the items before it.
+#
+# ============================================
+
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .admission import READ, WRITE
+from .config import settings
+from .simulator.api import SimulatorAPI, simulator_api
+
+
+# ============================================
+# Logger
+# ============================================
+logger = logging.getLogger("invocations")
+
+InvocationHandler = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+
+
+class InvocationError(Exception):
+    """An action failed in a way the caller should see verbatim."""
+
+
+class _BatchFailed(Exception):
+    """Aborts an atomic batch so its transaction rolls back."""
+
+
+def invocation_data(payload: dict[str, Any]) -> dict[str, Any]:
+    """Action arguments: ``inputText`` parsed as JSON, else the payload itself."""
+    input_text = payload.get("inputText", "")
+    if isinstance(input_text, str) and input_text:
+        try:
+            return json.loads(input_text)
+        except json.JSONDecodeError:
+            return {"text": input_text}
+    return payload
+
+
+def _batch_body(payload: dict[str, Any]) -> dict[str, Any]:
+    # The batch form may also arrive JSON-encoded in inputText
+    if "actions" in payload or "action" in payload:
+        return payload
+    data = invocation_data(payload)
+    return data if isinstance(data, dict) else payload
+
+
+# ============================================
+# Action Registry
+# ============================================
+class InvocationAction:
+    """One registered action."""
+
+    def __init__(
+        self, name: str, handler: InvocationHandler, write: bool, transactional: bool
+    ) -> None:
+        """Initialize the action.
+
+        Args:
+            name: Action name callers send
+            handler: Coroutine taking the action data and returning the
+                response fields besides ``success`` and ``action``
+            write: Creates or mutates work (budgeted as a write)
+            transactional: Only touches simulator cases (no derived
+                views) and never suspends, so it may run inside an
+                atomic batch
+        """
+        self.name = name
+        self.handler = handler
+        self.write = write
+        self.transactional = transactional
+
+
+class InvocationRegistry:
+    """Dispatch table for /invocations."""
+
+    def __init__(self, simulator: SimulatorAPI, max_batch: int = 100) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            simulator: Store atomic batches run a transaction on
+            max_batch: Most actions one batch may carry
+        """
+        self._simulator = simulator
+        self.max_batch = max_batch
+        self._actions: dict[str, InvocationAction] = {}
+
+    def action(
+        self, name: str, write: bool = False, transactional: bool = False
+    ) -> Callable[[InvocationHandler], InvocationHandler]:
+        """Decorator registering a handler under ``name``.
+
+        Args:
+            name: Action name
+            write: Creates or mutates work
+            transactional: Safe to run inside an atomic batch
+        """
+
+        def register(handler: InvocationHandler) -> InvocationHandler:
+            self._actions[name] = InvocationAction(name, handler, write, transactional)
+            return handler
+
+        return register
+
+    def names(self) -> list[str]:
+        """Registered action names, in registration order."""
+        return list(self._actions)
+
+    def kind(self, payload: dict[str, Any]) -> str:
+        """Admission kind of a request: WRITE if any of its actions writes."""
+        items = _batch_body(payload).get("actions")
+        names = (
+            [item.get("action") for item in items if isinstance(item, dict)]
+            if isinstance(items, list)
+            else [payload.get("action")]
+        )
+        for name in names:
+            action = self._actions.get(name) if isinstance(name, str) else None
+            if action and action.write:
+                return WRITE
+        return READ
+
+    async def invoke(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Run one request, single or batch form.
+
+        Args:
+            payload: Request body
+
+        Returns:
+            The action's response, or for a batch
+            {"success", "results": [...]} with one response per item
+        """
+        body = _batch_body(payload)
+        if "actions" in body:
+            return await self._run_batch(
+                body["actions"],
+                atomic=bool(body.get("atomic")),
+                stop_on_error=bool(body.get("stop_on_error")),
+            )
+        return await self._call_safe(payload)
+
+    async def _call_safe(self, payload: dict[str, Any]) -> dict[str, Any]:
+        try:
+            return await self._call(payload)
+        except Exception as e:
+            return _failure(e)
+
+    async def _call(self, payload: dict[str, Any]) -> dict[str, Any]:
+        name = payload.get("action", "")
+        logger.info(f"Invocation received: action={name}")
+        action = self._actions.get(name)
+        if action is None:
+            return {
+                "success": False,
+                "error": f"Unknown action: {name}",
+                "available_actions": self.names(),
+            }
+        result = await action.handler(invocation_data(payload))
+        return {"success": True, "action": name, **result}
+
+    async def _run_batch(
+        self, items: Any, atomic: bool, stop_on_error: bool
+    ) -> dict[str, Any]:
+        if not isinstance(items, list) or not all(isinstance(i, dict) for i in items):
+            return {"success": False, "error": "actions must be a list of objects"}
+        if len(items) > self.max_batch:
+            return {
+                "success": False,
+                "error": f"Batch too large: {len(items)} actions (max {self.max_batch})",
+            }
+        if atomic:
+            refused = [
+                item.get("action")
+                for item in items
+                if not getattr(self._actions.get(item.get("action")), "transactional", False)
+            ]
+            if refused:
+                return {
+                    "success": False,
+                    "error": f"Action not allowed in an atomic batch: {refused[0]}",
+                }
+            return await self._run_atomic(items)
+
+        results: list[dict[str, Any]] = []
+        for item in items:
+            if results and stop_on_error and not results[-1]["success"]:
+                results.append(_skipped())
+                continue
+            results.append(await self._call_safe(item))
+        return {
+            "success": all(r["success"] for r in results),
+            "action": "batch",
+            "results": results,
+        }
+
+    async def _run_atomic(self, items: list[dict[str, Any]]) -> dict[str, Any]:
+        results: list[dict[str, Any]] = []
+        try:
+            # Transactional handlers never suspend, so no other request
+            # runs while the transaction is open
+            with self._simulator.transaction():
+                for item in items:
+                    result = await self._call_safe(item)
+                    results.append(result)
+                    if not result["success"]:
+                        raise _BatchFailed
+        except _BatchFailed:
+            failed = len(results) - 1
+            logger.info(f"Atomic batch rolled back at item {failed}")
+            results.extend(_skipped() for _ in items[len(results):])
+            return {
+                "success": False,
+                "action": "batch",
+                "error": results[failed]["error"],
+                "failed_index": failed,
+                "rolled_back": True,
+                "results": results,
+            }
+        return {"success": True, "action": "batch", "results": results}
+
+
+def _skipped() -> dict[str, Any]:
+    return {"success": False, "skipped": True}
+
+
+def _failure(error: Exception) -> dict[str, Any]:
+    if not isinstance(error, InvocationError):
+        logger.error(f"Invocation error: {error}")
+    return {"success": False, "error": str(error)}
+
+
+# ============================================
+# Singleton Instance
+# ============================================
+invocation_actions = InvocationRegistry(simulator_api, max_batch=settings.invocation_max_batch)
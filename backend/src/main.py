@@ -8,32 +8,53 @@
 #
 # Endpoints:
 # - /ping              : Health check (AgentCore requirement)
-# - /invocations       : AgentCore invocation endpoint
+# - /invocations       : AgentCore invocation endpoint (single or batched actions)
 # - /api/cases         : REST API for cases
 # - /api/events        : REST API for events
 # - /api/batch         : Batch operations
 # - /api/stats         : Statistics
+# - /api/csv-pack      : Background CSV pack jobs and ZIP export
+# - /api/export        : NDJSON streaming exports
 # - /api/reset         : Reset demo data
 # - /ws/timeline       : WebSocket for real-time timeline updates
 #
 # ============================================
 
-import json
 import logging
+import time
+from concurrent.futures import Executor
 from contextlib import asynccontextmanager
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
+from .admission import admission_controller, admit_read, admit_write, too_many_requests
+from .bridge.csv_pack import CSVPackStatus, csv_pack_jobs, iter_pack_zip
+from .bridge.export import NDJSON_MEDIA_TYPE, iter_ndjson
+from .bridge.pubsub import create_timeline_bus
 from .bridge.routes import router as bridge_router
+from .bridge.spikes import spike_detector
+from .bridge.stats import stats_publisher
+from .bridge.websocket import timeline_manager
 from .config import settings
+from .invocations import InvocationError, invocation_actions
+from .responses import (
+    FastJSONResponse,
+    RawJSONResponse,
+    case_dicts,
+    case_json,
+    event_json,
+    join_array,
+    run_json,
+)
 from .sac import service as sac_service
 from .sac.router import router as sac_router
-from .simulator.api import simulator_api
+from .simulator.api import simulator_api, synced_ledger
 from .simulator.event_emitter import create_event_callback, event_emitter
+from .simulator.merkle import verify_segments_parallel
 from .simulator.models import (
     BatchCreate,
     BatchResult,
@@ -44,6 +65,7 @@ from .simulator.models import (
     CaseStatus,
     CaseType,
     CaseUpdate,
+    ComplaintCategory,
     EventEnvelope,
     EventType,
     HealthResponse,
@@ -53,12 +75,33 @@ from .simulator.models import (
 # ============================================
 # Logging Configuration
 # ============================================
+# The only basicConfig: library modules just create loggers, so
+# LOG_LEVEL and this format apply to every module's records
 logging.basicConfig(
     level=getattr(logging, settings.log_level),
     format='{"timestamp": "%(asctime)s", "service": "%(name)s", "level": "%(levelname)s", "message": "%(message)s"}',
 )
 logger = logging.getLogger(settings.service_name)
 
+# Created on the first full ledger verification
+_ledger_verify_pool: Executor | None = None
+
+
+def _get_ledger_verify_pool() -> Executor:
+    """Process pool for full ledger verification."""
+    global _ledger_verify_pool
+    if _ledger_verify_pool is None:
+        # Imported here to keep multiprocessing out of the cold start
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        _ledger_verify_pool = ProcessPoolExecutor(
+            max_workers=settings.ledger_verify_workers or None,
+            # Workers must not inherit the event loop or worker threads
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _ledger_verify_pool
+
 
 # ============================================
 # Application Lifespan
@@ -71,6 +114,29 @@ async def lifespan(app: FastAPI):
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"A2A Enabled: {settings.a2a_enabled}")
 
+    # Shed new work when Observer dispatch or timeline fan-out falls behind
+    admission_controller.add_source(
+        "a2a_dispatch", event_emitter.pending_count, event_emitter.lag_seconds
+    )
+    admission_controller.add_source(
+        "timeline", timeline_manager.pending_count, timeline_manager.lag_seconds
+    )
+
+    # Stream simulator events to /ws/timeline through the broadcaster
+    timeline_manager.start()
+    bus = create_timeline_bus()
+    if bus is not None:
+        # Share events with the other uvicorn workers
+        await timeline_manager.attach_bus(bus)
+    simulator_api.add_event_listener(timeline_manager.publish_envelope)
+
+    # Push dashboard counters instead of having every tab poll /api/stats
+    stats_publisher.start()
+    simulator_api.add_event_listener(stats_publisher.mark_dirty)
+
+    # Alert on bursts of complaints for one product lot
+    simulator_api.add_event_listener(spike_detector.on_event)
+
     # Configure event emitter
     if settings.observer_agent_arn:
         event_emitter.set_observer_arn(settings.observer_agent_arn)
@@ -83,6 +149,10 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down...")
+    await stats_publisher.stop()
+    await timeline_manager.stop()
+    if _ledger_verify_pool is not None:
+        _ledger_verify_pool.shutdown(cancel_futures=True)
 
 
 # ============================================
@@ -93,6 +163,7 @@ app = FastAPI(
     description="Simulates TrackWise Digital for Galderma AI Autopilot Demo",
     version=settings.version,
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # CORS middleware
@@ -102,6 +173,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include WebSocket router for timeline
@@ -126,265 +198,192 @@ async def ping() -> HealthResponse:
 
 
 @app.post("/invocations", tags=["AgentCore"])
-async def invocations(payload: dict[str, Any]) -> dict[str, Any]:
+async def invocations(payload: dict[str, Any]) -> FastJSONResponse:
     """AgentCore invocation endpoint.
 
-    This endpoint handles invocations from AgentCore Runtime.
-    Actions: create_case, get_case, update_case, close_case,
-             list_cases, create_batch, reset_demo, get_stats
+    Runs one ``action``, or an ``actions`` list in order (optionally
+    ``atomic`` or ``stop_on_error``). Handlers are registered below;
+    an unknown action lists the available ones.
     """
-    try:
-        action = payload.get("action", "")
-        input_text = payload.get("inputText", "")
-
-        # Parse inputText if it's JSON
-        if isinstance(input_text, str) and input_text:
-            try:
-                data = json.loads(input_text)
-            except json.JSONDecodeError:
-                data = {"text": input_text}
-        else:
-            data = payload
-
-        logger.info(f"Invocation received: action={action}")
-
-        # Route to appropriate handler
-        if action == "create_case":
-            case_data = CaseCreate(**data.get("case", data))
-            case, event = simulator_api.create_case(case_data)
-            return {
-                "success": True,
-                "action": "create_case",
-                "case": case.model_dump(mode="json"),
-                "event_id": event.event_id,
-            }
-
-        elif action == "get_case":
-            case_id = data.get("case_id")
-            if not case_id:
-                return {"success": False, "error": "case_id required"}
-            case = simulator_api.get_case(case_id)
-            if not case:
-                return {"success": False, "error": f"Case not found: {case_id}"}
-            return {
-                "success": True,
-                "action": "get_case",
-                "case": case.model_dump(mode="json"),
-            }
-
-        elif action == "update_case":
-            case_id = data.get("case_id")
-            if not case_id:
-                return {"success": False, "error": "case_id required"}
-            update_data = CaseUpdate(**data.get("update", {}))
-            case, event = simulator_api.update_case(case_id, update_data)
-            if not case:
-                return {"success": False, "error": f"Case not found: {case_id}"}
-            return {
-                "success": True,
-                "action": "update_case",
-                "case": case.model_dump(mode="json"),
-                "event_id": event.event_id if event else None,
-            }
-
-        elif action == "close_case":
-            case_id = data.get("case_id")
-            if not case_id:
-                return {"success": False, "error": "case_id required"}
-            case, event = simulator_api.close_case(
-                case_id=case_id,
-                resolution_text=data.get("resolution_text", ""),
-                resolution_text_pt=data.get("resolution_text_pt"),
-                resolution_text_en=data.get("resolution_text_en"),
-                resolution_text_es=data.get("resolution_text_es"),
-                resolution_text_fr=data.get("resolution_text_fr"),
-                processed_by_agent=data.get("processed_by_agent"),
-            )
-            if not case:
-                return {"success": False, "error": f"Case not found: {case_id}"}
-            return {
-                "success": True,
-                "action": "close_case",
-                "case": case.model_dump(mode="json"),
-                "event_id": event.event_id if event else None,
-            }
-
-        elif action == "list_cases":
-            response = simulator_api.list_cases(
-                status=CaseStatus(data["status"]) if data.get("status") else None,
-                severity=CaseSeverity(data["severity"]) if data.get("severity") else None,
-                case_type=CaseType(data["case_type"]) if data.get("case_type") else None,
-                page=data.get("page", 1),
-                page_size=data.get("page_size", 20),
-            )
-            return {
-                "success": True,
-                "action": "list_cases",
-                "result": response.model_dump(mode="json"),
-            }
-
-        elif action == "create_batch":
-            batch_data = BatchCreate(**data.get("batch", data))
-            result = simulator_api.create_batch(batch_data)
-            return {
-                "success": True,
-                "action": "create_batch",
-                "result": result.model_dump(mode="json"),
-            }
-
-        elif action == "reset_demo":
-            result = simulator_api.reset_demo()
-            return {
-                "success": True,
-                "action": "reset_demo",
-                "result": result,
-            }
-
-        elif action == "get_stats":
-            stats = simulator_api.get_stats()
-            return {
-                "success": True,
-                "action": "get_stats",
-                "stats": stats,
-            }
-
-        elif action == "get_executive_stats":
-            stats = await get_executive_stats()
-            return {
-                "success": True,
-                "action": "get_executive_stats",
-                "stats": stats,
-            }
-
-        elif action == "list_runs":
-            runs = await list_runs(
-                case_id=data.get("case_id"),
-                status=data.get("status"),
-            )
-            return {
-                "success": True,
-                "action": "list_runs",
-                "result": runs,
-            }
-
-        elif action == "get_run":
-            run_id = data.get("run_id")
-            run = await get_run(run_id)
-            return {
-                "success": True,
-                "action": "get_run",
-                "result": run,
-            }
-
-        elif action == "list_ledger":
-            entries = await list_ledger(
-                case_id=data.get("case_id"),
-                run_id=data.get("run_id"),
-                agent_name=data.get("agent_name"),
-                limit=data.get("limit", 100),
-            )
-            return {
-                "success": True,
-                "action": "list_ledger",
-                "result": entries,
-            }
-
-        elif action == "get_memory":
-            memory = await get_memory()
-            return {
-                "success": True,
-                "action": "get_memory",
-                "result": memory,
-            }
-
-        elif action == "generate_csv_pack":
-            pack = await generate_csv_pack()
-            return {
-                "success": True,
-                "action": "generate_csv_pack",
-                "result": pack,
-            }
-
-        elif action == "create_galderma_scenario":
-            result = simulator_api.create_galderma_scenario()
-            return {
-                "success": True,
-                "action": "create_galderma_scenario",
-                "result": result,
-            }
-
-        # SAC Module actions
-        elif action == "sac_generate":
-            from src.sac.models import SACGenerateRequest
-
-            sac_request = SACGenerateRequest(**data.get("request", data))
-            sac_result = await sac_service.generate_cases(sac_request, simulator_api)
-            return {
-                "success": True,
-                "action": "sac_generate",
-                "result": sac_result.model_dump(mode="json"),
-            }
-
-        elif action == "sac_get_status":
-            status = sac_service.get_status()
-            return {
-                "success": True,
-                "action": "sac_get_status",
-                "result": status.model_dump(mode="json"),
-            }
-
-        elif action == "sac_get_scenarios":
-            scenarios = sac_service.get_scenarios()
-            return {
-                "success": True,
-                "action": "sac_get_scenarios",
-                "result": [s.model_dump(mode="json") for s in scenarios],
-            }
-
-        elif action == "sac_configure":
-            from src.sac.models import SACConfigureRequest
-
-            config_request = SACConfigureRequest(**data.get("request", data))
-            status = sac_service.configure(config_request)
-            return {
-                "success": True,
-                "action": "sac_configure",
-                "result": status.model_dump(mode="json"),
-            }
-
-        else:
-            return {
-                "success": False,
-                "error": f"Unknown action: {action}",
-                "available_actions": [
-                    "create_case",
-                    "get_case",
-                    "update_case",
-                    "close_case",
-                    "list_cases",
-                    "create_batch",
-                    "reset_demo",
-                    "get_stats",
-                    "get_executive_stats",
-                    "list_runs",
-                    "get_run",
-                    "list_ledger",
-                    "get_memory",
-                    "generate_csv_pack",
-                    "create_galderma_scenario",
-                    "sac_generate",
-                    "sac_get_status",
-                    "sac_get_scenarios",
-                    "sac_configure",
-                ],
-            }
-
-    except Exception as e:
-        logger.error(f"Invocation error: {e}")
-        return {
-            "success": False,
-            "error": str(e),
+    retry_after = await admission_controller.admit(invocation_actions.kind(payload))
+    if retry_after:
+        raise too_many_requests(retry_after)
+    # Handlers already return JSON-ready dicts; encode them once
+    return FastJSONResponse(await invocation_actions.invoke(payload))
+
+
+# ============================================
+# AgentCore Invocation Actions
+# ============================================
+def _case_dict(case: Case) -> dict[str, Any]:
+    version = simulator_api.get_case_versions().get(case.case_id, 0)
+    return case_dicts.get(case.case_id, case, version)
+
+
+def _required_case_id(data: dict[str, Any]) -> str:
+    case_id = data.get("case_id")
+    if not case_id:
+        raise InvocationError("case_id required")
+    return case_id
+
+
+@invocation_actions.action("create_case", write=True, transactional=True)
+async def _invoke_create_case(data: dict[str, Any]) -> dict[str, Any]:
+    case, event = simulator_api.create_case(CaseCreate(**data.get("case", data)))
+    return {"case": _case_dict(case), "event_id": event.event_id}
+
+
+@invocation_actions.action("get_case", transactional=True)
+async def _invoke_get_case(data: dict[str, Any]) -> dict[str, Any]:
+    case_id = _required_case_id(data)
+    case = simulator_api.get_case(case_id)
+    if not case:
+        raise InvocationError(f"Case not found: {case_id}")
+    return {"case": _case_dict(case)}
+
+
+@invocation_actions.action("update_case", write=True, transactional=True)
+async def _invoke_update_case(data: dict[str, Any]) -> dict[str, Any]:
+    case_id = _required_case_id(data)
+    case, event = simulator_api.update_case(case_id, CaseUpdate(**data.get("update", {})))
+    if not case:
+        raise InvocationError(f"Case not found: {case_id}")
+    return {
+        "case": _case_dict(case),
+        "event_id": event.event_id if event else None,
+    }
+
+
+@invocation_actions.action("close_case", write=True, transactional=True)
+async def _invoke_close_case(data: dict[str, Any]) -> dict[str, Any]:
+    case_id = _required_case_id(data)
+    case, event = simulator_api.close_case(
+        case_id=case_id,
+        resolution_text=data.get("resolution_text", ""),
+        resolution_text_pt=data.get("resolution_text_pt"),
+        resolution_text_en=data.get("resolution_text_en"),
+        resolution_text_es=data.get("resolution_text_es"),
+        resolution_text_fr=data.get("resolution_text_fr"),
+        processed_by_agent=data.get("processed_by_agent"),
+    )
+    if not case:
+        raise InvocationError(f"Case not found: {case_id}")
+    return {
+        "case": _case_dict(case),
+        "event_id": event.event_id if event else None,
+    }
+
+
+@invocation_actions.action("list_cases", transactional=True)
+async def _invoke_list_cases(data: dict[str, Any]) -> dict[str, Any]:
+    response = simulator_api.list_cases(
+        status=CaseStatus(data["status"]) if data.get("status") else None,
+        severity=CaseSeverity(data["severity"]) if data.get("severity") else None,
+        case_type=CaseType(data["case_type"]) if data.get("case_type") else None,
+        page=data.get("page", 1),
+        page_size=data.get("page_size", 20),
+    )
+    case_dicts.prune(simulator_api.get_case_versions())
+    return {
+        "result": {
+            "total": response.total,
+            "cases": [_case_dict(case) for case in response.cases],
+            "page": response.page,
+            "page_size": response.page_size,
         }
+    }
+
+
+@invocation_actions.action("create_batch", write=True, transactional=True)
+async def _invoke_create_batch(data: dict[str, Any]) -> dict[str, Any]:
+    result = simulator_api.create_batch(BatchCreate(**data.get("batch", data)))
+    return {"result": result.model_dump(mode="json")}
+
+
+@invocation_actions.action("reset_demo", write=True)
+async def _invoke_reset_demo(data: dict[str, Any]) -> dict[str, Any]:
+    return {"result": await reset_demo()}
+
+
+@invocation_actions.action("get_stats", transactional=True)
+async def _invoke_get_stats(data: dict[str, Any]) -> dict[str, Any]:
+    return {"stats": await get_stats()}
+
+
+@invocation_actions.action("get_executive_stats", transactional=True)
+async def _invoke_get_executive_stats(data: dict[str, Any]) -> dict[str, Any]:
+    return {"stats": await get_executive_stats()}
+
+
+# Readers that sync a derived view (runs, ledger chain, memory) stay
+# out of atomic batches: the ledger chain is append-only, so entries
+# synced from uncommitted cases would outlive a rollback
+@invocation_actions.action("list_runs")
+async def _invoke_list_runs(data: dict[str, Any]) -> dict[str, Any]:
+    return {"result": _list_runs(case_id=data.get("case_id"), status=data.get("status"))}
+
+
+@invocation_actions.action("get_run", transactional=True)
+async def _invoke_get_run(data: dict[str, Any]) -> dict[str, Any]:
+    return {"result": await get_run(data.get("run_id"))}
+
+
+@invocation_actions.action("list_ledger")
+async def _invoke_list_ledger(data: dict[str, Any]) -> dict[str, Any]:
+    entries, next_cursor = synced_ledger().page(
+        case_id=data.get("case_id"),
+        run_id=data.get("run_id"),
+        agent_name=data.get("agent_name"),
+        limit=data.get("limit", 100),
+        cursor=data.get("cursor"),
+    )
+    return {"result": entries, "next_cursor": next_cursor}
+
+
+@invocation_actions.action("get_memory")
+async def _invoke_get_memory(data: dict[str, Any]) -> dict[str, Any]:
+    return {"result": await get_memory()}
+
+
+@invocation_actions.action("generate_csv_pack", write=True)
+async def _invoke_generate_csv_pack(data: dict[str, Any]) -> dict[str, Any]:
+    job = await csv_pack_jobs.wait(csv_pack_jobs.submit())
+    if job.status == CSVPackStatus.FAILED:
+        raise InvocationError(job.error)
+    return {"result": job.result}
+
+
+@invocation_actions.action("create_galderma_scenario", write=True, transactional=True)
+async def _invoke_create_galderma_scenario(data: dict[str, Any]) -> dict[str, Any]:
+    return {"result": simulator_api.create_galderma_scenario()}
+
+
+# SAC Module actions
+@invocation_actions.action("sac_generate", write=True)
+async def _invoke_sac_generate(data: dict[str, Any]) -> dict[str, Any]:
+    from src.sac.models import SACGenerateRequest
+
+    sac_request = SACGenerateRequest(**data.get("request", data))
+    sac_result = await sac_service.generate_cases(sac_request, simulator_api)
+    return {"result": sac_result.model_dump(mode="json")}
+
+
+@invocation_actions.action("sac_get_status")
+async def _invoke_sac_get_status(data: dict[str, Any]) -> dict[str, Any]:
+    return {"result": sac_service.get_status().model_dump(mode="json")}
+
+
+@invocation_actions.action("sac_get_scenarios")
+async def _invoke_sac_get_scenarios(data: dict[str, Any]) -> dict[str, Any]:
+    return {"result": [s.model_dump(mode="json") for s in sac_service.get_scenarios()]}
+
+
+@invocation_actions.action("sac_configure", write=True)
+async def _invoke_sac_configure(data: dict[str, Any]) -> dict[str, Any]:
+    from src.sac.models import SACConfigureRequest
+
+    status = sac_service.configure(SACConfigureRequest(**data.get("request", data)))
+    return {"result": status.model_dump(mode="json")}
 
 
 # ============================================
@@ -392,41 +391,68 @@ async def invocations(payload: dict[str, Any]) -> dict[str, Any]:
 # ============================================
 
 # --- Cases ---
-@app.post("/api/cases", response_model=Case, tags=["Cases"])
+@app.post(
+    "/api/cases", response_model=Case, tags=["Cases"], dependencies=[Depends(admit_write)]
+)
 async def create_case(case_data: CaseCreate) -> Case:
     """Create a new case."""
     case, _ = simulator_api.create_case(case_data)
     return case
 
 
-@app.get("/api/cases", response_model=CaseListResponse, tags=["Cases"])
+@app.get(
+    "/api/cases",
+    response_model=CaseListResponse,
+    tags=["Cases"],
+    dependencies=[Depends(admit_read)],
+)
 async def list_cases(
     status: CaseStatus | None = Query(None),
     severity: CaseSeverity | None = Query(None),
     case_type: CaseType | None = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-) -> CaseListResponse:
+) -> RawJSONResponse:
     """List cases with optional filters."""
-    return simulator_api.list_cases(
+    response = simulator_api.list_cases(
         status=status,
         severity=severity,
         case_type=case_type,
         page=page,
         page_size=page_size,
     )
+    versions = simulator_api.get_case_versions()
+    cases = join_array(
+        case_json.get(c.case_id, c, versions.get(c.case_id, 0)) for c in response.cases
+    )
+    case_json.prune(versions)
+    return RawJSONResponse(
+        b'{"total":%d,"cases":%b,"page":%d,"page_size":%d}'
+        % (response.total, cases, response.page, response.page_size)
+    )
 
 
-@app.get("/api/cases/{case_id}", response_model=Case, tags=["Cases"])
-async def get_case(case_id: str) -> Case:
+@app.get(
+    "/api/cases/{case_id}",
+    response_model=Case,
+    tags=["Cases"],
+    dependencies=[Depends(admit_read)],
+)
+async def get_case(case_id: str) -> RawJSONResponse:
     """Get a case by ID."""
     case = simulator_api.get_case(case_id)
     if not case:
         raise HTTPException(status_code=404, detail=f"Case not found: {case_id}")
-    return case
+    version = simulator_api.get_case_versions().get(case_id, 0)
+    return RawJSONResponse(case_json.get(case_id, case, version))
 
 
-@app.patch("/api/cases/{case_id}", response_model=Case, tags=["Cases"])
+@app.patch(
+    "/api/cases/{case_id}",
+    response_model=Case,
+    tags=["Cases"],
+    dependencies=[Depends(admit_write)],
+)
 async def update_case(case_id: str, update_data: CaseUpdate) -> Case:
     """Update an existing case."""
     case, _ = simulator_api.update_case(case_id, update_data)
@@ -435,7 +461,12 @@ async def update_case(case_id: str, update_data: CaseUpdate) -> Case:
     return case
 
 
-@app.post("/api/cases/{case_id}/close", response_model=Case, tags=["Cases"])
+@app.post(
+    "/api/cases/{case_id}/close",
+    response_model=Case,
+    tags=["Cases"],
+    dependencies=[Depends(admit_write)],
+)
 async def close_case(
     case_id: str,
     resolution_text: str = Query(...),
@@ -470,78 +501,200 @@ async def delete_case(case_id: str) -> dict[str, Any]:
 
 
 # --- Runs (Simulated for demo) ---
-@app.get("/api/runs", tags=["Runs"])
+@app.get(
+    "/api/runs",
+    response_model=list[dict[str, Any]],
+    tags=["Runs"],
+    dependencies=[Depends(admit_read)],
+)
 async def list_runs(
     case_id: str | None = Query(None),
     status: str | None = Query(None),
-) -> list[dict[str, Any]]:
+) -> RawJSONResponse:
     """List agent runs. Generates simulated run data for demo cases."""
+    versions = simulator_api.get_case_versions()
+    runs = join_array(
+        run_json.get(r["case_id"], r, versions.get(r["case_id"], 0))
+        for r in _list_runs(case_id, status)
+    )
+    run_json.prune(versions)
+    return RawJSONResponse(runs)
+
+
+def _list_runs(case_id: str | None, status: str | None) -> list[dict[str, Any]]:
     from .simulator.demo_data import generate_runs_for_cases
 
     cases = list(simulator_api._cases.values())
     if case_id:
         cases = [c for c in cases if c.case_id == case_id]
-    return generate_runs_for_cases(cases, status_filter=status)
+    return generate_runs_for_cases(
+        cases, status_filter=status, versions=simulator_api.get_case_versions()
+    )
 
 
-@app.get("/api/runs/{run_id}", tags=["Runs"])
+@app.get("/api/runs/{run_id}", tags=["Runs"], dependencies=[Depends(admit_read)])
 async def get_run(run_id: str) -> dict[str, Any]:
     """Get a single run by ID."""
-    from .simulator.demo_data import generate_runs_for_cases
+    from .simulator.demo_data import generate_run_for_case
 
-    cases = list(simulator_api._cases.values())
-    runs = generate_runs_for_cases(cases)
-    for run in runs:
-        if run["run_id"] == run_id:
-            return run
-    raise HTTPException(status_code=404, detail=f"Run not found: {run_id}")
+    case = simulator_api.get_case_by_run_id(run_id)
+    if not case:
+        raise HTTPException(status_code=404, detail=f"Run not found: {run_id}")
+    return generate_run_for_case(case, simulator_api.get_case_versions().get(case.case_id, 0))
 
 
 # --- Ledger (Simulated for demo) ---
-@app.get("/api/ledger", tags=["Ledger"])
+@app.get("/api/ledger", tags=["Ledger"], dependencies=[Depends(admit_read)])
 async def list_ledger(
     case_id: str | None = Query(None),
     run_id: str | None = Query(None),
     agent_name: str | None = Query(None),
     limit: int = Query(100, ge=1, le=1000),
-) -> list[dict[str, Any]]:
-    """List ledger entries. Generates simulated audit trail for demo cases."""
-    from .simulator.demo_data import generate_ledger_for_cases
+    cursor: int | None = Query(None, ge=0, description="X-Next-Cursor of the previous page"),
+) -> FastJSONResponse:
+    """List ledger entries from the simulated audit trail, newest first.
 
-    cases = list(simulator_api._cases.values())
-    if case_id:
-        cases = [c for c in cases if c.case_id == case_id]
-    entries = generate_ledger_for_cases(cases, agent_filter=agent_name)
-    if run_id:
-        entries = [e for e in entries if e["run_id"] == run_id]
-    return entries[:limit]
+    Filters are served from the chain's indexes. When more entries
+    match, the X-Next-Cursor header holds the cursor of the next page.
+    """
+    try:
+        entries, next_cursor = synced_ledger().page(
+            case_id=case_id, run_id=run_id, agent_name=agent_name, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    headers = {"X-Next-Cursor": str(next_cursor)} if next_cursor is not None else None
+    return FastJSONResponse(content=entries, headers=headers)
+
+
+@app.get("/api/ledger/checkpoints", tags=["Ledger"], dependencies=[Depends(admit_read)])
+async def list_ledger_checkpoints() -> dict[str, Any]:
+    """List sealed Merkle checkpoints and the root over them."""
+    chain = synced_ledger()
+    return {
+        "entries": len(chain),
+        "checkpoint_size": chain.checkpoint_size,
+        "root": chain.root,
+        "checkpoints": chain.checkpoints(),
+    }
+
+
+@app.get("/api/ledger/verify", tags=["Ledger"], dependencies=[Depends(admit_read)])
+async def verify_ledger(
+    from_: int | None = Query(None, alias="from", ge=0),
+    to: int | None = Query(None, ge=0),
+) -> dict[str, Any]:
+    """Verify ledger integrity.
+
+    With ``from``/``to`` (chain positions, inclusive, at most 1000
+    entries) each entry is returned with an inclusion proof against
+    the checkpoint root. Without them the whole chain is rehashed
+    across a process pool.
+    """
+    chain = synced_ledger()
+    total = len(chain)
+
+    if from_ is not None or to is not None:
+        start = from_ if from_ is not None else max(0, to - 99)
+        end = min(to if to is not None else start + 99, total - 1)
+        if start > end:
+            raise HTTPException(status_code=400, detail=f"Empty range: ledger has {total} entries")
+        if end - start >= 1000:
+            raise HTTPException(status_code=400, detail="Range too large (max 1000 entries)")
+        return chain.verify_range(start, end)
+
+    started = time.perf_counter()
+    jobs = chain.segment_jobs()
+    pool = _get_ledger_verify_pool() if len(jobs) > 1 else None
+    errors = chain.verify_checkpoints()
+    errors += await verify_segments_parallel(jobs, pool)
+    return {
+        "entries": total,
+        "root": chain.root,
+        "checkpoints": len(chain.checkpoints()),
+        "segments_verified": len(jobs),
+        "verified": not errors,
+        "errors": errors,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
 
 
 # --- Events ---
-@app.get("/api/events", response_model=list[EventEnvelope], tags=["Events"])
+@app.get(
+    "/api/events",
+    response_model=list[EventEnvelope],
+    tags=["Events"],
+    dependencies=[Depends(admit_read)],
+)
 async def list_events(
     limit: int = Query(100, ge=1, le=1000),
     event_type: EventType | None = Query(None),
-) -> list[EventEnvelope]:
+) -> RawJSONResponse:
     """List recent events."""
-    return simulator_api.get_events(limit=limit, event_type=event_type)
+    events = simulator_api.get_events(limit=limit, event_type=event_type)
+    return RawJSONResponse(join_array(event_json.get(e.event_id, e) for e in events))
+
+
+# --- Export ---
+def _ndjson_response(records: Any, filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        iter_ndjson(records),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@app.get("/api/export/cases.ndjson", tags=["Export"], dependencies=[Depends(admit_read)])
+async def export_cases(
+    status: CaseStatus | None = Query(None),
+    severity: CaseSeverity | None = Query(None),
+    case_type: CaseType | None = Query(None),
+) -> StreamingResponse:
+    """Stream every matching case as NDJSON, in creation order."""
+    cases = simulator_api.iter_cases(status=status, severity=severity, case_type=case_type)
+    return _ndjson_response(cases, "cases.ndjson")
+
+
+@app.get("/api/export/events.ndjson", tags=["Export"], dependencies=[Depends(admit_read)])
+async def export_events(event_type: EventType | None = Query(None)) -> StreamingResponse:
+    """Stream every matching event as NDJSON, in emission order."""
+    return _ndjson_response(simulator_api.iter_events(event_type=event_type), "events.ndjson")
+
+
+@app.get("/api/export/ledger.ndjson", tags=["Export"], dependencies=[Depends(admit_read)])
+async def export_ledger(
+    case_id: str | None = Query(None),
+    run_id: str | None = Query(None),
+    agent_name: str | None = Query(None),
+) -> StreamingResponse:
+    """Stream every matching ledger entry as NDJSON, newest first."""
+    entries = synced_ledger().iter_pages(case_id=case_id, run_id=run_id, agent_name=agent_name)
+    return _ndjson_response(entries, "ledger.ndjson")
 
 
 # --- Batch Operations ---
-@app.post("/api/batch", response_model=BatchResult, tags=["Batch"])
+@app.post(
+    "/api/batch",
+    response_model=BatchResult,
+    tags=["Batch"],
+    dependencies=[Depends(admit_write)],
+)
 async def create_batch(batch_data: BatchCreate) -> BatchResult:
     """Create a batch of demo cases."""
     return simulator_api.create_batch(batch_data)
 
 
 # --- Statistics ---
-@app.get("/api/stats", tags=["Statistics"])
+@app.get("/api/stats", tags=["Statistics"], dependencies=[Depends(admit_read)])
 async def get_stats() -> dict[str, int]:
-    """Get simulator statistics."""
+    """Get simulator statistics.
+
+    Live updates are pushed as ``stats_delta`` events on /ws/timeline.
+    """
     return simulator_api.get_stats()
 
 
-@app.get("/api/stats/executive", tags=["Statistics"])
+@app.get("/api/stats/executive", tags=["Statistics"], dependencies=[Depends(admit_read)])
 async def get_executive_stats() -> dict[str, Any]:
     """Executive dashboard metrics for the demo.
 
@@ -549,39 +702,67 @@ async def get_executive_stats() -> dict[str, Any]:
         ai_closed_count: Number of cases closed by AI agents
         human_hours_saved: Estimated human hours saved (15 min per case)
         risks_avoided: Number of compliance risks caught
-    """
-    from .simulator.models import CaseStatus
 
-    cases = list(simulator_api._cases.values())
-    closed_cases = [c for c in cases if c.status == CaseStatus.CLOSED]
-
-    # Cases closed by AI = cases with processed_by_agent set, or all closed for demo
-    ai_closed = [c for c in closed_cases if c.processed_by_agent] or closed_cases
-    ai_closed_count = len(ai_closed)
-
-    # Estimated 15 minutes per case for human processing
-    human_hours_saved = round(ai_closed_count * 15 / 60, 1)
-
-    # Risks avoided = compliance checks that blocked or escalated
-    # For demo, count HIGH/CRITICAL cases that were properly escalated
-    from .simulator.models import CaseSeverity
-    risks_avoided = len([
-        c for c in cases
-        if c.severity in (CaseSeverity.HIGH, CaseSeverity.CRITICAL)
-    ])
+    Live updates are pushed as ``stats_delta`` events on /ws/timeline.
+    """
+    return simulator_api.get_executive_stats()
+
+
+@app.get("/api/analytics/aggregate", tags=["Statistics"], dependencies=[Depends(admit_read)])
+async def analytics_aggregate(
+    group_by: list[str] = Query(
+        ["brand"], description="brand, product, category, severity, status, case_type"
+    ),
+    bucket: str | None = Query(None, pattern="^(hour|day|week)$"),
+    days: int | None = Query(None, ge=1, le=3650, description="Only cases from the last N days"),
+    brand: str | None = Query(None),
+    product: str | None = Query(None),
+    category: ComplaintCategory | None = Query(None),
+    severity: CaseSeverity | None = Query(None),
+    status: CaseStatus | None = Query(None),
+    case_type: CaseType | None = Query(None),
+) -> dict[str, Any]:
+    """Count cases per group, e.g. complaints per brand per day by category.
 
+    Served from a NumPy columnar mirror of the case fields.
+    """
+    from .simulator.analytics import case_columns
+
+    if case_columns is None:
+        raise HTTPException(status_code=501, detail="Analytics requires the numpy package")
+
+    revision, changed, full = simulator_api.get_changes_since(case_columns.revision)
+    case_columns.sync(revision, changed, full, existing=simulator_api.get_case_versions())
+
+    since = datetime.utcnow() - timedelta(days=days) if days else None
+    filters = {
+        name: value
+        for name, value in (
+            ("brand", brand),
+            ("product", product),
+            ("category", category),
+            ("severity", severity),
+            ("status", status),
+            ("case_type", case_type),
+        )
+        if value is not None
+    }
+    try:
+        groups = case_columns.aggregate(group_by, bucket=bucket, since=since, filters=filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return {
-        "ai_closed_count": ai_closed_count,
-        "human_hours_saved": human_hours_saved,
-        "risks_avoided": risks_avoided,
-        "total_cases": len(cases),
-        "open_cases": len([c for c in cases if c.status == CaseStatus.OPEN]),
-        "closed_cases": len(closed_cases),
+        "group_by": group_by,
+        "bucket": bucket,
+        "since": since.isoformat() if since else None,
+        "filters": filters,
+        "total": sum(g["count"] for g in groups),
+        "groups": groups,
     }
 
 
 # --- Memory (AgentCore Memory strategies) ---
-@app.get("/api/memory", tags=["Memory"])
+@app.get("/api/memory", tags=["Memory"], dependencies=[Depends(admit_read)])
 async def get_memory() -> dict[str, Any]:
     """Get memory entries (patterns, templates, policies) derived from case state.
 
@@ -590,31 +771,92 @@ async def get_memory() -> dict[str, Any]:
     - ResolutionTemplates: learned resolution templates
     - PolicyKnowledge: compliance policies and enforcement stats
     """
-    from .simulator.demo_data import generate_memory_entries
+    from .simulator.demo_data import memory_view
 
-    cases = list(simulator_api._cases.values())
-    return generate_memory_entries(cases)
+    # Apply only the cases that changed since the last read
+    revision, changed, full = simulator_api.get_changes_since(memory_view.revision)
+    memory_view.sync(revision, changed, full, existing=simulator_api.get_case_versions())
+    return memory_view.entries()
 
 
 # --- CSV Pack ---
-@app.post("/api/csv-pack", tags=["CSV Pack"])
-async def generate_csv_pack() -> dict[str, Any]:
-    """Generate a CSV (Computer System Validation) compliance pack."""
-    from .simulator.demo_data import generate_csv_pack
+@app.post("/api/csv-pack", tags=["CSV Pack"], dependencies=[Depends(admit_write)])
+async def generate_csv_pack() -> JSONResponse:
+    """Start generating a CSV (Computer System Validation) compliance pack.
+
+    Returns 202 with the job while artifacts are built in the background
+    (progress arrives as csv_pack_progress timeline events), or 200 with
+    the finished job when the same inputs were already packed.
+    """
+    job = csv_pack_jobs.submit()
+    status_code = 200 if job.status == CSVPackStatus.COMPLETE else 202
+    return JSONResponse(status_code=status_code, content=job.to_dict())
+
+
+@app.get("/api/csv-pack/{job_id}", tags=["CSV Pack"])
+async def get_csv_pack_job(job_id: str) -> dict[str, Any]:
+    """Get a CSV pack job's progress, with the pack once complete."""
+    job = csv_pack_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"CSV pack job not found: {job_id}")
+    return job.to_dict()
+
+
+@app.get("/api/csv-pack/{job_id}/download", tags=["CSV Pack"])
+async def download_csv_pack(job_id: str) -> StreamingResponse:
+    """Download a finished CSV pack as a ZIP of JSON artifacts."""
+    job = csv_pack_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"CSV pack job not found: {job_id}")
+    if job.result is None:
+        raise HTTPException(status_code=409, detail=f"CSV pack job is {job.status}")
+    return StreamingResponse(
+        iter_pack_zip(job.result),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="{job.result["pack_id"]}.zip"'
+        },
+    )
+
+
+# --- Admission Control ---
+@app.get("/api/admission", tags=["Statistics"])
+async def get_admission_stats() -> dict[str, Any]:
+    """Admission counters and dispatch queue pressure."""
+    return admission_controller.stats()
 
-    cases = list(simulator_api._cases.values())
-    return generate_csv_pack(cases)
+
+# --- Spike Detection ---
+@app.get("/api/spikes/stats", tags=["Statistics"])
+async def get_spike_stats() -> dict[str, int]:
+    """Spike detector counters (tracked keys, events, alerts, evictions)."""
+    return spike_detector.stats()
+
+
+# --- Timeline Bridge ---
+@app.get("/api/timeline/stats", tags=["Statistics"])
+async def get_timeline_stats() -> dict[str, Any]:
+    """Timeline WebSocket fan-out counters (connections, drops, replay, bus)."""
+    return timeline_manager.stats()
 
 
 # --- Demo Reset ---
 @app.post("/api/reset", tags=["Demo"])
 async def reset_demo() -> dict[str, int]:
     """Reset all demo data."""
-    return simulator_api.reset_demo()
+    from .simulator.demo_data import derived_views
+
+    result = simulator_api.reset_demo()
+    event_json.clear()
+    derived_views.clear()
+    csv_pack_jobs.clear()
+    spike_detector.clear()
+    stats_publisher.mark_dirty()
+    return result
 
 
 # --- Galderma Scenario ---
-@app.post("/api/scenario/galderma", tags=["Demo"])
+@app.post("/api/scenario/galderma", tags=["Demo"], dependencies=[Depends(admit_write)])
 async def create_galderma_scenario() -> dict:
     """Create the Galderma demo scenario with pre-configured cases.
 
@@ -652,4 +894,5 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.environment == "development",
+        ws_per_message_deflate=settings.ws_per_message_deflate,
     )
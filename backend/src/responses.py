@@ -0,0 +1,162 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# TrackWise Simulator - JSON Responses
+# ============================================
+#
+# Response classes for the simulator API. Routes with a
+# response model are already encoded by Pydantic's Rust
+# serializer; this module covers the rest:
+#
+# - FastJSONResponse encodes plain dicts with orjson when
+#   installed (stdlib json otherwise), without FastAPI's
+#   validate-then-serialize pass over the returned value.
+# - RawJSONResponse sends bytes that are already JSON, so
+#   list routes can join per-record bytes from EncodedRecords
+#   caches (keyed like DerivedViewCache, on case version)
+#   instead of re-encoding unchanged records.
+# - /invocations embeds cases as JSON-ready dicts; those are
+#   cached the same way, so an unchanged case is dumped once.
+#
+# ============================================
+
+import json
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from types import ModuleType
+from typing import Any
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # optional: pip install galderma-trackwise-backend[fastjson]
+    orjson = None
+
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode to compact UTF-8 JSON (datetimes as ISO 8601)."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        default=lambda v: v.isoformat() if hasattr(v, "isoformat") else _default(v),
+    ).encode()
+
+
+def join_array(items: Iterable[bytes]) -> bytes:
+    """JSON array from already encoded items."""
+    return b"[" + b",".join(items) + b"]"
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with ``dumps``."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class RawJSONResponse(Response):
+    """Response whose content is already encoded JSON."""
+
+    media_type = JSON_MEDIA_TYPE
+
+
+# ============================================
+# Encoded Record Cache
+# ============================================
+class EncodedRecords:
+    """Per-record encodings, reused until the record's version changes.
+
+    Cached encodings are shared between responses and must not be
+    mutated by callers.
+    """
+
+    def __init__(self, encode: Callable[[Any], Any], max_records: int | None = None) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            encode: Turns one record into JSON bytes (or a JSON-ready dict)
+            max_records: Records kept before the oldest encoded one is
+                dropped (None: bounded by ``prune`` only)
+        """
+        self._encode = encode
+        self.max_records = max_records
+        self._records: dict[Hashable, tuple[int, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, record: Any, version: int = 0) -> Any:
+        """Encoded record, re-encoding it if its version changed.
+
+        Args:
+            key: Record identity (case_id, event_id, ...)
+            record: The record, encoded on a miss
+            version: Current record version (immutable records use 0)
+
+        Returns:
+            The record's encoding
+        """
+        cached = self._records.get(key)
+        if cached is not None and cached[0] == version:
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        encoded = self._encode(record)
+        self._records[key] = (version, encoded)
+        if self.max_records is not None and len(self._records) > self.max_records:
+            del self._records[next(iter(self._records))]
+        return encoded
+
+    def prune(self, versions: Mapping[Hashable, int]) -> None:
+        """Drop records whose key no longer exists.
+
+        Only scans when the cache holds more records than exist.
+
+        Args:
+            versions: Versions of all existing records
+        """
+        if len(self._records) > len(versions):
+            for key in [k for k in self._records if k not in versions]:
+                del self._records[key]
+
+    def clear(self) -> None:
+        """Drop every cached record."""
+        self._records.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Cache counters."""
+        return {"records": len(self._records), "hits": self.hits, "misses": self.misses}
+
+
+def _encode_model(model: BaseModel) -> bytes:
+    return model.__pydantic_serializer__.to_json(model)
+
+
+def _dump_model(model: BaseModel) -> dict[str, Any]:
+    return model.model_dump(mode="json")
+
+
+# ============================================
+# Singleton Instances
+# ============================================
+# Cases by case_id (pruned against the case versions)
+case_json = EncodedRecords(_encode_model)
+case_dicts = EncodedRecords(_dump_model)
+# Events are immutable; the oldest encodings age out
+event_json = EncodedRecords(_encode_model, max_records=20_000)
+# Runs by case_id, derived from the case version
+run_json = EncodedRecords(dumps)
@@ -24,17 +24,6 @@ from datetime import datetime
 from typing import Any
 
 from src.sac.agent_prompts import SYSTEM_PROMPT, build_generation_prompt
-from src.sac.agent_tools import (
-    assess_regulatory_impact,
-    determine_severity,
-    generate_complaint_text,
-    generate_customer_profile,
-    generate_investigation_data,
-    generate_lot_and_manufacturing,
-    get_generation_results,
-    reset_generation,
-    select_product,
-)
 from src.simulator.models import CaseCreate
 
 
@@ -76,9 +65,22 @@ def _get_or_create_agent():
         raise RuntimeError(f"Agent init previously failed: {_agent_init_error}")
 
     try:
+        # strands and src.sac.agent_tools (~0.4 s) are imported on the
+        # first agent call, not at startup: the simulator container must
+        # answer /ping quickly and most deployments never call the agent
         from strands import Agent
         from strands.models.gemini import GeminiModel
 
+        from src.sac.agent_tools import (
+            assess_regulatory_impact,
+            determine_severity,
+            generate_complaint_text,
+            generate_customer_profile,
+            generate_investigation_data,
+            generate_lot_and_manufacturing,
+            select_product,
+        )
+
         api_key = os.environ.get("GEMINI_API_KEY", "")
         if not api_key.strip():
             msg = "GEMINI_API_KEY not set"
@@ -190,6 +192,8 @@ def _run_agent_sync(prompt: str) -> dict[str, Any]:
     Raises:
         RuntimeError: If agent fails or produces no results.
     """
+    from src.sac.agent_tools import get_generation_results, reset_generation
+
     agent = _get_or_create_agent()
 
     # Clear accumulator before the new generation
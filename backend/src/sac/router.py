@@ -8,8 +8,9 @@
 #
 # ============================================
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from src.admission import admit_write
 from src.sac import service
 from src.sac.models import (
     SACConfigureRequest,
@@ -24,7 +25,9 @@ from src.simulator.api import simulator_api
 router = APIRouter(tags=["SAC"])
 
 
-@router.post("/generate", response_model=SACGenerateResponse)
+@router.post(
+    "/generate", response_model=SACGenerateResponse, dependencies=[Depends(admit_write)]
+)
 async def generate_cases(request: SACGenerateRequest) -> SACGenerateResponse:
     """Generate SAC complaint cases from templates or agent."""
     return await service.generate_cases(request, simulator_api)
@@ -0,0 +1,304 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Simulator - Columnar Case Analytics
+# ============================================
+#
+# Executive aggregates ("complaints per brand per day by
+# category") read a columnar mirror of the cases instead of
+# looping over Case objects. Each low-cardinality field is
+# dictionary-encoded into an int32 code column, timestamps
+# are int64 epoch seconds, and group-bys are a single
+# bincount over the combined codes of the selected rows.
+#
+# The mirror follows the simulator's change feed like the
+# ledger chain and memory view: one row per case, rewritten
+# in place when the case changes.
+#
+# Requires NumPy (pip install galderma-trackwise-backend[analytics]).
+#
+# ============================================
+
+from collections.abc import Mapping
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+from .models import Case
+
+
+# Typed as numpy so the column dtypes are checked; None at runtime
+# without the extra (analytics_available)
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+else:
+    try:
+        import numpy as np
+    except ImportError:  # optional: pip install galderma-trackwise-backend[analytics]
+        np = None
+
+
+# Encoded columns: API name -> Case attribute
+DIMENSIONS = {
+    "brand": "product_brand",
+    "product": "product_name",
+    "category": "category",
+    "severity": "severity",
+    "status": "status",
+    "case_type": "case_type",
+}
+
+# Time bucket widths in seconds
+BUCKETS = {"hour": 3600, "day": 86400, "week": 7 * 86400}
+
+# 1970-01-01 was a Thursday; shifts week buckets to start on Monday
+_WEEK_OFFSET = 3 * 86400
+
+# Above this many possible groups, count with np.unique instead of bincount
+_MAX_DENSE_GROUPS = 1 << 22
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def analytics_available() -> bool:
+    """Whether NumPy is installed."""
+    return np is not None
+
+
+def _epoch_seconds(value: datetime) -> int:
+    offset = value.utcoffset()
+    if offset is not None:
+        value = value.replace(tzinfo=None) - offset
+    return int((value - _EPOCH).total_seconds())
+
+
+class _Dictionary:
+    """Value <-> int code mapping for one column."""
+
+    def __init__(self) -> None:
+        self.codes: dict[Any, int] = {}
+        self.values: list[Any] = []
+
+    def encode(self, value: Any) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+# ============================================
+# Columnar Mirror
+# ============================================
+class CaseColumns:
+    """Array-backed mirror of the case fields analytics group by.
+
+    Rows are appended in chunks of doubling capacity. A deleted case's
+    row has ``alive`` cleared and is reused by the next new case; a
+    store reset rebuilds the mirror.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """Initialize an empty mirror.
+
+        Args:
+            capacity: Rows allocated up front
+        """
+        self.revision = 0
+        self._rows: dict[str, int] = {}
+        self._free: list[int] = []
+        self._size = 0
+        self._dictionaries = {name: _Dictionary() for name in DIMENSIONS}
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._codes = {name: np.zeros(capacity, dtype=np.int32) for name in DIMENSIONS}
+        self._created = np.zeros(capacity, dtype=np.int64)
+        self._alive = np.zeros(capacity, dtype=bool)
+
+    def _grow(self, needed: int) -> None:
+        size, codes, created, alive = self._capacity, self._codes, self._created, self._alive
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
+        self._allocate(capacity)
+        for name, column in codes.items():
+            self._codes[name][:size] = column
+        self._created[:size] = created
+        self._alive[:size] = alive
+
+    def sync(
+        self,
+        revision: int,
+        changed: list[Case],
+        full: bool = False,
+        existing: Mapping[str, int] | None = None,
+    ) -> None:
+        """Write the rows of cases that changed since the last sync.
+
+        Args:
+            revision: Store revision the changes bring the mirror up to
+            changed: Created or modified cases, in change order
+            full: ``changed`` is a full snapshot; the mirror is rebuilt
+            existing: IDs of all current cases, to drop deleted ones
+        """
+        if full:
+            self.clear()
+        if changed:
+            self._write(changed)
+        if existing is not None and len(self._rows) > len(existing):
+            for case_id in [c for c in self._rows if c not in existing]:
+                row = self._rows.pop(case_id)
+                self._alive[row] = False
+                self._free.append(row)
+        self.revision = revision
+
+    def _write(self, cases: list[Case]) -> None:
+        # Column at a time: C-level attribute reads and code lookups,
+        # then one vectorized store per column
+        rows = []
+        for case in cases:
+            row = self._rows.get(case.case_id)
+            if row is None:
+                if self._free:
+                    row = self._free.pop()
+                else:
+                    row = self._size
+                    self._size += 1
+                self._rows[case.case_id] = row
+            rows.append(row)
+        if self._size > self._capacity:
+            self._grow(self._size)
+        index = np.array(rows, dtype=np.int64)
+
+        for name, attribute in DIMENSIONS.items():
+            values = list(map(attrgetter(attribute), cases))
+            dictionary = self._dictionaries[name]
+            # First-seen order keeps codes (and output order) deterministic
+            for value in dict.fromkeys(values):
+                dictionary.encode(value)
+            self._codes[name][index] = list(map(dictionary.codes.__getitem__, values))
+        self._created[index] = list(map(_epoch_seconds, map(attrgetter("created_at"), cases)))
+        self._alive[index] = True
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def aggregate(
+        self,
+        group_by: list[str],
+        bucket: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        filters: Mapping[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Count cases per group.
+
+        Args:
+            group_by: Dimensions to group by, in output order
+            bucket: Also group by created_at truncated to "hour", "day"
+                or "week" (weeks start on Monday)
+            since: Only cases created at or after this time
+            until: Only cases created before this time
+            filters: Dimension -> value equality filters
+
+        Returns:
+            One {dimension: value, ..., "bucket": ISO start, "count": n}
+            dict per non-empty group, ordered by group
+
+        Raises:
+            ValueError: On an unknown dimension or bucket
+        """
+        unknown = [name for name in [*group_by, *(filters or {})] if name not in DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Unknown dimension: {unknown[0]}")
+        if bucket is not None and bucket not in BUCKETS:
+            raise ValueError(f"Unknown bucket: {bucket}")
+
+        n = self._size
+        mask = self._alive[:n].copy()
+        created = self._created[:n]
+        if since is not None:
+            mask &= created >= _epoch_seconds(since)
+        if until is not None:
+            mask &= created < _epoch_seconds(until)
+        for name, value in (filters or {}).items():
+            code = self._dictionaries[name].codes.get(value)
+            if code is None:
+                return []
+            mask &= self._codes[name][:n] == code
+
+        # int32 dictionary codes, then int64 bucket offsets
+        columns: list[NDArray[np.signedinteger[Any]]] = [
+            self._codes[name][:n][mask] for name in group_by
+        ]
+        sizes = [len(self._dictionaries[name]) for name in group_by]
+        first_bucket = 0
+        if bucket is not None:
+            width = BUCKETS[bucket]
+            offset = _WEEK_OFFSET if bucket == "week" else 0
+            buckets = (created[mask] + offset) // width
+            if buckets.size == 0:
+                return []
+            first_bucket = int(buckets.min())
+            columns.append(buckets - first_bucket)
+            sizes.append(int(buckets.max()) - first_bucket + 1)
+
+        if not columns:
+            return [{"count": int(mask.sum())}] if mask.any() else []
+        if not columns[0].size:
+            return []
+
+        keys = np.ravel_multi_index(columns, sizes)
+        groups = int(np.prod(sizes, dtype=np.int64))
+        if groups <= _MAX_DENSE_GROUPS:
+            counts = np.bincount(keys, minlength=groups)
+            present = np.flatnonzero(counts)
+            counts = counts[present]
+        else:
+            present, counts = np.unique(keys, return_counts=True)
+        codes = np.unravel_index(present, sizes)
+
+        labels = [self._dictionaries[name].values for name in group_by]
+        result = []
+        for i, count in enumerate(counts.tolist()):
+            row = {name: labels[d][codes[d][i]] for d, name in enumerate(group_by)}
+            if bucket is not None:
+                start = first_bucket + int(codes[-1][i])
+                row["bucket"] = _bucket_start(start, bucket)
+            row["count"] = count
+            result.append(row)
+        return result
+
+    def clear(self) -> None:
+        """Drop every row."""
+        self._rows.clear()
+        self._free.clear()
+        self._size = 0
+        self._alive[:] = False
+        self._dictionaries = {name: _Dictionary() for name in DIMENSIONS}
+
+    def stats(self) -> dict[str, Any]:
+        """Mirror counters."""
+        return {
+            "cases": len(self._rows),
+            "rows": self._size,
+            "free_rows": len(self._free),
+            "capacity": self._capacity,
+            "cardinality": {name: len(d) for name, d in self._dictionaries.items()},
+            "revision": self.revision,
+        }
+
+
+def _bucket_start(index: int, bucket: str) -> str:
+    offset = _WEEK_OFFSET if bucket == "week" else 0
+    start = _EPOCH + timedelta(seconds=index * BUCKETS[bucket] - offset)
+    return start.isoformat() if bucket == "hour" else start.date().isoformat()
+
+
+# Mirror served by /api/analytics/aggregate (None without NumPy)
+case_columns = CaseColumns() if np is not None else None
@@ -10,9 +10,14 @@
 
 import logging
 import random
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
 from datetime import datetime
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any
 
+from .demo_data import LedgerChain, ledger_chain, run_id_for_case
 from .models import (
     GALDERMA_PRODUCTS,
     BatchCreate,
@@ -33,10 +38,6 @@ from .models import (
 # ============================================
 # Logger
 # ============================================
-logging.basicConfig(
-    level=logging.INFO,
-    format='{"timestamp": "%(asctime)s", "service": "simulator", "level": "%(levelname)s", "message": "%(message)s"}',
-)
 logger = logging.getLogger("simulator")
 
 
@@ -109,14 +110,37 @@ class SimulatorAPI:
     def __init__(self) -> None:
         """Initialize the simulator with empty case storage."""
         self._cases: dict[str, Case] = {}
+        # Bumped on every mutation of a case; keys derived-view caches
+        self._case_versions: dict[str, int] = {}
+        # Simulated run_id -> case_id (one run per case)
+        self._run_index: dict[str, str] = {}
+        # Store-wide change counter; case_id -> revision of its last
+        # change, kept in change order so recent changes are cheap to find
+        self._revision = 0
+        self._changed_at: dict[str, int] = {}
+        self._reset_revision = 0
         self._events: list[EventEnvelope] = []
         self._event_callback: Callable[..., None] | None = None
+        self._event_listeners: list[Callable[[EventEnvelope], None]] = []
+        # Open transaction: case_id -> (state, version) before its first
+        # change (state None if created inside), and events held back
+        self._journal: dict[str, tuple[Case | None, int]] | None = None
+        self._held_events: list[EventEnvelope] = []
         logger.info("TrackWise Simulator initialized")
 
     def set_event_callback(self, callback: Callable[..., None]) -> None:
         """Set callback function to be called when events are emitted."""
         self._event_callback = callback
 
+    def add_event_listener(self, listener: Callable[[EventEnvelope], None]) -> None:
+        """Register an additional event listener (e.g. the UI timeline).
+
+        Listeners must not block: they run inline with the operation
+        that emitted the event.
+        """
+        if listener not in self._event_listeners:
+            self._event_listeners.append(listener)
+
     # ============================================
     # Case Operations
     # ============================================
@@ -136,7 +160,10 @@ class SimulatorAPI:
         case_fields = case_data.model_dump(exclude_none=True)
         case = Case(**case_fields)
 
+        self._journal_case(case.case_id)
         self._cases[case.case_id] = case
+        self._run_index[run_id_for_case(case.case_id)] = case.case_id
+        self._touch(case.case_id)
         logger.info(f"Case created: {case.case_id}")
 
         # Emit event
@@ -161,6 +188,59 @@ class SimulatorAPI:
         """
         return self._cases.get(case_id)
 
+    def get_case_by_run_id(self, run_id: str) -> Case | None:
+        """Get the case a simulated run belongs to.
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            Case if the run exists, None otherwise
+        """
+        case_id = self._run_index.get(run_id)
+        return self._cases.get(case_id) if case_id else None
+
+    def get_case_versions(self) -> Mapping[str, int]:
+        """Read-only view of every case's version.
+
+        A case's version changes whenever the case is created, updated
+        or closed, so derived data can be cached until then.
+
+        Returns:
+            Live mapping of case_id to version
+        """
+        return MappingProxyType(self._case_versions)
+
+    def get_changes_since(self, revision: int) -> tuple[int, list[Case], bool]:
+        """Get the cases created or modified after a store revision.
+
+        Args:
+            revision: Revision returned by a previous call (0 initially)
+
+        Returns:
+            Tuple of (current revision, changed cases in change order,
+            full). ``full`` is True when the store was reset after
+            ``revision``; the list then holds every current case and
+            replaces anything derived earlier.
+        """
+        if revision < self._reset_revision:
+            return self._revision, list(self._cases.values()), True
+
+        changed: list[Case] = []
+        for case_id in reversed(self._changed_at):
+            if self._changed_at[case_id] <= revision:
+                break
+            changed.append(self._cases[case_id])
+        changed.reverse()
+        return self._revision, changed, False
+
+    def _touch(self, case_id: str) -> None:
+        """Advance a case's version after a mutation."""
+        self._case_versions[case_id] = self._case_versions.get(case_id, 0) + 1
+        self._revision += 1
+        self._changed_at.pop(case_id, None)
+        self._changed_at[case_id] = self._revision
+
     def update_case(
         self, case_id: str, update_data: CaseUpdate
     ) -> tuple[Case | None, EventEnvelope | None]:
@@ -178,6 +258,7 @@ class SimulatorAPI:
             logger.warning(f"Case not found: {case_id}")
             return None, None
 
+        self._journal_case(case_id)
         previous_status = case.status
 
         # Apply updates
@@ -193,6 +274,7 @@ class SimulatorAPI:
             case.closed_at = datetime.utcnow()
 
         self._cases[case_id] = case
+        self._touch(case_id)
         logger.info(f"Case updated: {case_id}")
 
         # Emit event
@@ -233,6 +315,7 @@ class SimulatorAPI:
             logger.warning(f"Case not found: {case_id}")
             return None, None
 
+        self._journal_case(case_id)
         previous_status = case.status
         case.status = CaseStatus.CLOSED
         case.resolution_text = resolution_text
@@ -245,6 +328,7 @@ class SimulatorAPI:
         case.closed_at = datetime.utcnow()
 
         self._cases[case_id] = case
+        self._touch(case_id)
         logger.info(f"Case closed: {case_id}")
 
         # Emit appropriate event
@@ -296,7 +380,7 @@ class SimulatorAPI:
             cases = [c for c in cases if c.case_type == case_type]
 
         # Sort by created_at descending
-        cases.sort(key=lambda c: c.created_at, reverse=True)
+        cases.sort(key=attrgetter("created_at"), reverse=True)
 
         total = len(cases)
 
@@ -312,6 +396,38 @@ class SimulatorAPI:
             page_size=page_size,
         )
 
+    def iter_cases(
+        self,
+        status: CaseStatus | None = None,
+        severity: CaseSeverity | None = None,
+        case_type: CaseType | None = None,
+    ) -> Iterator[Case]:
+        """Iterate cases in creation order, filtered like ``list_cases``.
+
+        Only the case IDs present when iteration starts are captured, so
+        the store can change between steps: cases deleted meanwhile are
+        skipped and cases created meanwhile are not included.
+
+        Args:
+            status: Filter by status
+            severity: Filter by severity
+            case_type: Filter by type
+
+        Yields:
+            Matching cases
+        """
+        for case_id in tuple(self._cases):
+            case = self._cases.get(case_id)
+            if case is None:
+                continue
+            if status and case.status != status:
+                continue
+            if severity and case.severity != severity:
+                continue
+            if case_type and case.case_type != case_type:
+                continue
+            yield case
+
     def delete_case(self, case_id: str) -> bool:
         """Delete a case (for demo reset only).
 
@@ -322,7 +438,11 @@ class SimulatorAPI:
             True if deleted, False if not found
         """
         if case_id in self._cases:
+            self._journal_case(case_id)
             del self._cases[case_id]
+            self._case_versions.pop(case_id, None)
+            self._run_index.pop(run_id_for_case(case_id), None)
+            self._changed_at.pop(case_id, None)
             logger.info(f"Case deleted: {case_id}")
             return True
         return False
@@ -458,6 +578,11 @@ class SimulatorAPI:
         events_cleared = len(self._events)
 
         self._cases.clear()
+        self._case_versions.clear()
+        self._run_index.clear()
+        self._changed_at.clear()
+        self._revision += 1
+        self._reset_revision = self._revision
         self._events.clear()
 
         logger.info(f"Demo reset: {cases_cleared} cases, {events_cleared} events cleared")
@@ -780,6 +905,68 @@ class SimulatorAPI:
             "description": "3 recurring (CLOSED) + 1 non-recurring (PENDING_REVIEW) + 1 linked pair (CLOSED)",
         }
 
+    # ============================================
+    # Transactions
+    # ============================================
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Apply the case operations in the block all-or-nothing.
+
+        Each case is journaled before its first change and emitted
+        events are held back from the callback and listeners. On a
+        clean exit the held events are delivered; if the block raises,
+        journaled cases are restored, cases created inside are removed,
+        the held events are dropped from the log and the exception
+        propagates.
+
+        The block must not await: other requests would see, and could
+        interleave with, uncommitted state.
+
+        Raises:
+            RuntimeError: If a transaction is already open
+        """
+        if self._journal is not None:
+            raise RuntimeError("Transaction already open")
+        self._journal = {}
+        events_before = len(self._events)
+        try:
+            yield
+        except BaseException:
+            self._rollback(events_before)
+            raise
+        else:
+            held = self._held_events
+            self._journal, self._held_events = None, []
+            for event in held:
+                self._notify(event)
+        finally:
+            self._journal, self._held_events = None, []
+
+    def _journal_case(self, case_id: str) -> None:
+        """Record a case's state before its first change in a transaction."""
+        if self._journal is None or case_id in self._journal:
+            return
+        case = self._cases.get(case_id)
+        self._journal[case_id] = (
+            case.model_copy(deep=True) if case else None,
+            self._case_versions.get(case_id, 0),
+        )
+
+    def _rollback(self, events_before: int) -> None:
+        journal, self._journal = self._journal or {}, None
+        for case_id, (previous, version) in journal.items():
+            if previous is None:
+                self.delete_case(case_id)
+                continue
+            self._cases[case_id] = previous
+            self._run_index[run_id_for_case(case_id)] = case_id
+            # Newer than any version seen so far, so derived views and
+            # caches re-read the restored case
+            self._case_versions[case_id] = max(self._case_versions.get(case_id, 0), version)
+            self._touch(case_id)
+        del self._events[events_before:]
+        logger.info(f"Transaction rolled back: {len(journal)} cases restored")
+
     # ============================================
     # Event Management
     # ============================================
@@ -801,6 +988,14 @@ class SimulatorAPI:
         self._events.append(event)
         logger.info(f"Event emitted: {event_type.value} - {event.event_id}")
 
+        if self._journal is not None:
+            self._held_events.append(event)
+        else:
+            self._notify(event)
+        return event
+
+    def _notify(self, event: EventEnvelope) -> None:
+        """Deliver an event to the callback and listeners."""
         # Call callback if set (for A2A integration)
         if self._event_callback:
             try:
@@ -808,7 +1003,11 @@ class SimulatorAPI:
             except Exception as e:
                 logger.error(f"Event callback failed: {e}")
 
-        return event
+        for listener in self._event_listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.error(f"Event listener failed: {e}")
 
     def get_events(
         self, limit: int = 100, event_type: EventType | None = None
@@ -827,10 +1026,32 @@ class SimulatorAPI:
         if event_type:
             events = [e for e in events if e.event_type == event_type]
 
-        events.sort(key=lambda e: e.timestamp, reverse=True)
+        events.sort(key=attrgetter("timestamp"), reverse=True)
 
         return events[:limit]
 
+    def iter_events(self, event_type: EventType | None = None) -> Iterator[EventEnvelope]:
+        """Iterate events in emission order, filtered like ``get_events``.
+
+        Events are append-only, so this walks the log by position without
+        copying it and stops at the events present when iteration
+        started (or early, if the demo is reset meanwhile).
+
+        Args:
+            event_type: Filter by event type
+
+        Yields:
+            Matching events
+        """
+        events = self._events
+        for i in range(len(events)):
+            if i >= len(events):
+                return
+            event = events[i]
+            if event_type and event.event_type != event_type:
+                continue
+            yield event
+
     # ============================================
     # Statistics
     # ============================================
@@ -857,8 +1078,50 @@ class SimulatorAPI:
             "total_events": len(self._events),
         }
 
+    def get_executive_stats(self) -> dict[str, Any]:
+        """Executive dashboard metrics for the demo.
+
+        Returns:
+            ai_closed_count: Number of cases closed by AI agents
+            human_hours_saved: Estimated human hours saved (15 min per case)
+            risks_avoided: Number of compliance risks caught
+        """
+        cases = list(self._cases.values())
+        closed_cases = [c for c in cases if c.status == CaseStatus.CLOSED]
+
+        # Cases closed by AI = cases with processed_by_agent set, or all closed for demo
+        ai_closed = [c for c in closed_cases if c.processed_by_agent] or closed_cases
+        ai_closed_count = len(ai_closed)
+
+        # Estimated 15 minutes per case for human processing
+        human_hours_saved = round(ai_closed_count * 15 / 60, 1)
+
+        # Risks avoided = compliance checks that blocked or escalated
+        # For demo, count HIGH/CRITICAL cases that were properly escalated
+        risks_avoided = len([
+            c for c in cases
+            if c.severity in (CaseSeverity.HIGH, CaseSeverity.CRITICAL)
+        ])
+
+        return {
+            "ai_closed_count": ai_closed_count,
+            "human_hours_saved": human_hours_saved,
+            "risks_avoided": risks_avoided,
+            "total_cases": len(cases),
+            "open_cases": len([c for c in cases if c.status == CaseStatus.OPEN]),
+            "closed_cases": len(closed_cases),
+        }
+
 
 # ============================================
 # Singleton Instance
 # ============================================
 simulator_api = SimulatorAPI()
+
+
+def synced_ledger() -> LedgerChain:
+    """The shared ledger chain, caught up with ``simulator_api``."""
+    # Append entries for cases that changed since the last read
+    revision, changed, full = simulator_api.get_changes_since(ledger_chain.revision)
+    ledger_chain.sync(revision, changed, full)
+    return ledger_chain
@@ -11,10 +11,24 @@
 #
 # ============================================
 
+import bisect
 import hashlib
+from collections import Counter
+from collections.abc import Callable, Iterator, Mapping
 from datetime import datetime, timedelta
+from itertools import islice
 from typing import Any
 
+from .merkle import (
+    CHECKPOINT_SIZE,
+    SegmentJob,
+    build_levels,
+    entry_hash_for,
+    inclusion_proof,
+    leaf_hash,
+    root_from_proof,
+    verify_segments,
+)
 from .models import Case, CaseSeverity, CaseStatus, CaseType
 
 
@@ -53,12 +67,24 @@ MODEL_MAP = {
 }
 
 
+# Previous hash of the first entry in a chain
+GENESIS_HASH = "0" * 64
+
+# Ledger fields with a secondary index in LedgerChain
+LEDGER_INDEX_FIELDS = ("case_id", "run_id", "agent_name")
+
+
 def _deterministic_id(seed: str, prefix: str = "") -> str:
     """Generate a deterministic ID from a seed string."""
     h = hashlib.md5(seed.encode()).hexdigest()[:12]
     return f"{prefix}{h}"
 
 
+def run_id_for_case(case_id: str) -> str:
+    """Deterministic run ID of a case's (single) simulated run."""
+    return _deterministic_id(case_id, "run-")
+
+
 def _time_offset(base: datetime, minutes: float) -> str:
     """Return ISO string offset from base time."""
     return (base + timedelta(minutes=minutes)).isoformat() + "Z"
@@ -67,95 +93,141 @@ def _time_offset(base: datetime, minutes: float) -> str:
 def generate_runs_for_cases(
     cases: list[Case],
     status_filter: str | None = None,
+    versions: Mapping[str, int] | None = None,
 ) -> list[dict[str, Any]]:
-    """Generate simulated run data for a list of cases."""
+    """Generate simulated run data for a list of cases.
+
+    Args:
+        cases: Cases to derive runs from
+        status_filter: Only return runs with this status
+        versions: Case versions (see ``SimulatorAPI.get_case_versions``);
+            when given, runs are served from ``derived_views`` and only
+            regenerated for cases whose version changed
+
+    Returns:
+        Runs sorted by start time, newest first
+    """
     runs: list[dict[str, Any]] = []
 
     for case in cases:
-        run_id = _deterministic_id(case.case_id, "run-")
-        base_time = case.created_at + timedelta(seconds=2)
-
-        # Determine run status based on case status
-        if case.status == CaseStatus.CLOSED:
-            run_status = "COMPLETED"
-            duration_ms = 12400
-        elif case.status == CaseStatus.IN_PROGRESS:
-            run_status = "RUNNING"
-            duration_ms = None
-        elif case.status == CaseStatus.PENDING_REVIEW:
-            run_status = "PENDING_REVIEW"
-            duration_ms = None
-        else:
-            run_status = "RUNNING"
-            duration_ms = None
+        version = None if versions is None else versions.get(case.case_id, 0)
+        run = generate_run_for_case(case, version)
 
-        if status_filter and run_status != status_filter:
+        if status_filter and run["status"] != status_filter:
             continue
-
-        # Determine which agents were invoked
-        if case.status == CaseStatus.CLOSED:
-            agents = list(AGENT_PIPELINE)
-            if case.case_type == CaseType.INQUIRY and case.linked_case_id:
-                agents.insert(3, "inquiry_bridge")
-        elif case.status in (CaseStatus.IN_PROGRESS, CaseStatus.PENDING_REVIEW):
-            agents = AGENT_PIPELINE[:3]
-        else:
-            agents = AGENT_PIPELINE[:1]
-
-        # Generate agent steps
-        agent_steps = []
-        step_time = 0.0
-        for i, agent in enumerate(agents):
-            step_duration = 1.2 + (i * 0.8)
-            step = {
-                "step_number": i + 1,
-                "agent_name": agent,
-                "step_type": _get_step_type(agent),
-                "input_summary": _get_input_summary(agent, case),
-                "output_summary": _get_output_summary(agent, case),
-                "reasoning": _get_reasoning(agent, case),
-                "tools_called": _get_tools_called(agent),
-                "started_at": _time_offset(base_time, step_time),
-                "completed_at": _time_offset(base_time, step_time + step_duration),
-                "duration_ms": int(step_duration * 1000),
-                "tokens_used": 350 + (i * 180),
-                "model_id": MODEL_MAP.get(agent, "gemini-3-pro"),
-            }
-            agent_steps.append(step)
-            step_time += step_duration + 0.3
-
-        run = {
-            "run_id": run_id,
-            "case_id": case.case_id,
-            "status": run_status,
-            "mode": "ACT",
-            "trigger": "CaseCreated",
-            "started_at": _time_offset(base_time, 0),
-            "completed_at": _time_offset(base_time, step_time) if run_status == "COMPLETED" else None,
-            "duration_ms": duration_ms,
-            "agents_invoked": agents,
-            "agent_steps": agent_steps,
-            "result": "Caso fechado automaticamente com sucesso" if run_status == "COMPLETED" else None,
-            "error": None,
-        }
         runs.append(run)
 
+    if versions is not None:
+        derived_views.prune(versions)
     runs.sort(key=lambda r: r["started_at"], reverse=True)
     return runs
 
 
+def generate_run_for_case(case: Case, version: int | None = None) -> dict[str, Any]:
+    """Generate the simulated run for one case.
+
+    Args:
+        case: Case to derive the run from
+        version: Current case version; when given, the run is served
+            from ``derived_views``
+
+    Returns:
+        The run record
+    """
+    if version is None:
+        return _generate_case_run(case)
+    return derived_views.run(case, version)
+
+
+def _generate_case_run(case: Case) -> dict[str, Any]:
+    """Generate the simulated run for a single case."""
+    run_id = run_id_for_case(case.case_id)
+    base_time = case.created_at + timedelta(seconds=2)
+
+    # Determine run status based on case status
+    if case.status == CaseStatus.CLOSED:
+        run_status = "COMPLETED"
+        duration_ms = 12400
+    elif case.status == CaseStatus.IN_PROGRESS:
+        run_status = "RUNNING"
+        duration_ms = None
+    elif case.status == CaseStatus.PENDING_REVIEW:
+        run_status = "PENDING_REVIEW"
+        duration_ms = None
+    else:
+        run_status = "RUNNING"
+        duration_ms = None
+
+    # Determine which agents were invoked
+    if case.status == CaseStatus.CLOSED:
+        agents = list(AGENT_PIPELINE)
+        if case.case_type == CaseType.INQUIRY and case.linked_case_id:
+            agents.insert(3, "inquiry_bridge")
+    elif case.status in (CaseStatus.IN_PROGRESS, CaseStatus.PENDING_REVIEW):
+        agents = AGENT_PIPELINE[:3]
+    else:
+        agents = AGENT_PIPELINE[:1]
+
+    # Generate agent steps
+    agent_steps = []
+    step_time = 0.0
+    for i, agent in enumerate(agents):
+        step_duration = 1.2 + (i * 0.8)
+        step = {
+            "step_number": i + 1,
+            "agent_name": agent,
+            "step_type": _get_step_type(agent),
+            "input_summary": _get_input_summary(agent, case),
+            "output_summary": _get_output_summary(agent, case),
+            "reasoning": _get_reasoning(agent, case),
+            "tools_called": _get_tools_called(agent),
+            "started_at": _time_offset(base_time, step_time),
+            "completed_at": _time_offset(base_time, step_time + step_duration),
+            "duration_ms": int(step_duration * 1000),
+            "tokens_used": 350 + (i * 180),
+            "model_id": MODEL_MAP.get(agent, "gemini-3-pro"),
+        }
+        agent_steps.append(step)
+        step_time += step_duration + 0.3
+
+    run = {
+        "run_id": run_id,
+        "case_id": case.case_id,
+        "status": run_status,
+        "mode": "ACT",
+        "trigger": "CaseCreated",
+        "started_at": _time_offset(base_time, 0),
+        "completed_at": _time_offset(base_time, step_time) if run_status == "COMPLETED" else None,
+        "duration_ms": duration_ms,
+        "agents_invoked": agents,
+        "agent_steps": agent_steps,
+        "result": "Caso fechado automaticamente com sucesso" if run_status == "COMPLETED" else None,
+        "error": None,
+    }
+    return run
+
+
 def generate_ledger_for_cases(
     cases: list[Case],
     agent_filter: str | None = None,
 ) -> list[dict[str, Any]]:
-    """Generate simulated ledger entries for a list of cases."""
+    """Generate simulated ledger entries for a list of cases.
+
+    Builds a fresh chain on every call; the API serves the persisted
+    ``ledger_chain`` instead.
+    """
     entries: list[dict[str, Any]] = []
-    prev_hash = "0" * 64
+    prev_hash = GENESIS_HASH
 
     for case in cases:
-        run_id = _deterministic_id(case.case_id, "run-")
+        run_id = run_id_for_case(case.case_id)
         base_time = case.created_at + timedelta(seconds=3)
-        case_entries = _generate_case_ledger(case, run_id, base_time, prev_hash)
+        case_entries = _generate_case_ledger(case, run_id, base_time)
+        chained = prev_hash
+        for entry in case_entries:
+            entry["entry_hash"] = entry_hash_for(entry["ledger_id"], chained)
+            entry["previous_hash"] = chained
+            chained = entry["entry_hash"]
 
         if agent_filter:
             case_entries = [e for e in case_entries if e["agent_name"] == agent_filter]
@@ -172,15 +244,17 @@ def _generate_case_ledger(
     case: Case,
     run_id: str,
     base_time: datetime,
-    prev_hash: str,
 ) -> list[dict[str, Any]]:
-    """Generate ledger entries for a single case."""
+    """Generate the ledger entries of a single case, not yet chained.
+
+    Callers set ``entry_hash`` and ``previous_hash``, so entries that
+    are already chained are never hashed again.
+    """
     entries: list[dict[str, Any]] = []
     t = 0.0
 
     # 1. Case Analyzed (Case Understanding)
     entry_id = _deterministic_id(f"{case.case_id}-analyzed", "led-")
-    entry_hash = hashlib.sha256(f"{entry_id}{prev_hash}".encode()).hexdigest()
     entries.append({
         "ledger_id": entry_id,
         "run_id": run_id,
@@ -202,10 +276,7 @@ def _generate_case_ledger(
         "model_id": "gemini-3-pro",
         "tokens_used": 420,
         "latency_ms": 1200,
-        "entry_hash": entry_hash,
-        "previous_hash": prev_hash,
     })
-    prev_hash = entry_hash
     t += 2.0
 
     # 2. Pattern Matched (Recurring Detector)
@@ -213,7 +284,6 @@ def _generate_case_ledger(
     pattern_id = case.recurring_pattern_id or "PKG-SEAL-001"
     match_confidence = case.ai_confidence or 0.94
     entry_id = _deterministic_id(f"{case.case_id}-pattern", "led-")
-    entry_hash = hashlib.sha256(f"{entry_id}{prev_hash}".encode()).hexdigest()
     entries.append({
         "ledger_id": entry_id,
         "run_id": run_id,
@@ -246,10 +316,7 @@ def _generate_case_ledger(
         "latency_ms": 1800,
         "memory_strategy": "RecurringPatterns",
         "memory_pattern_id": pattern_id if is_recurring else None,
-        "entry_hash": entry_hash,
-        "previous_hash": prev_hash,
     })
-    prev_hash = entry_hash
     t += 2.5
 
     # Only continue pipeline for cases that were processed further
@@ -257,7 +324,6 @@ def _generate_case_ledger(
         if not is_recurring:
             # Add human review request for non-recurring
             entry_id = _deterministic_id(f"{case.case_id}-hil", "led-")
-            entry_hash = hashlib.sha256(f"{entry_id}{prev_hash}".encode()).hexdigest()
             entries.append({
                 "ledger_id": entry_id,
                 "run_id": run_id,
@@ -277,14 +343,11 @@ def _generate_case_ledger(
                 "tokens_used": 650,
                 "latency_ms": 2800,
                 "requires_human_action": True,
-                "entry_hash": entry_hash,
-                "previous_hash": prev_hash,
             })
         return entries
 
     # 3. Compliance Checked (Guardian)
     entry_id = _deterministic_id(f"{case.case_id}-compliance", "led-")
-    entry_hash = hashlib.sha256(f"{entry_id}{prev_hash}".encode()).hexdigest()
     severity_pass = case.severity in ("LOW", "MEDIUM")
     entries.append({
         "ledger_id": entry_id,
@@ -313,16 +376,12 @@ def _generate_case_ledger(
         "model_id": "gemini-3-pro",
         "tokens_used": 780,
         "latency_ms": 3200,
-        "entry_hash": entry_hash,
-        "previous_hash": prev_hash,
     })
-    prev_hash = entry_hash
     t += 3.0
 
     # 3.5. Inquiry Bridge (for inquiries with linked complaint)
     if case.case_type == CaseType.INQUIRY and case.linked_case_id:
         entry_id = _deterministic_id(f"{case.case_id}-inquiry-bridge", "led-")
-        entry_hash = hashlib.sha256(f"{entry_id}{prev_hash}".encode()).hexdigest()
         entries.append({
             "ledger_id": entry_id,
             "run_id": run_id,
@@ -349,15 +408,11 @@ def _generate_case_ledger(
             "tokens_used": 320,
             "latency_ms": 1100,
             "linked_case_id": case.linked_case_id,
-            "entry_hash": entry_hash,
-            "previous_hash": prev_hash,
         })
-        prev_hash = entry_hash
         t += 2.0
 
     # 4. Resolution Generated (Composer)
     entry_id = _deterministic_id(f"{case.case_id}-resolution", "led-")
-    entry_hash = hashlib.sha256(f"{entry_id}{prev_hash}".encode()).hexdigest()
     entries.append({
         "ledger_id": entry_id,
         "run_id": run_id,
@@ -381,15 +436,11 @@ def _generate_case_ledger(
         "tokens_used": 1200,
         "latency_ms": 4500,
         "memory_strategy": "ResolutionTemplates",
-        "entry_hash": entry_hash,
-        "previous_hash": prev_hash,
     })
-    prev_hash = entry_hash
     t += 3.5
 
     # 5. Writeback Executed
     entry_id = _deterministic_id(f"{case.case_id}-writeback", "led-")
-    entry_hash = hashlib.sha256(f"{entry_id}{prev_hash}".encode()).hexdigest()
     entries.append({
         "ledger_id": entry_id,
         "run_id": run_id,
@@ -418,13 +469,457 @@ def _generate_case_ledger(
         "model_id": "gemini-3-pro",
         "tokens_used": 280,
         "latency_ms": 800,
-        "entry_hash": entry_hash,
-        "previous_hash": prev_hash,
     })
 
     return entries
 
 
+# ============================================
+# Derived View Cache
+# ============================================
+class DerivedViewCache:
+    """Memoized per-case run records.
+
+    Records are keyed on the case version, so polling /api/runs only
+    regenerates cases that changed since the last request. Cached
+    records are shared between responses and must not be mutated by
+    callers.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._runs: dict[str, tuple[int, dict[str, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def run(self, case: Case, version: int) -> dict[str, Any]:
+        """Get the run for a case, regenerating it if the case changed.
+
+        Args:
+            case: Case to derive the run from
+            version: Current version of the case
+
+        Returns:
+            The run record
+        """
+        cached = self._runs.get(case.case_id)
+        if cached is not None and cached[0] == version:
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        run = _generate_case_run(case)
+        self._runs[case.case_id] = (version, run)
+        return run
+
+    def prune(self, versions: Mapping[str, int]) -> None:
+        """Drop records of cases that no longer exist.
+
+        Only scans when the cache holds more cases than exist, so the
+        steady-state cost is O(1).
+
+        Args:
+            versions: Versions of all existing cases
+        """
+        if len(self._runs) > len(versions):
+            for case_id in [c for c in self._runs if c not in versions]:
+                del self._runs[case_id]
+
+    def clear(self) -> None:
+        """Drop every cached record."""
+        self._runs.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Cache counters."""
+        return {
+            "cached_runs": len(self._runs),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Shared by the /api/runs endpoints
+derived_views = DerivedViewCache()
+
+
+# ============================================
+# Persisted Ledger Chain
+# ============================================
+class LedgerChain:
+    """Append-only ledger hash chain, synced incrementally from cases.
+
+    Each sync appends only the entries a changed case has not written
+    yet, linked to the stored tail hash; stored entries and hashes are
+    never recomputed. Reads are views over the stored chain, so
+    filtering does not change which entries are chained.
+
+    Entries are also indexed by case, run and agent. A filtered read
+    walks the smallest matching index newest-first and stops at
+    ``limit``, and a cursor (the chain position of the last entry
+    read) resumes it by bisection instead of rescanning earlier pages.
+
+    Every ``checkpoint_size`` entries the chain seals a Merkle
+    checkpoint (see merkle.py), so single entries can be proven
+    against one root without rehashing the chain.
+    """
+
+    def __init__(self, checkpoint_size: int = CHECKPOINT_SIZE) -> None:
+        """Initialize an empty chain.
+
+        Args:
+            checkpoint_size: Entries per sealed Merkle segment
+        """
+        self.checkpoint_size = checkpoint_size
+        self._chain: list[dict[str, Any]] = []
+        # Same entries ordered by timestamp, for newest-first reads
+        self._by_time: list[dict[str, Any]] = []
+        # ledger_id -> position in _chain
+        self._positions: dict[str, int] = {}
+        # field -> value -> entries in _by_time order
+        self._index: dict[str, dict[str, list[dict[str, Any]]]] = {
+            field: {} for field in LEDGER_INDEX_FIELDS
+        }
+        self._tail_hash = GENESIS_HASH
+        self.revision = 0
+        self._resets = 0
+        self._checkpoints: list[dict[str, Any]] = []
+        self._segment_levels: list[list[list[bytes]]] = []
+        self._top_levels: list[list[bytes]] = []
+
+    def sync(self, revision: int, changed: list[Case], full: bool = False) -> int:
+        """Append the entries of cases that changed since the last sync.
+
+        Args:
+            revision: Store revision the changes bring the chain up to
+            changed: Created or modified cases, in change order
+            full: ``changed`` is a full snapshot after a store reset;
+                the chain is rebuilt from it
+
+        Returns:
+            Number of entries appended
+        """
+        if full:
+            self.clear()
+        before = len(self._chain)
+        for case in changed:
+            self._append_case(case)
+        self.revision = revision
+        return len(self._chain) - before
+
+    def _append_case(self, case: Case) -> None:
+        run_id = run_id_for_case(case.case_id)
+        base_time = case.created_at + timedelta(seconds=3)
+        for entry in _generate_case_ledger(case, run_id, base_time):
+            if entry["ledger_id"] in self._positions:
+                continue
+            entry["entry_hash"] = entry_hash_for(entry["ledger_id"], self._tail_hash)
+            entry["previous_hash"] = self._tail_hash
+            self._tail_hash = entry["entry_hash"]
+            self._positions[entry["ledger_id"]] = len(self._chain)
+            self._chain.append(entry)
+            order = self._order_key(entry)
+            self._insort(self._by_time, entry, order)
+            for field in LEDGER_INDEX_FIELDS:
+                self._insort(self._index[field].setdefault(entry[field], []), entry, order)
+            if len(self._chain) % self.checkpoint_size == 0:
+                self._seal()
+
+    def _seal(self) -> None:
+        """Checkpoint the segment that just filled up."""
+        start = len(self._checkpoints) * self.checkpoint_size
+        segment = self._chain[start : start + self.checkpoint_size]
+        levels = build_levels([leaf_hash(e["entry_hash"]) for e in segment])
+        self._segment_levels.append(levels)
+        self._top_levels = build_levels([lv[-1][0] for lv in self._segment_levels])
+        self._checkpoints.append({
+            "checkpoint": len(self._checkpoints),
+            "start": start,
+            "end": start + len(segment) - 1,
+            "segment_root": levels[-1][0].hex(),
+            # Root over checkpoints 0..n, what an auditor pins
+            "root": self._top_levels[-1][0].hex(),
+            "tail_hash": segment[-1]["entry_hash"],
+        })
+
+    def _order_key(self, entry: dict[str, Any]) -> tuple[str, int]:
+        """Read order: by timestamp, earlier-chained first among equals once reversed."""
+        return entry["timestamp"], -self._positions[entry["ledger_id"]]
+
+    def _insort(self, entries: list[dict[str, Any]], entry: dict[str, Any], order: tuple) -> None:
+        # New entries are usually the newest, so try a plain append first
+        if not entries or self._order_key(entries[-1]) < order:
+            entries.append(entry)
+        else:
+            bisect.insort(entries, entry, key=self._order_key)
+
+    def iter_entries(
+        self,
+        case_id: str | None = None,
+        run_id: str | None = None,
+        agent_name: str | None = None,
+        before: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate stored entries newest first, reading only what is consumed.
+
+        Args:
+            case_id: Only entries of this case
+            run_id: Only entries of this run
+            agent_name: Only entries written by this agent
+            before: Chain position of the last entry already read; only
+                entries after it in read order are returned
+
+        Yields:
+            Matching entries (shared; callers must not mutate them)
+        """
+        filters = [
+            (field, value)
+            for field, value in zip(LEDGER_INDEX_FIELDS, (case_id, run_id, agent_name), strict=True)
+            if value
+        ]
+        candidates = self._by_time
+        for field, value in filters:
+            bucket = self._index[field].get(value, [])
+            if len(bucket) < len(candidates):
+                candidates = bucket
+
+        end = len(candidates)
+        if before is not None:
+            end = bisect.bisect_left(
+                candidates, self._order_key(self._chain[before]), key=self._order_key
+            )
+        for i in range(end - 1, -1, -1):
+            entry = candidates[i]
+            if all(entry[field] == value for field, value in filters):
+                yield entry
+
+    def entries(
+        self,
+        case_id: str | None = None,
+        run_id: str | None = None,
+        agent_name: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Read stored entries, newest first.
+
+        Args:
+            case_id: Only entries of this case
+            run_id: Only entries of this run
+            agent_name: Only entries written by this agent
+            limit: Maximum number of entries
+
+        Returns:
+            Matching entries (shared; callers must not mutate them)
+        """
+        return list(islice(self.iter_entries(case_id, run_id, agent_name), limit))
+
+    def page(
+        self,
+        case_id: str | None = None,
+        run_id: str | None = None,
+        agent_name: str | None = None,
+        limit: int = 100,
+        cursor: int | None = None,
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        """Read one page of entries, newest first.
+
+        Args:
+            case_id: Only entries of this case
+            run_id: Only entries of this run
+            agent_name: Only entries written by this agent
+            limit: Page size
+            cursor: ``next_cursor`` of the previous page (None for the first)
+
+        Returns:
+            Tuple of (entries, next_cursor); next_cursor is None on the
+            last page
+
+        Raises:
+            ValueError: If the cursor is not a position in the chain
+        """
+        if cursor is not None and not 0 <= cursor < len(self._chain):
+            raise ValueError(f"Invalid cursor: {cursor}")
+        entries = list(islice(self.iter_entries(case_id, run_id, agent_name, cursor), limit + 1))
+        if len(entries) <= limit:
+            return entries, None
+        entries.pop()
+        return entries, self._positions[entries[-1]["ledger_id"]]
+
+    def iter_pages(
+        self,
+        case_id: str | None = None,
+        run_id: str | None = None,
+        agent_name: str | None = None,
+        page_size: int = 500,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate entries newest first, one cursor page at a time.
+
+        Unlike ``iter_entries`` this is safe to suspend while the chain
+        grows: each page resumes from the previous cursor, so entries
+        appended meanwhile never shift or repeat what was already read.
+        Iteration stops if the chain is reset.
+
+        Args:
+            case_id: Only entries of this case
+            run_id: Only entries of this run
+            agent_name: Only entries written by this agent
+            page_size: Entries fetched per page
+
+        Yields:
+            Matching entries (shared; callers must not mutate them)
+        """
+        cursor = None
+        resets = self._resets
+        while resets == self._resets:
+            entries, cursor = self.page(case_id, run_id, agent_name, page_size, cursor)
+            yield from entries
+            if cursor is None:
+                return
+
+    # ----- verification -----
+    def __len__(self) -> int:
+        return len(self._chain)
+
+    @property
+    def root(self) -> str | None:
+        """Merkle root over all sealed checkpoints (None before the first)."""
+        return self._top_levels[-1][0].hex() if self._top_levels else None
+
+    def checkpoints(self) -> list[dict[str, Any]]:
+        """Sealed checkpoints, oldest first."""
+        return [dict(c) for c in self._checkpoints]
+
+    def proof(self, index: int) -> list[dict[str, str]] | None:
+        """Inclusion proof of one entry against ``root``.
+
+        Args:
+            index: Position of the entry in the chain
+
+        Returns:
+            Sibling path (segment, then checkpoints), or None while the
+            entry's segment is not sealed yet
+        """
+        checkpoint, offset = divmod(index, self.checkpoint_size)
+        if checkpoint >= len(self._checkpoints):
+            return None
+        return (
+            inclusion_proof(self._segment_levels[checkpoint], offset)
+            + inclusion_proof(self._top_levels, checkpoint)
+        )
+
+    def verify_range(self, start: int, end: int) -> dict[str, Any]:
+        """Verify entries ``start..end`` (inclusive) with inclusion proofs.
+
+        Sealed entries cost O(log n) each; entries after the last
+        checkpoint are checked by walking the unsealed tail (fewer than
+        ``checkpoint_size`` entries).
+
+        Args:
+            start: First chain position
+            end: Last chain position
+
+        Returns:
+            Verification result with one proof per entry
+        """
+        root = self.root
+        root_bytes = bytes.fromhex(root) if root else b""
+        errors: list[dict[str, Any]] = []
+        entries = []
+        for index in range(start, end + 1):
+            entry = self._chain[index]
+            expected_previous = self._chain[index - 1]["entry_hash"] if index else GENESIS_HASH
+            if entry["previous_hash"] != expected_previous:
+                errors.append({"index": index, "error": "broken link"})
+            if entry_hash_for(entry["ledger_id"], entry["previous_hash"]) != entry["entry_hash"]:
+                errors.append({"index": index, "error": "entry hash mismatch"})
+            proof = self.proof(index)
+            leaf = leaf_hash(entry["entry_hash"])
+            if proof is not None and root_from_proof(leaf, proof) != root_bytes:
+                errors.append({"index": index, "error": "not included in checkpoint root"})
+            entries.append({
+                "index": index,
+                "ledger_id": entry["ledger_id"],
+                "entry_hash": entry["entry_hash"],
+                "previous_hash": entry["previous_hash"],
+                "checkpoint": index // self.checkpoint_size if proof is not None else None,
+                "proof": proof,
+            })
+
+        sealed = len(self._checkpoints) * self.checkpoint_size
+        if end >= sealed:
+            # Unsealed entries are only anchored by the chain since the last checkpoint
+            tail_errors = verify_segments(self.segment_jobs(first=len(self._checkpoints)))
+            errors.extend(e for e in tail_errors if e not in errors)
+
+        return {
+            "from": start,
+            "to": end,
+            "root": root,
+            "checkpoints": len(self._checkpoints),
+            "verified": not errors,
+            "errors": errors,
+            "entries": entries,
+        }
+
+    def segment_jobs(self, first: int = 0) -> list[SegmentJob]:
+        """Snapshot segments for ``merkle.verify_segments``.
+
+        Args:
+            first: Segment to start from (``len(checkpoints())`` snapshots
+                just the unsealed tail)
+        """
+        jobs: list[SegmentJob] = []
+        for start in range(first * self.checkpoint_size, len(self._chain), self.checkpoint_size):
+            records = [
+                (e["ledger_id"], e["previous_hash"], e["entry_hash"])
+                for e in self._chain[start : start + self.checkpoint_size]
+            ]
+            previous = self._chain[start - 1]["entry_hash"] if start else GENESIS_HASH
+            checkpoint = start // self.checkpoint_size
+            root = (
+                self._checkpoints[checkpoint]["segment_root"]
+                if checkpoint < len(self._checkpoints)
+                else None
+            )
+            jobs.append((start, records, previous, root))
+        return jobs
+
+    def verify_checkpoints(self) -> list[dict[str, Any]]:
+        """Check the top-level tree against the recorded segment roots."""
+        if not self._checkpoints:
+            return []
+        roots = [bytes.fromhex(c["segment_root"]) for c in self._checkpoints]
+        if build_levels(roots)[-1][0].hex() != self.root:
+            return [{"index": 0, "error": "checkpoint tree mismatch"}]
+        return []
+
+    def clear(self) -> None:
+        """Drop the whole chain."""
+        self._chain.clear()
+        self._by_time.clear()
+        self._positions.clear()
+        for index in self._index.values():
+            index.clear()
+        self._resets += 1
+        self._tail_hash = GENESIS_HASH
+        self.revision = 0
+        self._checkpoints.clear()
+        self._segment_levels.clear()
+        self._top_levels = []
+
+    def stats(self) -> dict[str, Any]:
+        """Chain counters."""
+        return {
+            "entries": len(self._chain),
+            "tail_hash": self._tail_hash,
+            "revision": self.revision,
+            "checkpoints": len(self._checkpoints),
+            "root": self.root,
+        }
+
+
+# Persisted audit trail served by /api/ledger
+ledger_chain = LedgerChain()
+
+
 def _get_step_type(agent: str) -> str:
     """Map agent to primary step type."""
     mapping = {
@@ -517,31 +1012,79 @@ def _get_tools_called(agent: str) -> list[str]:
 # CSV Pack Generation
 # ============================================
 
-def generate_csv_pack(cases: list[Case]) -> dict[str, Any]:
+def generate_csv_pack(
+    cases: list[Case], ledger_entries: list[dict[str, Any]] | None = None
+) -> dict[str, Any]:
     """Generate a simulated CSV (Computer System Validation) pack.
 
     Produces 6 compliance artifacts based on current case data.
     In production, this is generated by the csv_pack agent.
+
+    Args:
+        cases: Cases to analyze
+        ledger_entries: Decision ledger to report on; generated from
+            ``cases`` when omitted
+
+    Returns:
+        The pack with its artifacts
     """
     now = datetime.utcnow()
-    pack_id = _deterministic_id(f"pack-{now.strftime('%Y%m%d')}", "CSV-")
+    pack_id = csv_pack_id(now)
+    if ledger_entries is None:
+        ledger_entries = generate_ledger_for_cases(cases)
+
+    artifacts = [build() for _, build in csv_pack_steps(pack_id, cases, ledger_entries)]
+    return csv_pack_summary(pack_id, now, cases, ledger_entries, artifacts)
+
+
+def csv_pack_id(now: datetime) -> str:
+    """Pack ID for packs generated on the day of ``now``."""
+    return _deterministic_id(f"pack-{now.strftime('%Y%m%d')}", "CSV-")
+
+
+def csv_pack_steps(
+    pack_id: str, cases: list[Case], ledger_entries: list[dict[str, Any]]
+) -> list[tuple[str, Callable[[], dict[str, Any]]]]:
+    """Artifact builders of a CSV pack, in pack order.
+
+    Args:
+        pack_id: Pack the artifacts belong to
+        cases: Cases to analyze
+        ledger_entries: Decision ledger to report on
+
+    Returns:
+        (artifact_type, builder) pairs
+    """
     closed = [c for c in cases if c.status == CaseStatus.CLOSED]
-    ledger_entries = generate_ledger_for_cases(cases)
-
-    artifacts = [
-        _generate_urs_artifact(pack_id, cases),
-        _generate_risk_assessment_artifact(pack_id, cases, ledger_entries),
-        _generate_traceability_artifact(pack_id),
-        _generate_test_logs_artifact(pack_id, cases, ledger_entries),
-        _generate_version_history_artifact(pack_id),
-        _generate_memory_dump_artifact(pack_id, closed),
+    return [
+        ("URS", lambda: _generate_urs_artifact(pack_id, cases)),
+        (
+            "RiskAssessment",
+            lambda: _generate_risk_assessment_artifact(pack_id, cases, ledger_entries),
+        ),
+        ("TraceabilityMatrix", lambda: _generate_traceability_artifact(pack_id)),
+        (
+            "TestExecutionLogs",
+            lambda: _generate_test_logs_artifact(pack_id, cases, ledger_entries),
+        ),
+        ("VersionHistory", lambda: _generate_version_history_artifact(pack_id)),
+        ("MemoryDump", lambda: _generate_memory_dump_artifact(pack_id, closed)),
     ]
 
+
+def csv_pack_summary(
+    pack_id: str,
+    now: datetime,
+    cases: list[Case],
+    ledger_entries: list[dict[str, Any]],
+    artifacts: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Assemble built artifacts into the pack payload."""
     return {
         "pack_id": pack_id,
         "generated_at": now.isoformat() + "Z",
         "total_cases_analyzed": len(cases),
-        "closed_cases": len(closed),
+        "closed_cases": len([c for c in cases if c.status == CaseStatus.CLOSED]),
         "total_ledger_entries": len(ledger_entries),
         "artifacts": artifacts,
         "compliance_standard": "21 CFR Part 11",
@@ -715,134 +1258,98 @@ def generate_memory_entries(cases: list[Case]) -> dict[str, Any]:
     For demo, we derive them deterministically from existing cases so that:
     - After reset → empty (patterns are LEARNED from cases)
     - After scenario creation → patterns appear
-    """
-    closed = [c for c in cases if c.status == CaseStatus.CLOSED]
-
-    patterns = _generate_memory_patterns(closed)
-    templates = _generate_memory_templates(closed)
-    policies = _generate_memory_policies(cases)
-
-    return {
-        "patterns": patterns,
-        "templates": templates,
-        "policies": policies,
-        "summary": {
-            "total_patterns": len(patterns),
-            "total_templates": len(templates),
-            "total_policies": len(policies),
-            "cases_analyzed": len(cases),
-        },
-    }
 
+    Builds a one-off view; the API serves the incrementally maintained
+    ``memory_view`` instead.
+    """
+    view = MemoryView()
+    view.sync(0, cases, full=True)
+    return view.entries()
+
+
+# Pattern names and descriptions by complaint category
+_PATTERN_NAMES = {
+    "PACKAGING": "Defeito de Embalagem",
+    "QUALITY": "Alteração de Qualidade",
+    "EFFICACY": "Resposta de Eficácia",
+    "SAFETY": "Evento de Segurança",
+    "LABELING": "Problema de Rotulagem",
+}
 
-def _generate_memory_patterns(closed_cases: list[Case]) -> list[dict[str, Any]]:
-    """Generate recurring patterns from closed cases (RecurringPatterns strategy)."""
-    patterns: list[dict[str, Any]] = []
-    seen_products: set[str] = set()
-
-    for case in closed_cases:
-        product_key = f"{case.product_brand} {case.product_name}"
-        if product_key in seen_products:
-            continue
-        seen_products.add(product_key)
-
-        pattern_id = case.recurring_pattern_id or _deterministic_id(f"pat-{case.case_id}", "PAT-")
-        category = str(case.category.value) if case.category else "PACKAGING"
-
-        # Map category to descriptive pattern name
-        category_names = {
-            "PACKAGING": "Defeito de Embalagem",
-            "QUALITY": "Alteração de Qualidade",
-            "EFFICACY": "Resposta de Eficácia",
-            "SAFETY": "Evento de Segurança",
-            "LABELING": "Problema de Rotulagem",
-        }
-        pattern_name = f"{category_names.get(category, category)} {case.product_brand}"
-
-        # Map category to descriptive pattern description
-        category_descs = {
-            "PACKAGING": f"Problema recorrente com integridade de embalagem em {case.product_brand} {case.product_name}",
-            "QUALITY": f"Relatos de alteração de textura/consistência em {case.product_brand} {case.product_name}",
-            "EFFICACY": f"Relatos de resposta insuficiente ao tratamento com {case.product_brand} {case.product_name}",
-            "SAFETY": f"Relatos de reação adversa com {case.product_brand} {case.product_name}",
-            "LABELING": f"Inconsistências em rotulagem de {case.product_brand} {case.product_name}",
-        }
-
-        # Count occurrences for this product (how many cases match)
-        occurrences = len([
-            c for c in closed_cases
-            if c.product_brand == case.product_brand
-        ])
-
-        patterns.append({
-            "id": pattern_id,
-            "name": pattern_name,
-            "description": category_descs.get(category, f"Padrão detectado para {product_key}"),
-            "confidence": case.ai_confidence or 0.92,
-            "occurrences": max(occurrences, 3),  # At least 3 to show it's recurring
-            "status": "ACTIVE",
-            "created_at": case.created_at.isoformat() + "Z",
-        })
-
-    return patterns
+_PATTERN_DESCRIPTIONS = {
+    "PACKAGING": "Problema recorrente com integridade de embalagem em {product}",
+    "QUALITY": "Relatos de alteração de textura/consistência em {product}",
+    "EFFICACY": "Relatos de resposta insuficiente ao tratamento com {product}",
+    "SAFETY": "Relatos de reação adversa com {product}",
+    "LABELING": "Inconsistências em rotulagem de {product}",
+}
 
+# Template names by category
+_TEMPLATE_NAMES = {
+    "PACKAGING": "Defeito de Embalagem — Resolução Padrão",
+    "QUALITY": "Alteração de Qualidade — Resposta Multilíngue",
+    "EFFICACY": "Eficácia — Orientação de Acompanhamento",
+    "SAFETY": "Evento de Segurança — Protocolo de Escalação",
+    "LABELING": "Rotulagem — Correção e Substituição",
+}
 
-def _generate_memory_templates(closed_cases: list[Case]) -> list[dict[str, Any]]:
-    """Generate resolution templates from closed cases (ResolutionTemplates strategy)."""
-    templates: list[dict[str, Any]] = []
-    seen_categories: set[str] = set()
+# Template texts by category
+_TEMPLATE_TEXTS = {
+    "PACKAGING": "Pedimos desculpas pelo problema na embalagem. Substituiremos o produto e investigaremos o lote.",
+    "QUALITY": "Lamentamos o inconveniente. Investigaremos o lote e providenciaremos substituição imediata.",
+    "EFFICACY": "Orientamos que consulte o profissional de saúde. Registramos o relato para análise técnica do lote.",
+    "SAFETY": "Agradecemos o relato. O caso foi escalado para revisão médica e análise de farmacovigilância.",
+    "LABELING": "Identificamos a inconsistência e providenciaremos correção. Uma unidade de reposição será enviada.",
+}
 
-    for case in closed_cases:
-        category = str(case.category.value) if case.category else "PACKAGING"
-        if category in seen_categories:
-            continue
-        seen_categories.add(category)
 
-        template_id = _deterministic_id(f"tpl-{category}", "TPL-")
+def _case_category(case: Case) -> str:
+    return str(case.category.value) if case.category else "PACKAGING"
 
-        # Template names by category
-        template_names = {
-            "PACKAGING": "Defeito de Embalagem — Resolução Padrão",
-            "QUALITY": "Alteração de Qualidade — Resposta Multilíngue",
-            "EFFICACY": "Eficácia — Orientação de Acompanhamento",
-            "SAFETY": "Evento de Segurança — Protocolo de Escalação",
-            "LABELING": "Rotulagem — Correção e Substituição",
-        }
 
-        # Template texts by category
-        template_texts = {
-            "PACKAGING": "Pedimos desculpas pelo problema na embalagem. Substituiremos o produto e investigaremos o lote.",
-            "QUALITY": "Lamentamos o inconveniente. Investigaremos o lote e providenciaremos substituição imediata.",
-            "EFFICACY": "Orientamos que consulte o profissional de saúde. Registramos o relato para análise técnica do lote.",
-            "SAFETY": "Agradecemos o relato. O caso foi escalado para revisão médica e análise de farmacovigilância.",
-            "LABELING": "Identificamos a inconsistência e providenciaremos correção. Uma unidade de reposição será enviada.",
-        }
+def _memory_pattern(case: Case) -> dict[str, Any]:
+    """Recurring pattern learned from a closed case (RecurringPatterns strategy).
 
-        # Count uses
-        uses = len([c for c in closed_cases if (str(c.category.value) if c.category else "PACKAGING") == category])
+    Occurrences are filled in by the view.
+    """
+    product_key = f"{case.product_brand} {case.product_name}"
+    pattern_id = case.recurring_pattern_id or _deterministic_id(f"pat-{case.case_id}", "PAT-")
+    category = _case_category(case)
+    description = _PATTERN_DESCRIPTIONS.get(category)
+    return {
+        "id": pattern_id,
+        "name": f"{_PATTERN_NAMES.get(category, category)} {case.product_brand}",
+        "description": (
+            description.format(product=product_key)
+            if description
+            else f"Padrão detectado para {product_key}"
+        ),
+        "confidence": case.ai_confidence or 0.92,
+        "occurrences": 0,
+        "status": "ACTIVE",
+        "created_at": case.created_at.isoformat() + "Z",
+    }
 
-        templates.append({
-            "id": template_id,
-            "name": template_names.get(category, f"Template {category}"),
-            "language": "PT",
-            "confidence": 0.95 - (len(templates) * 0.03),
-            "uses": max(uses * 7, 12),  # Inflate for demo realism
-            "status": "ACTIVE",
-            "template_text": template_texts.get(category, "Resolução padrão aplicada."),
-        })
 
-    return templates
+def _memory_template(category: str, position: int, uses: int) -> dict[str, Any]:
+    """Resolution template learned for a category (ResolutionTemplates strategy)."""
+    return {
+        "id": _deterministic_id(f"tpl-{category}", "TPL-"),
+        "name": _TEMPLATE_NAMES.get(category, f"Template {category}"),
+        "language": "PT",
+        "confidence": 0.95 - (position * 0.03),
+        "uses": max(uses * 7, 12),  # Inflate for demo realism
+        "status": "ACTIVE",
+        "template_text": _TEMPLATE_TEXTS.get(category, "Resolução padrão aplicada."),
+    }
 
 
-def _generate_memory_policies(cases: list[Case]) -> list[dict[str, Any]]:
+def _memory_policies(total_cases: int, high_critical: int) -> list[dict[str, Any]]:
     """Generate policy knowledge entries (PolicyKnowledge strategy).
 
     These are the 5 compliance policies enforced by the Guardian agent.
-    Evaluation counts and violations are derived from case data.
+    Evaluation counts and violations are derived from case counts.
     """
-    total_cases = len(cases)
-    high_critical = len([c for c in cases if c.severity in (CaseSeverity.HIGH, CaseSeverity.CRITICAL)])
-
     if total_cases == 0:
         return []
 
@@ -893,3 +1400,168 @@ def _generate_memory_policies(cases: list[Case]) -> list[dict[str, Any]]:
             "status": "ENFORCED",
         },
     ]
+
+
+# ============================================
+# Memory Materialized View
+# ============================================
+class _MemoryGroup:
+    """Closed cases sharing a pattern (product) or template (category).
+
+    The earliest-created member represents the group, matching a scan
+    of the cases in creation order. A group is created with its first
+    member and dropped by the view once its last member is removed.
+    """
+
+    __slots__ = ("first", "members")
+
+    def __init__(self, case_id: str, created_at: datetime, payload: Any) -> None:
+        self.members: dict[str, tuple[datetime, Any]] = {case_id: (created_at, payload)}
+        self.first: tuple[datetime, str] = (created_at, case_id)
+
+    @classmethod
+    def join(
+        cls,
+        groups: dict[str, "_MemoryGroup"],
+        key: str,
+        case_id: str,
+        created_at: datetime,
+        payload: Any,
+    ) -> None:
+        """Add a member to ``groups[key]``, creating the group if needed."""
+        group = groups.get(key)
+        if group is None:
+            groups[key] = cls(case_id, created_at, payload)
+        else:
+            group.add(case_id, created_at, payload)
+
+    def add(self, case_id: str, created_at: datetime, payload: Any) -> None:
+        self.members[case_id] = (created_at, payload)
+        if (created_at, case_id) < self.first:
+            self.first = (created_at, case_id)
+
+    def remove(self, case_id: str) -> None:
+        del self.members[case_id]
+        if self.first[1] == case_id and self.members:
+            self.first = min((created_at, cid) for cid, (created_at, _) in self.members.items())
+
+    def representative(self) -> Any:
+        return self.members[self.first[1]][1]
+
+
+class MemoryView:
+    """Incrementally maintained memory entries.
+
+    Keeps what each case contributes (closed-case pattern and
+    template membership, per-brand counts, policy counters) and
+    applies only the difference when a case changes, so reads cost
+    O(patterns + templates) instead of rescanning every case.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty view."""
+        # case_id -> (closed, brand, product_key, category, high_critical)
+        self._contrib: dict[str, tuple[bool, str, str, str, bool]] = {}
+        self._high_critical = 0
+        self._closed_by_brand: Counter[str] = Counter()
+        # product_key -> closed cases, payload the Case
+        self._patterns: dict[str, _MemoryGroup] = {}
+        # category -> closed cases
+        self._templates: dict[str, _MemoryGroup] = {}
+        self.revision = 0
+
+    def sync(
+        self,
+        revision: int,
+        changed: list[Case],
+        full: bool = False,
+        existing: Mapping[str, int] | None = None,
+    ) -> None:
+        """Apply the contributions of cases that changed since the last sync.
+
+        Args:
+            revision: Store revision the changes bring the view up to
+            changed: Created or modified cases, in change order
+            full: ``changed`` is a full snapshot; the view is rebuilt
+            existing: IDs of all current cases, to drop deleted ones
+        """
+        if full:
+            self.clear()
+        for case in changed:
+            self._remove(case.case_id)
+            self._add(case)
+        if existing is not None and len(self._contrib) > len(existing):
+            for case_id in [c for c in self._contrib if c not in existing]:
+                self._remove(case_id)
+        self.revision = revision
+
+    def _add(self, case: Case) -> None:
+        closed = case.status == CaseStatus.CLOSED
+        brand = case.product_brand
+        product_key = f"{case.product_brand} {case.product_name}"
+        category = _case_category(case)
+        high_critical = case.severity in (CaseSeverity.HIGH, CaseSeverity.CRITICAL)
+
+        self._contrib[case.case_id] = (closed, brand, product_key, category, high_critical)
+        self._high_critical += high_critical
+        if closed:
+            self._closed_by_brand[brand] += 1
+            _MemoryGroup.join(self._patterns, product_key, case.case_id, case.created_at, case)
+            _MemoryGroup.join(self._templates, category, case.case_id, case.created_at, None)
+
+    def _remove(self, case_id: str) -> None:
+        contrib = self._contrib.pop(case_id, None)
+        if contrib is None:
+            return
+        closed, brand, product_key, category, high_critical = contrib
+        self._high_critical -= high_critical
+        if closed:
+            self._closed_by_brand[brand] -= 1
+            if not self._closed_by_brand[brand]:
+                del self._closed_by_brand[brand]
+            for groups, key in ((self._patterns, product_key), (self._templates, category)):
+                groups[key].remove(case_id)
+                if not groups[key].members:
+                    del groups[key]
+
+    def entries(self) -> dict[str, Any]:
+        """Memory entries in the /api/memory shape."""
+        patterns = []
+        for group in sorted(self._patterns.values(), key=lambda g: g.first):
+            case = group.representative()
+            pattern = _memory_pattern(case)
+            # At least 3 to show it's recurring
+            pattern["occurrences"] = max(self._closed_by_brand[case.product_brand], 3)
+            patterns.append(pattern)
+
+        categories = sorted(self._templates.items(), key=lambda item: item[1].first)
+        templates = [
+            _memory_template(category, position, len(group.members))
+            for position, (category, group) in enumerate(categories)
+        ]
+        policies = _memory_policies(len(self._contrib), self._high_critical)
+
+        return {
+            "patterns": patterns,
+            "templates": templates,
+            "policies": policies,
+            "summary": {
+                "total_patterns": len(patterns),
+                "total_templates": len(templates),
+                "total_policies": len(policies),
+                "cases_analyzed": len(self._contrib),
+            },
+        }
+
+    def clear(self) -> None:
+        """Drop every contribution."""
+        self._contrib.clear()
+        self._high_critical = 0
+        self._closed_by_brand.clear()
+        self._patterns.clear()
+        self._templates.clear()
+        self.revision = 0
+
+
+# Materialized view served by /api/memory
+memory_view = MemoryView()
@@ -6,27 +6,28 @@
 # Emits events to the Observer agent via A2A protocol.
 # Uses AWS Bedrock AgentCore InvokeAgentRuntime for communication.
 #
+# boto3 is imported and the AgentCore client built on the
+# dispatch thread when the first event is delivered, so
+# neither slows the container's cold start.
+#
 # ============================================
 
 import json
 import logging
 import os
+import queue
+import threading
+import time
+from collections import deque
 from collections.abc import Callable
 from typing import Any
 
-import boto3
-from botocore.exceptions import ClientError
-
 from .models import EventEnvelope
 
 
 # ============================================
 # Logger
 # ============================================
-logging.basicConfig(
-    level=logging.INFO,
-    format='{"timestamp": "%(asctime)s", "service": "event_emitter", "level": "%(levelname)s", "message": "%(message)s"}',
-)
 logger = logging.getLogger("event_emitter")
 
 
@@ -55,20 +56,36 @@ class EventEmitter:
         self._enabled = A2A_ENABLED
         self._observer_arn = OBSERVER_AGENT_ARN
 
+        # Dispatch queue: request handlers enqueue, one worker thread invokes
+        self._dispatch_queue: queue.Queue[EventEnvelope] = queue.Queue()
+        self._enqueued_at: deque[float] = deque()
+        self._dispatch_lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._client_lock = threading.Lock()
+
         if self._enabled:
-            try:
-                self._client = boto3.client("bedrock-agentcore", region_name=region)
-                logger.info(f"Event emitter initialized (A2A enabled, region: {region})")
-            except Exception as e:
-                logger.warning(f"Failed to initialize AgentCore client: {e}")
-                self._enabled = False
+            logger.info(f"Event emitter initialized (A2A enabled, region: {region})")
         else:
             logger.info("Event emitter initialized (A2A disabled - local mode)")
 
     @property
     def is_enabled(self) -> bool:
         """Check if A2A communication is enabled."""
-        return self._enabled and self._client is not None and bool(self._observer_arn)
+        return self._enabled and bool(self._observer_arn)
+
+    def _get_client(self) -> Any:
+        """AgentCore client, created on first use.
+
+        Raises:
+            Exception: If boto3 cannot build the client
+        """
+        with self._client_lock:
+            if self._client is None:
+                import boto3
+
+                self._client = boto3.client("bedrock-agentcore", region_name=self.region)
+                logger.info(f"AgentCore client created (region: {self.region})")
+            return self._client
 
     def emit_to_observer(self, event: EventEnvelope) -> dict[str, Any]:
         """Emit an event to the Observer agent via A2A.
@@ -88,6 +105,9 @@ class EventEmitter:
                 "event_type": event.event_type.value,
             }
 
+        # Deferred with boto3 (see _get_client)
+        from botocore.exceptions import ClientError
+
         try:
             # Prepare payload for Observer agent
             # AgentCore expects 'payload' as JSON bytes, with 'prompt' key for input
@@ -101,7 +121,7 @@ class EventEmitter:
 
             # Invoke Observer agent via AgentCore Runtime
             # API requires: agentRuntimeArn + payload (as JSON bytes)
-            response = self._client.invoke_agent_runtime(
+            response = self._get_client().invoke_agent_runtime(
                 agentRuntimeArn=self._observer_arn,
                 payload=json.dumps(request_payload).encode("utf-8"),
                 contentType="application/json",
@@ -150,6 +170,49 @@ class EventEmitter:
                 "error": str(e),
             }
 
+    # ============================================
+    # Dispatch Queue
+    # ============================================
+    def dispatch(self, event: EventEnvelope) -> None:
+        """Queue an event for delivery to the Observer without blocking.
+
+        Args:
+            event: Event envelope to send
+        """
+        with self._dispatch_lock:
+            self._enqueued_at.append(time.monotonic())
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._dispatch_loop, name="a2a-dispatch", daemon=True
+                )
+                self._worker.start()
+        self._dispatch_queue.put(event)
+
+    def _dispatch_loop(self) -> None:
+        """Deliver queued events to the Observer in order."""
+        while True:
+            event = self._dispatch_queue.get()
+            try:
+                result = self.emit_to_observer(event)
+                if not result.get("success"):
+                    logger.warning(f"Event emission failed: {result.get('error')}")
+            finally:
+                with self._dispatch_lock:
+                    if self._enqueued_at:
+                        self._enqueued_at.popleft()
+                self._dispatch_queue.task_done()
+
+    def pending_count(self) -> int:
+        """Number of events waiting for (or in) Observer delivery."""
+        return len(self._enqueued_at)
+
+    def lag_seconds(self) -> float:
+        """Age of the oldest undelivered event in seconds."""
+        with self._dispatch_lock:
+            if not self._enqueued_at:
+                return 0.0
+            return time.monotonic() - self._enqueued_at[0]
+
     def set_observer_arn(self, arn: str) -> None:
         """Set the Observer agent ARN dynamically.
 
@@ -162,16 +225,12 @@ class EventEmitter:
     def enable(self) -> bool:
         """Enable A2A communication.
 
+        The AgentCore client is created when the first event is
+        delivered; a failure then is reported per event.
+
         Returns:
-            True if enabled successfully, False otherwise
+            True (kept for callers that check the result)
         """
-        if self._client is None:
-            try:
-                self._client = boto3.client("bedrock-agentcore", region_name=self.region)
-            except Exception as e:
-                logger.error(f"Failed to create AgentCore client: {e}")
-                return False
-
         self._enabled = True
         logger.info("A2A communication enabled")
         return True
@@ -196,15 +255,15 @@ def create_event_callback(emitter: EventEmitter) -> Callable[[EventEnvelope], No
     """
 
     def callback(event: EventEnvelope) -> None:
-        """Callback to emit event to Observer agent.
+        """Callback to queue the event for the Observer agent.
+
+        Delivery happens on the emitter's dispatch thread so the
+        request that produced the event never waits on A2A.
 
         Args:
             event: Event envelope from simulator
         """
-        result = emitter.emit_to_observer(event)
-
-        if not result.get("success"):
-            logger.warning(f"Event emission failed: {result.get('error')}")
+        emitter.dispatch(event)
 
     return callback
 
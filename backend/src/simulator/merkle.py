@@ -0,0 +1,160 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Simulator - Ledger Merkle Checkpoints
+# ============================================
+#
+# The ledger is a linear hash chain (entry_hash =
+# sha256(ledger_id + previous_hash)), so checking one entry
+# against it means rehashing everything before it. Every
+# CHECKPOINT_SIZE entries the chain is sealed into a segment
+# with a Merkle root over its entry hashes, and the segment
+# roots form a top-level tree. An entry's inclusion proof is
+# its path inside the segment followed by the segment's path
+# in the top tree: O(log n) hashes against a single root.
+#
+# Node hashing follows RFC 6962 (leaves H(0x00 || hash),
+# interior nodes H(0x01 || left || right)); a node without
+# a sibling is promoted unchanged to the next level.
+#
+# ============================================
+
+import asyncio
+import hashlib
+import os
+from concurrent.futures import Executor
+from typing import Any
+
+
+# Entries per sealed segment
+CHECKPOINT_SIZE = 256
+
+# (start index, [(ledger_id, previous_hash, entry_hash)], previous hash
+# expected before the first record, segment root or None if unsealed)
+SegmentJob = tuple[int, list[tuple[str, str, str]], str, str | None]
+
+
+# ============================================
+# Hashing
+# ============================================
+def entry_hash_for(ledger_id: str, previous_hash: str) -> str:
+    """Chain hash of a ledger entry."""
+    return hashlib.sha256(f"{ledger_id}{previous_hash}".encode()).hexdigest()
+
+
+def leaf_hash(entry_hash: str) -> bytes:
+    """Merkle leaf for a ledger entry."""
+    return hashlib.sha256(b"\x00" + bytes.fromhex(entry_hash)).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    """Merkle interior node."""
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+# ============================================
+# Trees and Proofs
+# ============================================
+def build_levels(leaves: list[bytes]) -> list[list[bytes]]:
+    """Build every level of a Merkle tree, leaves first.
+
+    Args:
+        leaves: Leaf hashes (at least one)
+
+    Returns:
+        Levels from the leaves up; the last level holds the root
+    """
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        parents = [node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parents.append(level[-1])
+        levels.append(parents)
+    return levels
+
+
+def inclusion_proof(levels: list[list[bytes]], index: int) -> list[dict[str, str]]:
+    """Sibling path from one leaf to the root.
+
+    Args:
+        levels: Tree levels from ``build_levels``
+        index: Leaf position
+
+    Returns:
+        Steps of {"side": "left" | "right", "hash": hex}, where side is
+        the sibling's position relative to the running hash
+    """
+    proof = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append({
+                "side": "left" if sibling < index else "right",
+                "hash": level[sibling].hex(),
+            })
+        index //= 2
+    return proof
+
+
+def root_from_proof(leaf: bytes, proof: list[dict[str, str]]) -> bytes:
+    """Fold an inclusion proof into the root it commits to."""
+    node = leaf
+    for step in proof:
+        sibling = bytes.fromhex(step["hash"])
+        node = node_hash(sibling, node) if step["side"] == "left" else node_hash(node, sibling)
+    return node
+
+
+# ============================================
+# Full Verification
+# ============================================
+def verify_segments(jobs: list[SegmentJob]) -> list[dict[str, Any]]:
+    """Rehash segments and check their links and checkpoint roots.
+
+    Module-level and free of shared state so it can run in a
+    process pool.
+
+    Args:
+        jobs: Segments to verify
+
+    Returns:
+        Problems found, as {"index", "error"} dicts
+    """
+    errors: list[dict[str, Any]] = []
+    for start, records, previous_hash, root in jobs:
+        for offset, (ledger_id, prev, entry_hash) in enumerate(records):
+            if prev != previous_hash:
+                errors.append({"index": start + offset, "error": "broken link"})
+            if entry_hash_for(ledger_id, prev) != entry_hash:
+                errors.append({"index": start + offset, "error": "entry hash mismatch"})
+            previous_hash = entry_hash
+        if root is not None:
+            levels = build_levels([leaf_hash(record[2]) for record in records])
+            if levels[-1][0].hex() != root:
+                errors.append({"index": start, "error": "checkpoint root mismatch"})
+    return errors
+
+
+async def verify_segments_parallel(
+    jobs: list[SegmentJob], executor: Executor | None
+) -> list[dict[str, Any]]:
+    """Verify segments, spreading batches across an executor.
+
+    Args:
+        jobs: Segments to verify
+        executor: Process pool; None verifies inline
+
+    Returns:
+        Problems found, ordered by index
+    """
+    if executor is None or len(jobs) < 2:
+        results = [verify_segments(jobs)]
+    else:
+        # A few batches per core keeps workers busy without pickling per segment
+        batch_size = max(1, len(jobs) // ((os.cpu_count() or 1) * 4))
+        batches = [jobs[i : i + batch_size] for i in range(0, len(jobs), batch_size)]
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(executor, verify_segments, batch) for batch in batches)
+        )
+    return sorted((e for errors in results for e in errors), key=lambda e: e["index"])
@@ -0,0 +1,71 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Backend Tests - Admission Control
+# ============================================
+
+from src.admission import READ, WRITE, AdmissionController, admission_controller
+
+
+class TestAdmissionController:
+    """Tests for AdmissionController."""
+
+    def test_admits_under_budget(self):
+        """Test that requests within budget are admitted."""
+        controller = AdmissionController(read_burst=5, write_burst=5)
+        assert controller.check(READ) == 0
+        assert controller.check(WRITE) == 0
+
+    def test_write_budget_separate_from_reads(self):
+        """Test that exhausting writes does not starve reads."""
+        controller = AdmissionController(write_rate=1.0, write_burst=2, read_burst=10)
+        assert controller.check(WRITE) == 0
+        assert controller.check(WRITE) == 0
+        assert controller.check(WRITE) > 0
+        assert controller.check(READ) == 0
+
+    def test_queue_depth_sheds_writes_only(self):
+        """Test that a deep dispatch queue rejects writes but not reads."""
+        controller = AdmissionController(max_queue_depth=10)
+        controller.add_source("dispatch", lambda: 50, lambda: 0.0)
+        assert controller.check(WRITE) >= 1.0
+        assert controller.check(READ) == 0
+
+    def test_lag_sheds_writes(self):
+        """Test that dispatch lag rejects writes with a lag-sized Retry-After."""
+        controller = AdmissionController(max_lag_seconds=2.0)
+        controller.add_source("dispatch", lambda: 1, lambda: 7.5)
+        assert controller.check(WRITE) == 7.5
+
+    def test_disabled_admits_everything(self):
+        """Test that a disabled controller never rejects."""
+        controller = AdmissionController(enabled=False, max_queue_depth=0)
+        controller.add_source("dispatch", lambda: 100, lambda: 100.0)
+        assert controller.check(WRITE) == 0
+
+    async def test_delay_mode_waits_for_tokens(self):
+        """Test that delay mode waits for a refill instead of rejecting."""
+        controller = AdmissionController(
+            mode="delay", write_rate=100.0, write_burst=1, max_delay_seconds=1.0
+        )
+        assert await controller.admit(WRITE) == 0
+        assert await controller.admit(WRITE) == 0
+        assert controller.stats()["rejected"][WRITE] == 0
+
+
+class TestAdmissionEndpoints:
+    """Tests for 429 responses on the REST API."""
+
+    def test_create_case_rejected_with_retry_after(self, client, sample_case_create):
+        """Test that overloaded dispatch returns 429 with Retry-After."""
+        admission_controller.add_source("test_backlog", lambda: 10_000, lambda: 0.0)
+        try:
+            response = client.post(
+                "/api/cases", json=sample_case_create.model_dump(mode="json")
+            )
+            assert response.status_code == 429
+            assert int(response.headers["Retry-After"]) >= 1
+
+            # Reads keep working while writes are shed
+            assert client.get("/api/stats").status_code == 200
+        finally:
+            admission_controller._sources.pop("test_backlog")
@@ -0,0 +1,127 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Backend Tests - Columnar Case Analytics
+# ============================================
+
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.simulator.analytics import CaseColumns, analytics_available
+from src.simulator.api import SimulatorAPI
+from src.simulator.models import CaseStatus, CaseUpdate
+
+
+pytestmark = pytest.mark.skipif(not analytics_available(), reason="requires numpy")
+
+
+@pytest.fixture
+def scenario():
+    """Simulator with the Galderma scenario, created twice."""
+    simulator = SimulatorAPI()
+    simulator.create_galderma_scenario()
+    simulator.create_galderma_scenario()
+    return simulator
+
+
+def _sync(columns: CaseColumns, simulator: SimulatorAPI) -> None:
+    columns.sync(
+        *simulator.get_changes_since(columns.revision), existing=simulator.get_case_versions()
+    )
+
+
+def _expected(simulator: SimulatorAPI, *attributes: str) -> Counter:
+    return Counter(
+        tuple(getattr(case, a) for a in attributes) for case in simulator._cases.values()
+    )
+
+
+def _counted(groups: list[dict], *names: str) -> Counter:
+    return Counter({tuple(g[n] for n in names): g["count"] for g in groups})
+
+
+class TestCaseColumns:
+    """Tests for the NumPy columnar mirror."""
+
+    def test_group_by_matches_python_loop(self, scenario):
+        """Test multi-dimension counts against a loop over Case objects."""
+        columns = CaseColumns(capacity=4)
+        _sync(columns, scenario)
+
+        groups = columns.aggregate(["brand", "category", "status"])
+        assert _counted(groups, "brand", "category", "status") == _expected(
+            scenario, "product_brand", "category", "status"
+        )
+        assert columns.aggregate([]) == [{"count": len(scenario._cases)}]
+
+    def test_follows_updates_and_deletes(self, scenario):
+        """Test that rows are rewritten in place and deleted cases drop out."""
+        columns = CaseColumns()
+        _sync(columns, scenario)
+        case_ids = list(scenario._cases)
+
+        scenario.update_case(case_ids[0], CaseUpdate(status=CaseStatus.PENDING_REVIEW))
+        scenario.delete_case(case_ids[1])
+        _sync(columns, scenario)
+
+        assert len(columns) == len(scenario._cases)
+        assert _counted(columns.aggregate(["status"]), "status") == _expected(scenario, "status")
+
+        scenario.reset_demo()
+        _sync(columns, scenario)
+        assert columns.aggregate(["brand"]) == []
+
+    def test_deleted_rows_are_reused(self, scenario):
+        """Test that new cases take the rows of deleted ones."""
+        columns = CaseColumns()
+        _sync(columns, scenario)
+        assert columns.stats()["rows"] == len(scenario._cases)
+
+        for case_id in list(scenario._cases)[:3]:
+            scenario.delete_case(case_id)
+        _sync(columns, scenario)
+        assert columns.stats()["free_rows"] == 3
+
+        scenario.create_galderma_scenario()
+        _sync(columns, scenario)
+        assert columns.stats()["rows"] == len(scenario._cases)
+        assert columns.stats()["free_rows"] == 0
+        assert _counted(columns.aggregate(["status"]), "status") == _expected(scenario, "status")
+
+    def test_filters_and_day_buckets(self, scenario):
+        """Test equality filters, time range and bucket labels."""
+        columns = CaseColumns()
+        _sync(columns, scenario)
+        since = datetime.utcnow() - timedelta(days=1)
+
+        groups = columns.aggregate(
+            ["brand"], bucket="day", since=since, filters={"case_type": "COMPLAINT"}
+        )
+        expected = Counter(
+            (c.product_brand, c.created_at.date().isoformat())
+            for c in scenario._cases.values()
+            if c.case_type == "COMPLAINT" and c.created_at >= since
+        )
+        assert _counted(groups, "brand", "bucket") == expected
+        assert columns.aggregate(["brand"], filters={"brand": "UNKNOWN"}) == []
+
+        with pytest.raises(ValueError):
+            columns.aggregate(["customer_name"])
+
+    def test_aggregate_endpoint(self, client):
+        """Test /api/analytics/aggregate over the demo scenario."""
+        client.post("/api/reset")
+        client.post("/api/scenario/galderma")
+
+        response = client.get(
+            "/api/analytics/aggregate",
+            params={"group_by": ["brand", "category"], "bucket": "day", "days": 90},
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 6
+        assert all({"brand", "category", "bucket", "count"} <= set(g) for g in body["groups"])
+
+        bad = client.get("/api/analytics/aggregate", params={"group_by": "customer_name"})
+        assert bad.status_code == 400
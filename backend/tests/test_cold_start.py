@@ -0,0 +1,66 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Backend Tests - Cold Start
+# ============================================
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from src.simulator.event_emitter import EventEmitter
+from src.simulator.models import EventEnvelope, EventType
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Loaded on first use only (A2A delivery, SAC agent, ledger verification)
+DEFERRED_MODULES = [
+    "boto3",
+    "botocore",
+    "strands",
+    "redis",
+    "src.sac.agent_tools",
+    "concurrent.futures.process",
+]
+
+
+class TestColdStart:
+    """Tests that startup stays free of heavy imports."""
+
+    def test_main_import_defers_heavy_modules(self):
+        """Test that importing the app, A2A on, loads none of the deferred modules."""
+        script = (
+            "import json, sys, src.main; "
+            f"print(json.dumps([m for m in {DEFERRED_MODULES!r} if m in sys.modules]))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=BACKEND_DIR,
+            env={"A2A_ENABLED": "true", "PATH": ""},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert json.loads(result.stdout.splitlines()[-1]) == []
+
+    def test_emitter_builds_client_on_first_event(self):
+        """Test that enable() is cheap and the client is made at delivery."""
+        calls = []
+
+        class _Client:
+            def invoke_agent_runtime(self, **kwargs):
+                calls.append(kwargs["agentRuntimeArn"])
+                return {"body": b"ok"}
+
+        emitter = EventEmitter()
+        emitter.set_observer_arn("arn:observer")
+        assert emitter.enable() is True
+        assert emitter._client is None
+
+        emitter._client = _Client()
+        event = EventEnvelope(event_type=EventType.CASE_CREATED, payload={})
+        result = emitter.emit_to_observer(event)
+        assert result["mode"] == "a2a"
+        assert result["observer_response"] == "ok"
+        assert calls == ["arn:observer"]
@@ -0,0 +1,146 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Backend Tests - CSV Pack Jobs
+# ============================================
+
+import io
+import json
+import time
+import zipfile
+
+import pytest
+
+from src.bridge.csv_pack import CSVPackJobs, CSVPackStatus, csv_pack_jobs, iter_pack_zip
+from src.simulator.api import SimulatorAPI
+from src.simulator.demo_data import LedgerChain, generate_csv_pack
+from src.simulator.models import CaseSeverity, CaseUpdate
+
+
+@pytest.fixture
+def scenario():
+    """Simulator with the Galderma scenario and its ledger chain."""
+    simulator = SimulatorAPI()
+    simulator.create_galderma_scenario()
+    return simulator, LedgerChain()
+
+
+@pytest.fixture
+def jobs(scenario):
+    """Job manager over the scenario, recording published events."""
+    simulator, chain = scenario
+    published = []
+
+    def inputs():
+        chain.sync(*simulator.get_changes_since(chain.revision))
+        return (
+            list(simulator._cases.values()),
+            dict(simulator.get_case_versions()),
+            chain.entries(),
+            chain.stats()["tail_hash"],
+        )
+
+    manager = CSVPackJobs(inputs, published.append)
+    manager.published = published
+    return manager
+
+
+class TestCSVPackJobs:
+    """Tests for background pack generation."""
+
+    async def test_job_builds_pack_and_reports_steps(self, jobs, scenario):
+        """Test that a job matches the synchronous pack and reports each step."""
+        simulator, chain = scenario
+        job = await jobs.wait(jobs.submit())
+
+        assert job.status == CSVPackStatus.COMPLETE and not job.cached
+        expected = generate_csv_pack(list(simulator._cases.values()), chain.entries())
+        assert job.result["artifacts"] == expected["artifacts"]
+
+        progress = [e["data"] for e in jobs.published]
+        assert all(e["type"] == "csv_pack_progress" for e in jobs.published)
+        assert [p["current_step"] for p in progress[:-1]] == [
+            a["artifact_type"] for a in expected["artifacts"]
+        ]
+        assert progress[-1]["status"] == "complete"
+        assert progress[-1]["completed_steps"] == progress[-1]["total_steps"] == 6
+
+    async def test_unchanged_inputs_hit_cache(self, jobs, scenario, sample_case_create):
+        """Test that repeating a pack is instant until a case changes."""
+        simulator, _ = scenario
+        first = await jobs.wait(jobs.submit())
+
+        again = jobs.submit()
+        assert again.status == CSVPackStatus.COMPLETE and again.cached
+        assert again.result is first.result
+
+        simulator.create_case(sample_case_create)
+        changed = jobs.submit()
+        assert changed.status == CSVPackStatus.QUEUED
+        assert changed.input_hash != first.input_hash
+        await jobs.wait(changed)
+        assert jobs.stats()["hits"] == 1 and jobs.stats()["misses"] == 2
+
+    async def test_build_ignores_changes_made_while_running(self, jobs, scenario):
+        """Test that a pack is built from the cases as they were when submitted."""
+        simulator, chain = scenario
+        before = [case.model_copy(deep=True) for case in simulator._cases.values()]
+        job = jobs.submit()
+
+        for case_id in list(simulator._cases):
+            simulator.update_case(case_id, CaseUpdate(severity=CaseSeverity.CRITICAL))
+        await jobs.wait(job)
+
+        expected = generate_csv_pack(before, chain.entries())
+        assert job.result["artifacts"] == expected["artifacts"]
+
+    async def test_concurrent_requests_share_a_job(self, jobs):
+        """Test that a request while the same pack is building joins it."""
+        job = jobs.submit()
+        assert jobs.submit() is job
+        await jobs.wait(job)
+
+
+class TestCSVPackZip:
+    """Tests for the streamed ZIP export."""
+
+    def test_zip_holds_every_artifact_and_manifest(self, scenario):
+        """Test that the streamed chunks form a valid archive."""
+        simulator, _ = scenario
+        pack = generate_csv_pack(list(simulator._cases.values()))
+        chunks = list(iter_pack_zip(pack))
+
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+        assert archive.testzip() is None
+        manifest = json.loads(archive.read("manifest.json"))
+        assert manifest["pack_id"] == pack["pack_id"]
+        assert len(manifest["files"]) == len(pack["artifacts"]) == 6
+        assert json.loads(archive.read(manifest["files"][0])) == pack["artifacts"][0]
+
+    def test_endpoints(self, client):
+        """Test starting, polling and downloading a pack over the API."""
+        client.post("/api/reset")
+        client.post("/api/scenario/galderma")
+
+        started = client.post("/api/csv-pack")
+        assert started.status_code in (200, 202)
+        job_id = started.json()["job_id"]
+
+        deadline = time.monotonic() + 5
+        job = started.json()
+        while job["status"] != "complete" and time.monotonic() < deadline:
+            time.sleep(0.01)
+            job = client.get(f"/api/csv-pack/{job_id}").json()
+        assert job["result"]["status"] == "COMPLETE"
+
+        cached = client.post("/api/csv-pack")
+        assert cached.status_code == 200 and cached.json()["cached"]
+
+        download = client.get(f"/api/csv-pack/{job_id}/download")
+        assert download.headers["content-type"] == "application/zip"
+        assert "manifest.json" in zipfile.ZipFile(io.BytesIO(download.content)).namelist()
+
+        assert client.get("/api/csv-pack/job-unknown").status_code == 404
+
+        client.post("/api/reset")
+        assert csv_pack_jobs.stats()["cached_packs"] == 0
+        assert client.get(f"/api/csv-pack/{job_id}").status_code == 404
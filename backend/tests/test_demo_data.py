@@ -0,0 +1,281 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Backend Tests - Derived Runs & Ledger
+# ============================================
+
+import hashlib
+
+import pytest
+
+from src.simulator import demo_data
+from src.simulator.api import SimulatorAPI
+from src.simulator.demo_data import (
+    DerivedViewCache,
+    LedgerChain,
+    MemoryView,
+    generate_ledger_for_cases,
+    generate_memory_entries,
+    generate_runs_for_cases,
+    run_id_for_case,
+)
+from src.simulator.models import CaseStatus, CaseUpdate
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Fresh derived-view cache in place of the shared one."""
+    fresh = DerivedViewCache()
+    monkeypatch.setattr(demo_data, "derived_views", fresh)
+    return fresh
+
+
+@pytest.fixture
+def scenario():
+    """Simulator loaded with the Galderma demo scenario."""
+    simulator = SimulatorAPI()
+    simulator.create_galderma_scenario()
+    return simulator
+
+
+def _cases(simulator: SimulatorAPI):
+    return list(simulator._cases.values())
+
+
+class TestDerivedViewCache:
+    """Tests for memoized run and ledger records."""
+
+    def test_cached_runs_match_generated(self, cache, scenario):
+        """Test that cached runs equal freshly generated ones."""
+        versions = scenario.get_case_versions()
+        cases = _cases(scenario)
+
+        for _ in range(2):
+            runs = generate_runs_for_cases(cases, versions=versions)
+            assert runs == generate_runs_for_cases(cases)
+
+    def test_only_changed_cases_are_regenerated(self, cache, scenario, sample_case_create):
+        """Test that a poll after one mutation regenerates one case."""
+        case, _ = scenario.create_case(sample_case_create)
+        versions = scenario.get_case_versions()
+        generate_runs_for_cases(_cases(scenario), versions=versions)
+        misses = cache.misses
+
+        generate_runs_for_cases(_cases(scenario), versions=versions)
+        assert cache.misses == misses
+
+        scenario.close_case(case.case_id, resolution_text="Replacement shipped")
+        runs = generate_runs_for_cases(_cases(scenario), versions=versions)
+
+        assert cache.misses == misses + 1
+        run = next(r for r in runs if r["case_id"] == case.case_id)
+        assert run["status"] == "COMPLETED"
+
+    def test_deleted_cases_are_pruned(self, cache, scenario):
+        """Test that records of deleted cases are dropped."""
+        versions = scenario.get_case_versions()
+        generate_runs_for_cases(_cases(scenario), versions=versions)
+        assert cache.stats()["cached_runs"] == len(versions)
+
+        scenario.reset_demo()
+        assert generate_runs_for_cases(_cases(scenario), versions=versions) == []
+        assert cache.stats()["cached_runs"] == 0
+
+    def test_reset_endpoint_clears_cache(self, cache, client):
+        """Test that /api/reset drops every cached run."""
+        client.post("/api/reset")
+        client.post("/api/scenario/galderma")
+        assert client.get("/api/runs").json()
+        assert cache.stats()["cached_runs"] > 0
+
+        client.post("/api/reset")
+        assert cache.stats()["cached_runs"] == 0
+
+
+class _Untouchable(list):
+    """List that fails any element access, to prove a scan never happens."""
+
+    def __getitem__(self, index):
+        raise AssertionError("full ledger scanned")
+
+
+def _sync(chain: LedgerChain, simulator: SimulatorAPI) -> int:
+    return chain.sync(*simulator.get_changes_since(chain.revision))
+
+
+class TestLedgerChain:
+    """Tests for the incrementally persisted ledger chain."""
+
+    def test_initial_sync_matches_generated_chain(self, scenario):
+        """Test that the first sync chains every case like a full build."""
+        chain = LedgerChain()
+        _sync(chain, scenario)
+
+        assert chain.entries() == generate_ledger_for_cases(_cases(scenario))
+        assert _sync(chain, scenario) == 0
+
+    def test_changes_append_without_rehashing(self, scenario, sample_case_create, monkeypatch):
+        """Test that a closed case hashes and appends only its new entries."""
+        case, _ = scenario.create_case(sample_case_create)
+        chain = LedgerChain()
+        _sync(chain, scenario)
+        stored = {e["ledger_id"]: e["entry_hash"] for e in chain.entries()}
+        tail = chain.stats()["tail_hash"]
+
+        hashed = []
+        sha256 = hashlib.sha256
+        monkeypatch.setattr(hashlib, "sha256", lambda data: hashed.append(data) or sha256(data))
+        scenario.close_case(case.case_id, resolution_text="Replacement shipped")
+        appended = _sync(chain, scenario)
+        assert len(hashed) == appended
+
+        entries = chain.entries()
+        assert appended == len(entries) - len(stored) > 0
+        kept = [e for e in entries if e["ledger_id"] in stored]
+        assert all(stored[e["ledger_id"]] == e["entry_hash"] for e in kept)
+        first_new = next(e for e in chain._chain if e["ledger_id"] not in stored)
+        assert first_new["previous_hash"] == tail
+
+    def test_filters_are_views(self, scenario):
+        """Test that filtering returns stored entries without re-chaining."""
+        chain = LedgerChain()
+        _sync(chain, scenario)
+        hashes = {e["ledger_id"]: e["entry_hash"] for e in chain.entries()}
+
+        filtered = chain.entries(agent_name="compliance_guardian", limit=3)
+        assert 0 < len(filtered) <= 3
+        assert all(e["agent_name"] == "compliance_guardian" for e in filtered)
+        assert all(hashes[e["ledger_id"]] == e["entry_hash"] for e in filtered)
+
+    def test_reset_rebuilds_chain(self, scenario, sample_case_create):
+        """Test that a store reset replaces the chain."""
+        chain = LedgerChain()
+        _sync(chain, scenario)
+
+        scenario.reset_demo()
+        scenario.create_case(sample_case_create)
+        _sync(chain, scenario)
+
+        assert chain.entries() == generate_ledger_for_cases(_cases(scenario))
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            {},
+            {"agent_name": "compliance_guardian"},
+            {"case_id": 0},
+            {"case_id": 0, "agent_name": "compliance_guardian"},
+            {"run_id": 1, "agent_name": "unknown_agent"},
+        ],
+    )
+    def test_indexed_pages_match_full_scan(self, scenario, filters):
+        """Test that cursor pages over the indexes equal a filtered full scan."""
+        chain = LedgerChain()
+        _sync(chain, scenario)
+        cases = _cases(scenario)
+        if "case_id" in filters:
+            filters["case_id"] = cases[filters["case_id"]].case_id
+        if "run_id" in filters:
+            filters["run_id"] = run_id_for_case(cases[filters["run_id"]].case_id)
+        expected = [
+            e for e in reversed(chain._by_time)
+            if all(e[field] == value for field, value in filters.items())
+        ]
+
+        pages, cursor = [], None
+        while True:
+            page, cursor = chain.page(**filters, limit=3, cursor=cursor)
+            pages.extend(page)
+            if cursor is None:
+                break
+        assert pages == expected
+        assert chain.entries(**filters, limit=3) == expected[:3]
+
+    def test_agent_filter_reads_only_its_index(self, scenario):
+        """Test that a first page for one agent never walks other entries."""
+        chain = LedgerChain()
+        _sync(chain, scenario)
+        bucket = chain._index["agent_name"]["compliance_guardian"]
+        chain._by_time = _Untouchable(chain._by_time)
+
+        page, _ = chain.page(agent_name="compliance_guardian", limit=2)
+        assert page == bucket[::-1][:2]
+
+    def test_ledger_endpoint_pages_with_cursor(self, client):
+        """Test X-Next-Cursor paging through the API."""
+        client.post("/api/reset")
+        client.post("/api/scenario/galderma")
+        everything = client.get("/api/ledger", params={"limit": 1000}).json()
+
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 7} | ({"cursor": cursor} if cursor else {})
+            response = client.get("/api/ledger", params=params)
+            seen.extend(response.json())
+            cursor = response.headers.get("x-next-cursor")
+            if cursor is None:
+                break
+        assert seen == everything
+        assert client.get("/api/ledger", params={"cursor": 10**6}).status_code == 400
+
+
+class TestMemoryView:
+    """Tests for the incrementally maintained memory view."""
+
+    def test_incremental_view_matches_full_rebuild(self, scenario, sample_case_create):
+        """Test that applied deltas equal a rebuild after every kind of change."""
+        view = MemoryView()
+
+        def sync_and_compare():
+            view.sync(*scenario.get_changes_since(view.revision), scenario.get_case_versions())
+            assert view.entries() == generate_memory_entries(_cases(scenario))
+
+        sync_and_compare()
+        case, _ = scenario.create_case(sample_case_create)
+        sync_and_compare()
+        scenario.close_case(case.case_id, resolution_text="Replacement shipped")
+        sync_and_compare()
+        scenario.update_case(case.case_id, CaseUpdate(status=CaseStatus.OPEN, severity="HIGH"))
+        sync_and_compare()
+        scenario.delete_case(_cases(scenario)[0].case_id)
+        sync_and_compare()
+        scenario.reset_demo()
+        sync_and_compare()
+        assert view.entries()["patterns"] == []
+
+    def test_occurrences_count_closed_cases_per_brand(self, sample_case_create):
+        """Test that pattern occurrences follow closes of the brand."""
+        simulator = SimulatorAPI()
+        view = MemoryView()
+        for _ in range(5):
+            case, _ = simulator.create_case(sample_case_create)
+            simulator.close_case(case.case_id, resolution_text="Resolved")
+        view.sync(*simulator.get_changes_since(view.revision))
+
+        (pattern,) = view.entries()["patterns"]
+        assert pattern["occurrences"] == 5
+
+
+class TestRunLookup:
+    """Tests for run_id -> case lookups."""
+
+    def test_run_index_follows_case_lifecycle(self, simulator, sample_case_create):
+        """Test that runs resolve to their case until the case is gone."""
+        case, _ = simulator.create_case(sample_case_create)
+        run_id = run_id_for_case(case.case_id)
+
+        assert simulator.get_case_by_run_id(run_id) is case
+        assert simulator.get_case_by_run_id("run-unknown") is None
+
+        simulator.delete_case(case.case_id)
+        assert simulator.get_case_by_run_id(run_id) is None
+
+    def test_get_run_endpoint(self, client, sample_case_create):
+        """Test fetching one run by ID through the API."""
+        created = client.post("/api/cases", json=sample_case_create.model_dump(mode="json"))
+        case_id = created.json()["case_id"]
+
+        response = client.get(f"/api/runs/{run_id_for_case(case_id)}")
+        assert response.status_code == 200
+        assert response.json()["case_id"] == case_id
+
+        assert client.get("/api/runs/run-unknown").status_code == 404
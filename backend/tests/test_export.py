@@ -0,0 +1,94 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Backend Tests - NDJSON Export
+# ============================================
+
+import json
+
+from src.bridge.export import iter_ndjson
+from src.simulator.api import SimulatorAPI
+from src.simulator.demo_data import LedgerChain
+from src.simulator.models import CaseStatus, EventType
+
+
+def _lines(response) -> list[dict]:
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+class TestStoreIterators:
+    """Tests for the generators exports are driven by."""
+
+    def test_cases_survive_mutation_between_steps(self, simulator, sample_case_create):
+        """Test that deletes are skipped and new cases are left out."""
+        first, _ = simulator.create_case(sample_case_create)
+        second, _ = simulator.create_case(sample_case_create)
+        cases = simulator.iter_cases()
+
+        assert next(cases) is first
+        simulator.delete_case(second.case_id)
+        simulator.create_case(sample_case_create)
+        assert list(cases) == []
+
+    def test_events_stop_at_reset(self, simulator, sample_case_create):
+        """Test that iteration ends early when the log is cleared."""
+        for _ in range(3):
+            simulator.create_case(sample_case_create)
+        events = simulator.iter_events(event_type=EventType.CASE_CREATED)
+
+        next(events)
+        simulator.reset_demo()
+        assert list(events) == []
+
+    def test_ledger_pages_survive_appends(self, sample_case_create):
+        """Test that entries chained mid-export never repeat or drop earlier ones."""
+        simulator = SimulatorAPI()
+        simulator.create_galderma_scenario()
+        chain = LedgerChain()
+        chain.sync(*simulator.get_changes_since(0))
+        before = chain.entries()
+
+        entries = chain.iter_pages(page_size=4)
+        exported = [next(entries) for _ in range(5)]
+        case, _ = simulator.create_case(sample_case_create)
+        simulator.close_case(case.case_id, resolution_text="Replacement shipped")
+        chain.sync(*simulator.get_changes_since(chain.revision))
+        exported.extend(entries)
+
+        ids = [e["ledger_id"] for e in exported]
+        assert len(ids) == len(set(ids))
+        assert {e["ledger_id"] for e in before} <= set(ids)
+        assert exported == [e for e in chain.entries() if e["ledger_id"] in set(ids)]
+
+    async def test_ndjson_chunks_hold_whole_lines(self):
+        """Test that batches split on record boundaries."""
+        chunks = [chunk async for chunk in iter_ndjson(({"n": i} for i in range(5)), batch_size=2)]
+
+        assert len(chunks) == 3
+        assert all(chunk.endswith(b"\n") for chunk in chunks)
+        assert [json.loads(line) for line in b"".join(chunks).splitlines()] == [
+            {"n": i} for i in range(5)
+        ]
+
+
+class TestExportEndpoints:
+    """Tests for /api/export/*.ndjson."""
+
+    def test_exports_apply_list_filters(self, client):
+        """Test that each export streams every record the filters match."""
+        client.post("/api/reset")
+        client.post("/api/scenario/galderma")
+
+        cases = client.get("/api/export/cases.ndjson", params={"status": "CLOSED"})
+        assert cases.headers["content-type"] == "application/x-ndjson"
+        closed = _lines(cases)
+        assert closed and all(c["status"] == CaseStatus.CLOSED for c in closed)
+        assert len(_lines(client.get("/api/export/cases.ndjson"))) == 6
+
+        events = _lines(
+            client.get("/api/export/events.ndjson", params={"event_type": "CaseCreated"})
+        )
+        assert len(events) == 6
+
+        ledger = client.get("/api/export/ledger.ndjson", params={"agent_name": "writeback"})
+        listed = client.get("/api/ledger", params={"agent_name": "writeback", "limit": 1000})
+        assert _lines(ledger) == listed.json()
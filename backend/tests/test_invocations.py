@@ -0,0 +1,124 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Backend Tests - AgentCore Invocations
+# ============================================
+
+import json
+
+import pytest
+
+from src.simulator.api import simulator_api
+
+
+@pytest.fixture
+def case_id(client, sample_case_create):
+    """A fresh store holding one open complaint."""
+    client.post("/api/reset")
+    response = client.post(
+        "/invocations",
+        json={"action": "create_case", "case": sample_case_create.model_dump(mode="json")},
+    )
+    return response.json()["case"]["case_id"]
+
+
+def _writeback(case_id: str) -> list[dict]:
+    return [
+        {"action": "get_case", "case_id": case_id},
+        {"action": "update_case", "case_id": case_id, "update": {"status": "IN_PROGRESS"}},
+        {"action": "close_case", "case_id": case_id, "resolution_text": "Replaced"},
+    ]
+
+
+class TestInvocations:
+    """Tests for single and batched /invocations."""
+
+    def test_single_action_shape(self, client, case_id):
+        """Test that the single-action form answers as before."""
+        body = client.post("/invocations", json={"action": "get_case", "case_id": case_id}).json()
+        assert body["success"] is True
+        assert body["action"] == "get_case"
+        assert body["case"]["case_id"] == case_id
+
+        missing = client.post("/invocations", json={"action": "get_case"}).json()
+        assert missing == {"success": False, "error": "case_id required"}
+
+        via_text = client.post(
+            "/invocations",
+            json={"action": "get_stats", "inputText": json.dumps({"ignored": True})},
+        ).json()
+        assert via_text["stats"]["total_cases"] == 1
+
+    def test_unknown_action_lists_registry(self, client):
+        """Test that an unknown action returns every registered name."""
+        body = client.post("/invocations", json={"action": "nope"}).json()
+        assert body["success"] is False
+        assert {"create_case", "close_case", "sac_configure"} <= set(body["available_actions"])
+
+    def test_batch_runs_in_order(self, client, case_id):
+        """Test a get -> update -> close writeback in one request."""
+        body = client.post("/invocations", json={"actions": _writeback(case_id)}).json()
+
+        assert body["success"] is True
+        assert [r["action"] for r in body["results"]] == ["get_case", "update_case", "close_case"]
+        assert body["results"][0]["case"]["status"] == "OPEN"
+        assert body["results"][1]["case"]["status"] == "IN_PROGRESS"
+        assert simulator_api.get_case(case_id).status == "CLOSED"
+
+    def test_batch_items_fail_independently(self, client, case_id):
+        """Test per-item results, and stop_on_error skipping the rest."""
+        actions = [{"action": "get_case", "case_id": "TW-MISSING"}, *_writeback(case_id)[:1]]
+        body = client.post("/invocations", json={"actions": actions}).json()
+        assert body["success"] is False
+        assert [r["success"] for r in body["results"]] == [False, True]
+
+        body = client.post(
+            "/invocations", json={"actions": actions, "stop_on_error": True}
+        ).json()
+        assert body["results"][1] == {"success": False, "skipped": True}
+
+    def test_atomic_batch_rolls_back(self, client, case_id):
+        """Test that a failing item undoes the items before it."""
+        events = len(simulator_api.get_events())
+        actions = [
+            *_writeback(case_id)[1:],
+            {"action": "update_case", "case_id": "TW-MISSING", "update": {}},
+        ]
+        body = client.post("/invocations", json={"actions": actions, "atomic": True}).json()
+
+        assert body["success"] is False
+        assert body["rolled_back"] is True
+        assert body["failed_index"] == 2
+        assert body["error"] == "Case not found: TW-MISSING"
+        assert simulator_api.get_case(case_id).status == "OPEN"
+        assert len(simulator_api.get_events()) == events
+
+    def test_atomic_batch_refuses_non_transactional(self, client, case_id):
+        """Test that actions that suspend or reset are rejected up front."""
+        actions = [*_writeback(case_id), {"action": "reset_demo"}]
+        body = client.post(
+            "/invocations", json={"inputText": json.dumps({"actions": actions, "atomic": True})}
+        ).json()
+
+        assert body == {
+            "success": False,
+            "error": "Action not allowed in an atomic batch: reset_demo",
+        }
+        assert simulator_api.get_case(case_id).status == "OPEN"
+
+    def test_atomic_batch_refuses_derived_view_readers(self, client, case_id, sample_case_create):
+        """Test that ledger, memory and runs reads cannot see uncommitted cases."""
+        ledger = client.post("/invocations", json={"action": "list_ledger"}).json()
+        for reader in ("list_ledger", "get_memory", "list_runs"):
+            actions = [
+                {"action": "create_case", "case": sample_case_create.model_dump(mode="json")},
+                {"action": reader},
+                {"action": "get_case", "case_id": "TW-MISSING"},
+            ]
+            body = client.post("/invocations", json={"actions": actions, "atomic": True}).json()
+            assert body == {
+                "success": False,
+                "error": f"Action not allowed in an atomic batch: {reader}",
+            }
+
+        assert client.post("/invocations", json={"action": "list_ledger"}).json() == ledger
+        assert len(simulator_api._cases) == 1
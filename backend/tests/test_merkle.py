@@ -0,0 +1,117 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Backend Tests - Ledger Merkle Checkpoints
+# ============================================
+
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.simulator.api import SimulatorAPI
+from src.simulator.demo_data import LedgerChain
+from src.simulator.merkle import (
+    build_levels,
+    inclusion_proof,
+    leaf_hash,
+    root_from_proof,
+    verify_segments,
+    verify_segments_parallel,
+)
+
+
+@pytest.fixture
+def chain():
+    """Chain over the Galderma scenario, sealed every 4 entries."""
+    simulator = SimulatorAPI()
+    simulator.create_galderma_scenario()
+    ledger = LedgerChain(checkpoint_size=4)
+    ledger.sync(*simulator.get_changes_since(0))
+    return ledger
+
+
+class TestMerkleTree:
+    """Tests for Merkle levels and proofs."""
+
+    @pytest.mark.parametrize("count", [1, 2, 5, 8, 13])
+    def test_every_leaf_proves_against_root(self, count):
+        """Test proofs for full and ragged trees."""
+        leaves = [leaf_hash(hashlib.sha256(str(i).encode()).hexdigest()) for i in range(count)]
+        levels = build_levels(leaves)
+        root = levels[-1][0]
+
+        for index, leaf in enumerate(leaves):
+            proof = inclusion_proof(levels, index)
+            assert len(proof) <= count.bit_length()
+            assert root_from_proof(leaf, proof) == root
+
+
+class TestLedgerCheckpoints:
+    """Tests for checkpointed ledger verification."""
+
+    def test_checkpoints_seal_every_segment(self, chain):
+        """Test that each full segment gets a checkpoint."""
+        checkpoints = chain.checkpoints()
+
+        assert len(checkpoints) == len(chain) // 4
+        assert checkpoints[-1]["root"] == chain.root
+        assert checkpoints[1]["start"] == 4
+
+    def test_range_verification_returns_proofs(self, chain):
+        """Test that sealed entries carry proofs and the tail does not."""
+        result = chain.verify_range(0, len(chain) - 1)
+
+        assert result["verified"], result["errors"]
+        sealed = [e for e in result["entries"] if e["proof"] is not None]
+        assert len(sealed) == len(chain.checkpoints()) * 4
+        for entry in sealed:
+            assert root_from_proof(leaf_hash(entry["entry_hash"]), entry["proof"]).hex() == chain.root
+
+    def test_tail_jobs_skip_sealed_segments(self, chain):
+        """Test that the tail snapshot starts after the last checkpoint."""
+        sealed = len(chain.checkpoints())
+        tail = chain.segment_jobs(first=sealed)
+
+        assert [job[0] for job in tail] == [job[0] for job in chain.segment_jobs()][sealed:]
+        assert all(job[3] is None for job in tail)
+
+    def test_tampering_is_detected(self, chain):
+        """Test that a rewritten sealed entry fails range and full checks."""
+        entry = chain._chain[5]
+        entry["ledger_id"] = "led-forged"
+        entry["entry_hash"] = hashlib.sha256(
+            f"{entry['ledger_id']}{entry['previous_hash']}".encode()
+        ).hexdigest()
+
+        result = chain.verify_range(5, 5)
+        assert not result["verified"]
+        assert {"index": 5, "error": "not included in checkpoint root"} in result["errors"]
+
+        errors = verify_segments(chain.segment_jobs())
+        assert {"index": 6, "error": "broken link"} in errors
+        assert {"index": 4, "error": "checkpoint root mismatch"} in errors
+
+    async def test_parallel_verification_matches_inline(self, chain):
+        """Test that the process pool finds the same problems."""
+        chain._chain[9]["entry_hash"] = "0" * 64
+        jobs = chain.segment_jobs()
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            parallel = await verify_segments_parallel(jobs, pool)
+
+        assert parallel == sorted(verify_segments(jobs), key=lambda e: e["index"])
+        assert parallel
+
+    def test_verify_endpoint(self, client):
+        """Test range and full verification over the API."""
+        client.post("/api/reset")
+        client.post("/api/scenario/galderma")
+
+        full = client.get("/api/ledger/verify").json()
+        assert full["verified"] and full["entries"] > 0
+
+        ranged = client.get("/api/ledger/verify", params={"from": 0, "to": 4}).json()
+        assert ranged["verified"]
+        assert [e["index"] for e in ranged["entries"]] == [0, 1, 2, 3, 4]
+
+        assert client.get("/api/ledger/verify", params={"from": 10_000}).status_code == 400
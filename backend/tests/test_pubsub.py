@@ -0,0 +1,167 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Backend Tests - Cross-Process Timeline Bus
+# ============================================
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from src.bridge import pubsub
+from src.bridge.pubsub import RedisBus, UnixSocketBus, create_timeline_bus
+from src.bridge.websocket import WebSocketManager
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+class TestUnixSocketBus:
+    """Tests for the local Unix-socket broker."""
+
+    async def test_every_worker_receives_every_event_once(self, tmp_path):
+        """Test that events from either worker reach both exactly once."""
+        path = str(tmp_path / "bus.sock")
+        worker_a, worker_b = UnixSocketBus(path), UnixSocketBus(path)
+        got_a, got_b = [], []
+        await worker_a.start(got_a.append)
+        await worker_b.start(got_b.append)
+        try:
+            assert worker_a.stats()["broker_host"]
+            assert not worker_b.stats()["broker_host"]
+
+            worker_a.publish({"type": "case_created", "case_id": "TW-A"})
+            worker_b.publish({"type": "case_created", "case_id": "TW-B"})
+            await _wait_for(lambda: len(got_a) == 2 and len(got_b) == 2)
+            await asyncio.sleep(0.05)
+
+            assert sorted(e["case_id"] for e in got_a) == ["TW-A", "TW-B"]
+            assert sorted(e["case_id"] for e in got_b) == ["TW-A", "TW-B"]
+        finally:
+            await worker_b.stop()
+            await worker_a.stop()
+
+    async def test_surviving_worker_takes_over_broker(self, tmp_path):
+        """Test that another worker hosts the broker when the host leaves."""
+        path = str(tmp_path / "bus.sock")
+        host, worker_b, worker_c = UnixSocketBus(path), UnixSocketBus(path), UnixSocketBus(path)
+        got_c = []
+        await host.start(lambda _: None)
+        await worker_b.start(lambda _: None)
+        await worker_c.start(got_c.append)
+        try:
+            await host.stop()
+            survivors = (worker_b, worker_c)
+            await _wait_for(lambda: any(w.stats()["broker_host"] for w in survivors))
+            await _wait_for(lambda: all(w.stats()["connected"] for w in survivors))
+
+            worker_b.publish({"type": "case_created", "case_id": "TW-1"})
+            await _wait_for(lambda: len(got_c) == 1)
+        finally:
+            await worker_c.stop()
+            await worker_b.stop()
+
+    async def test_manager_broadcasts_events_from_other_workers(self, tmp_path):
+        """Test that a manager's clients see events published on another worker."""
+        path = str(tmp_path / "bus.sock")
+        manager_a, manager_b = WebSocketManager(), WebSocketManager()
+        manager_a.start()
+        manager_b.start()
+        await manager_a.attach_bus(UnixSocketBus(path))
+        await manager_b.attach_bus(UnixSocketBus(path))
+        try:
+            manager_b.publish({"type": "case_created", "case_id": "TW-1"})
+            await _wait_for(lambda: manager_a.stats()["seq"] == 1)
+            assert manager_b.stats()["seq"] == 1
+        finally:
+            await manager_b.stop()
+            await manager_a.stop()
+
+
+class _FakePubSub:
+    """Redis pubsub whose listen() replays a script of messages and errors."""
+
+    def __init__(self, script: list) -> None:
+        self.script = script
+        self.closed = False
+
+    async def subscribe(self, channel: str) -> None:
+        pass
+
+    async def listen(self):
+        while self.script:
+            item = self.script.pop(0)
+            if isinstance(item, Exception):
+                raise item
+            yield {"data": item}
+        await asyncio.Event().wait()
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class _FakeRedis:
+    def __init__(self, script: list) -> None:
+        self.script = script
+
+    def pubsub(self, ignore_subscribe_messages: bool) -> _FakePubSub:
+        return _FakePubSub(self.script)
+
+
+class TestRedisBus:
+    """Tests for the Redis receive loop."""
+
+    async def test_survives_bad_messages_and_lost_connections(self, monkeypatch):
+        """Test that a bad payload is dropped and a lost connection resubscribes."""
+        monkeypatch.setattr(pubsub, "RECONNECT_DELAY_SECONDS", 0.01)
+        received = []
+        bus = RedisBus("redis://unused")
+        bus._deliver = received.append
+        script = [
+            json.dumps({"n": 1}),
+            "not json",
+            ConnectionError("connection reset"),
+            json.dumps({"n": 2}),
+        ]
+        bus._client = _FakeRedis(script)
+        first = _FakePubSub(script)
+
+        task = asyncio.create_task(bus._receive(first))
+        try:
+            await _wait_for(lambda: len(received) == 2)
+        finally:
+            task.cancel()
+
+        assert received == [{"n": 1}, {"n": 2}]
+        assert first.closed
+        assert bus.stats()["dropped"] == 1
+        assert bus.stats()["reconnects"] == 1
+
+
+class TestBusFactory:
+    """Tests for choosing the bus from settings."""
+
+    def test_inprocess_by_default(self):
+        """Test that a default deployment runs without a bus."""
+        assert create_timeline_bus() is None
+
+    def test_unix_path_is_per_server(self, monkeypatch):
+        """Test that the socket is named after the server process unless set."""
+        monkeypatch.setattr(pubsub.settings, "timeline_bus", "unix")
+        bus = create_timeline_bus()
+        assert isinstance(bus, UnixSocketBus)
+        assert bus.path.endswith(f"trackwise-timeline-{os.getppid()}.sock")
+
+        monkeypatch.setattr(pubsub.settings, "timeline_bus_path", "/run/trackwise/bus.sock")
+        assert create_timeline_bus().path == "/run/trackwise/bus.sock"
+
+    def test_unknown_backend_is_rejected(self, monkeypatch):
+        """Test that a misspelled TIMELINE_BUS fails instead of picking a bus."""
+        monkeypatch.setattr(pubsub.settings, "timeline_bus", "reddis")
+        with pytest.raises(ValueError, match="reddis"):
+            create_timeline_bus()
@@ -0,0 +1,100 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Backend Tests - JSON Responses
+# ============================================
+
+import json
+from datetime import datetime
+
+from src import responses
+from src.responses import EncodedRecords, case_json, dumps
+from src.simulator.api import simulator_api
+from src.simulator.demo_data import generate_runs_for_cases
+from src.simulator.models import CaseStatus, CaseUpdate
+
+
+class TestEncoding:
+    """Tests for the encoder and the per-record cache."""
+
+    def test_stdlib_fallback_matches(self, monkeypatch):
+        """Test that both encoders produce the same JSON."""
+        at = datetime(2026, 2, 4, 12, 0, 0, 123456)
+        content = {"at": at, "status": CaseStatus.OPEN, "n": [1]}
+        fast = json.loads(dumps(content))
+        monkeypatch.setattr(responses, "orjson", None)
+        assert json.loads(dumps(content)) == fast
+        assert fast == {"at": "2026-02-04T12:00:00.123456", "status": "OPEN", "n": [1]}
+
+    def test_records_follow_versions(self):
+        """Test hits, re-encoding on a new version, pruning and the size cap."""
+        encoded = []
+        cache = EncodedRecords(lambda r: encoded.append(r) or str(r).encode(), max_records=2)
+
+        assert cache.get("a", 1, version=1) == b"1"
+        assert cache.get("a", 2, version=1) == b"1"
+        assert cache.get("a", 2, version=2) == b"2"
+        assert encoded == [1, 2]
+
+        cache.get("b", 3)
+        cache.get("c", 4)
+        assert cache.stats()["records"] == 2
+        cache.prune({"c": 0})
+        assert cache.stats() == {"records": 1, "hits": 1, "misses": 4}
+
+
+class TestEncodedRoutes:
+    """Tests that cached-bytes routes answer exactly like the models."""
+
+    def test_cases_refresh_after_update(self, client):
+        """Test /api/cases against the model dump, before and after a change."""
+        client.post("/api/reset")
+        client.post("/api/scenario/galderma")
+
+        expected = simulator_api.list_cases(page_size=100).model_dump(mode="json")
+        assert client.get("/api/cases", params={"page_size": 100}).json() == expected
+
+        case_id = expected["cases"][0]["case_id"]
+        client.patch(f"/api/cases/{case_id}", json={"status": "IN_PROGRESS"})
+        body = client.get("/api/cases", params={"page_size": 100}).json()
+        assert body == simulator_api.list_cases(page_size=100).model_dump(mode="json")
+        assert body["cases"][0]["status"] == "IN_PROGRESS"
+
+        invoked = client.post("/invocations", json={"action": "list_cases", "page_size": 100})
+        assert invoked.json()["result"] == body
+
+    def test_case_refreshes_after_update(self, client):
+        """Test /api/cases/{id} against the model dump, served from the cache."""
+        client.post("/api/reset")
+        client.post("/api/scenario/galderma")
+        case_id = next(iter(simulator_api._cases))
+
+        first = client.get(f"/api/cases/{case_id}")
+        assert first.headers["content-type"] == "application/json"
+        assert first.json() == simulator_api.get_case(case_id).model_dump(mode="json")
+        hits = case_json.stats()["hits"]
+        assert client.get(f"/api/cases/{case_id}").content == first.content
+        assert case_json.stats()["hits"] == hits + 1
+
+        client.patch(f"/api/cases/{case_id}", json={"status": "IN_PROGRESS"})
+        assert client.get(f"/api/cases/{case_id}").json()["status"] == "IN_PROGRESS"
+        assert client.get("/api/cases/TW-MISSING").status_code == 404
+
+    def test_events_and_runs(self, client):
+        """Test /api/events and /api/runs against their records."""
+        client.post("/api/reset")
+        client.post("/api/scenario/galderma")
+        simulator_api.update_case(
+            next(iter(simulator_api._cases)), CaseUpdate(status=CaseStatus.PENDING_REVIEW)
+        )
+
+        events = client.get("/api/events", params={"limit": 1000})
+        assert events.headers["content-type"] == "application/json"
+        assert events.json() == [
+            e.model_dump(mode="json") for e in simulator_api.get_events(limit=1000)
+        ]
+
+        runs = generate_runs_for_cases(
+            list(simulator_api._cases.values()), versions=simulator_api.get_case_versions()
+        )
+        assert client.get("/api/runs").json() == runs
+        assert client.get("/api/runs", params={"status": "NOPE"}).json() == []
@@ -3,6 +3,7 @@
 # Backend Tests - Simulator API
 # ============================================
 
+import pytest
 
 from src.simulator.api import SimulatorAPI
 from src.simulator.models import (
@@ -206,3 +207,42 @@ class TestSimulatorAPIIntegration:
 
         # At least some should be packaging (recurring pattern is every 3rd)
         assert packaging_count >= 3
+
+
+class TestSimulatorTransaction:
+    """Tests for all-or-nothing case operations."""
+
+    def test_commit_delivers_held_events(self, simulator, sample_case_create):
+        """Test that listeners see events only once the block exits."""
+        seen = []
+        simulator.add_event_listener(seen.append)
+        with simulator.transaction():
+            case, _ = simulator.create_case(sample_case_create)
+            simulator.close_case(case.case_id, resolution_text="Replaced")
+            assert seen == []
+
+        assert [e.event_type for e in seen] == [
+            EventType.CASE_CREATED,
+            EventType.FACTORY_COMPLAINT_CLOSED,
+        ]
+        assert simulator.get_case(case.case_id).status == CaseStatus.CLOSED
+
+    def test_rollback_restores_cases(self, simulator, sample_case_create):
+        """Test that a raising block leaves cases, versions and events as before."""
+        case, _ = simulator.create_case(sample_case_create)
+        seen = []
+        simulator.add_event_listener(seen.append)
+        revision = simulator.get_changes_since(0)[0]
+
+        with pytest.raises(ValueError), simulator.transaction():
+            simulator.update_case(case.case_id, CaseUpdate(status=CaseStatus.IN_PROGRESS))
+            created, _ = simulator.create_case(sample_case_create)
+            raise ValueError("abort")
+
+        assert simulator.get_case(case.case_id).status == CaseStatus.OPEN
+        assert simulator.get_case(created.case_id) is None
+        assert len(simulator.get_events()) == 1
+        assert seen == []
+        # The restored case is reported as changed so derived views re-read it
+        _, changed, _ = simulator.get_changes_since(revision)
+        assert [c.case_id for c in changed] == [case.case_id]
@@ -0,0 +1,118 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Backend Tests - Streaming Spike Detection
+# ============================================
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.bridge.spikes import SpikeDetector, WindowedCounter, spike_detector
+from src.simulator.models import CaseType
+
+
+KEY = ("CETAPHIL", "Gentle Skin Cleanser", "LOT-12345", "PACKAGING")
+START = datetime(2026, 2, 4, 12, 0, 0)
+
+
+@pytest.fixture
+def detector():
+    """Detector with a 60-minute window of 5-minute buckets."""
+    published = []
+    spikes = SpikeDetector(published.append, window_seconds=3600, buckets=12, min_count=5)
+    spikes.published = published
+    return spikes
+
+
+class TestWindowedCounter:
+    """Tests for the ring-buffer window and EWMA baseline."""
+
+    def test_counts_expire_after_window(self):
+        """Test that events leave the window once it has slid past them."""
+        counter = WindowedCounter(buckets=4, bucket=0)
+        for bucket in (0, 1, 1, 3):
+            counter.advance(bucket, alpha=0.5)
+            counter.add()
+        assert counter.count == 4
+
+        counter.advance(5, alpha=0.5)
+        assert counter.count == 1
+        counter.advance(100, alpha=0.5)
+        assert counter.count == 0
+
+    def test_idle_gap_decays_baseline(self):
+        """Test closed-form decay over gaps longer than the window."""
+        counter = WindowedCounter(buckets=2, bucket=0)
+        counter.add()
+        counter.advance(2, alpha=0.5)
+        assert counter.baseline == 0.5
+
+        counter.advance(6, alpha=0.5)
+        assert counter.baseline == pytest.approx(0.5 * 0.5**4)
+
+
+class TestSpikeDetector:
+    """Tests for spike alerts."""
+
+    def test_burst_alerts_once(self, detector):
+        """Test that ten complaints in an hour raise a single alert."""
+        for i in range(10):
+            detector.observe(KEY, START + timedelta(minutes=3 * i), case_id=f"TW-{i}")
+
+        (alert,) = detector.published
+        assert alert["type"] == "pattern_matched"
+        assert alert["case_id"] == "TW-4"
+        assert alert["data"]["kind"] == "spike"
+        assert alert["data"]["window_count"] == 5
+        assert alert["data"]["lot_number"] == "LOT-12345"
+
+    def test_steady_rate_is_baseline(self, detector):
+        """Test that a learned steady rate stays quiet until it triples."""
+        now = START
+        for _ in range(24 * 12):
+            now += timedelta(minutes=5)
+            detector.observe(KEY, now)
+        detector.published.clear()
+        detector._counters[KEY].alerting = False
+
+        for _ in range(12):
+            now += timedelta(minutes=5)
+            detector.observe(KEY, now)
+        assert detector.published == []
+
+        for _ in range(30):
+            detector.observe(KEY, now)
+        assert len(detector.published) == 1
+
+    def test_keys_are_bounded(self):
+        """Test that the least recently seen key is evicted."""
+        spikes = SpikeDetector(lambda _: None, max_keys=3)
+        for lot in range(5):
+            spikes.observe(("CETAPHIL", "Lotion", f"LOT-{lot}", "QUALITY"), START)
+
+        assert spikes.stats()["keys"] == 3
+        assert spikes.stats()["evicted"] == 2
+        assert ("CETAPHIL", "Lotion", "LOT-0", "QUALITY") not in spikes._counters
+
+    def test_fed_by_simulator_events(self, detector, simulator, sample_case_create):
+        """Test that created complaints count and inquiries do not."""
+        simulator.add_event_listener(detector.on_event)
+        inquiry = sample_case_create.model_copy(update={"case_type": CaseType.INQUIRY})
+        for _ in range(5):
+            simulator.create_case(inquiry)
+        assert detector.stats()["events"] == 0
+
+        for _ in range(5):
+            simulator.create_case(sample_case_create)
+
+        (alert,) = detector.published
+        assert alert["data"]["category"] == "PACKAGING"
+        assert alert["data"]["brand"] == "CETAPHIL"
+
+    def test_reset_forgets_keys(self, client):
+        """Test that /api/reset clears the detector's windows."""
+        spike_detector.observe(KEY, START)
+        assert spike_detector.stats()["keys"] >= 1
+
+        client.post("/api/reset")
+        assert spike_detector.stats()["keys"] == 0
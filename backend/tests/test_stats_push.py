@@ -0,0 +1,67 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Backend Tests - Live Stats Channel
+# ============================================
+
+import asyncio
+
+from src.bridge.stats import StatsPublisher
+
+
+class TestStatsPublisher:
+    """Tests for throttled stats deltas."""
+
+    def test_flush_publishes_only_changed_keys(self):
+        """Test that a delta carries changed counters with their new values."""
+        counters = {"stats": {"total_cases": 1, "open_cases": 1}}
+        published = []
+        publisher = StatsPublisher(
+            lambda: {k: dict(v) for k, v in counters.items()}, published.append
+        )
+        publisher._last = publisher._snapshot()
+
+        counters["stats"]["total_cases"] = 2
+        event = publisher.flush()
+
+        assert event["type"] == "stats_delta"
+        assert event["data"] == {"stats": {"total_cases": 2}}
+        assert publisher.flush() is None
+        assert len(published) == 1
+
+    async def test_bursts_are_throttled(self):
+        """Test that many mutations within an interval produce one push."""
+        counters = {"stats": {"total_cases": 0}}
+        published = []
+        publisher = StatsPublisher(
+            lambda: {"stats": dict(counters["stats"])}, published.append, interval_seconds=0.05
+        )
+        publisher.start()
+        try:
+            for i in range(1, 51):
+                counters["stats"]["total_cases"] = i
+                publisher.mark_dirty()
+                await asyncio.sleep(0)
+            await asyncio.sleep(0.1)
+        finally:
+            await publisher.stop()
+
+        assert 1 <= len(published) <= 3
+        assert published[-1]["data"]["stats"]["total_cases"] == 50
+
+
+class TestStatsOverWebSocket:
+    """Tests for stats_delta events on /ws/timeline."""
+
+    def test_case_created_pushes_stats_delta(self, client, sample_case_create):
+        """Test that a mutation reaches subscribed dashboards as a delta."""
+        with client.websocket_connect("/ws/timeline") as ws:
+            ws.receive_json()  # welcome
+            ws.send_text("subscribe:type=stats_delta")
+            ws.receive_json()  # ack
+
+            client.post("/api/cases", json=sample_case_create.model_dump(mode="json"))
+
+            event = ws.receive_json()
+            assert event["type"] == "stats_delta"
+            assert event["data"]["stats"]["total_cases"] >= 1
+            assert "executive" in event["data"]
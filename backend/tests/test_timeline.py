@@ -0,0 +1,411 @@
+# ============================================
+# Galderma TrackWise AI Autopilot Demo
+# Backend Tests - Timeline WebSocket
+# ============================================
+
+import asyncio
+import json
+
+import pytest
+
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from src.bridge import websocket as websocket_module
+from src.bridge.websocket import (
+    FrameEncoding,
+    SlowConsumerPolicy,
+    WebSocketManager,
+    parse_coalesce,
+    parse_resume,
+    parse_subscription,
+    timeline_event_from_envelope,
+)
+from src.simulator.models import EventEnvelope, EventType
+
+
+class TestTimelineEventMapping:
+    """Tests for simulator → timeline event conversion."""
+
+    def test_factory_closure_maps_to_case_closed(self):
+        """Test that FactoryComplaintClosed is shown as case_closed."""
+        envelope = EventEnvelope(
+            event_type=EventType.FACTORY_COMPLAINT_CLOSED,
+            payload={"case_id": "TW-0001"},
+        )
+        event = timeline_event_from_envelope(envelope)
+
+        assert event["type"] == "case_closed"
+        assert event["case_id"] == "TW-0001"
+        assert event["event_id"] == envelope.event_id
+
+
+class TestTimelineWebSocket:
+    """Tests for /ws/timeline broadcast pipeline."""
+
+    def test_case_created_reaches_timeline(self, client, sample_case_create):
+        """Test that creating a case is pushed to connected clients."""
+        with client.websocket_connect("/ws/timeline") as ws:
+            welcome = ws.receive_json()
+            assert welcome["type"] == "system_message"
+
+            created = client.post(
+                "/api/cases", json=sample_case_create.model_dump(mode="json")
+            ).json()
+
+            event = ws.receive_json()
+            while event["type"] == "stats_delta":
+                event = ws.receive_json()
+            assert event["type"] == "case_created"
+            assert event["case_id"] == created["case_id"]
+            assert event["data"]["case"]["product_brand"] == "CETAPHIL"
+
+
+    def test_stats_endpoint(self, client):
+        """Test that fan-out counters are exposed for load testing."""
+        stats = client.get("/api/timeline/stats").json()
+        assert stats["dropped_frames"] == 0
+        assert "bus" in stats
+
+
+class _FakeSocket:
+    """WebSocket stand-in; stalls every send until ``gate`` is set."""
+
+    def __init__(self, stalled: bool = False):
+        self.sent: list[str] = []
+        self.closed_code: int | None = None
+        self.gate = asyncio.Event()
+        if not stalled:
+            self.gate.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        await self.gate.wait()
+        self.sent.append(text)
+
+    async def send_bytes(self, data: bytes):
+        await self.gate.wait()
+        self.sent.append(data)
+
+    async def close(self, code: int = 1000):
+        self.closed_code = code
+
+
+async def _drain():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestSlowConsumers:
+    """Tests for per-connection send queues."""
+
+    async def test_stalled_client_does_not_block_others(self):
+        """Test that a stalled socket drops its oldest frames only."""
+        manager = WebSocketManager(send_queue_size=2)
+        fast, stalled = _FakeSocket(), _FakeSocket(stalled=True)
+        await manager.connect(fast)
+        await manager.connect(stalled)
+        await _drain()
+
+        for i in range(5):
+            await manager.broadcast({"type": "case_created", "case_id": f"TW-{i}"})
+            await _drain()
+
+        assert len(fast.sent) == 6  # welcome + 5 events
+        assert manager.connection_count == 2
+        assert manager.stats()["dropped_frames"] == 3
+
+    async def test_disconnect_policy_evicts_slow_client(self):
+        """Test that the disconnect policy closes a client with a full queue."""
+        manager = WebSocketManager(
+            send_queue_size=1, slow_consumer_policy=SlowConsumerPolicy.DISCONNECT
+        )
+        stalled = _FakeSocket(stalled=True)
+        await manager.connect(stalled)
+        await _drain()
+
+        for i in range(3):
+            await manager.broadcast({"type": "case_created", "case_id": f"TW-{i}"})
+        await _drain()
+
+        assert manager.connection_count == 0
+        assert stalled.closed_code == 1013
+        assert not manager._close_tasks
+
+
+class TestSubscriptions:
+    """Tests for server-side subscription filters."""
+
+    async def test_filtered_client_only_gets_matching_events(self):
+        """Test that a case filter excludes other cases but not the firehose."""
+        manager = WebSocketManager()
+        detail, dashboard = _FakeSocket(), _FakeSocket()
+        await manager.connect(detail)
+        await manager.connect(dashboard)
+        assert manager.subscribe(detail, "case_id=TW-1")
+        await _drain()
+
+        await manager.broadcast({"type": "case_created", "case_id": "TW-1"})
+        await manager.broadcast({"type": "case_created", "case_id": "TW-2"})
+        await _drain()
+
+        detail_cases = [json.loads(m).get("case_id") for m in detail.sent[1:]]
+        assert detail_cases == ["TW-1"]
+        assert len(dashboard.sent) == 3
+
+    async def test_unsubscribe_restores_firehose(self):
+        """Test that removing the last filter returns the client to the firehose."""
+        manager = WebSocketManager()
+        socket = _FakeSocket()
+        await manager.connect(socket)
+        manager.subscribe(socket, "agent=writeback")
+        assert manager.unsubscribe(socket, "agent=writeback")
+        assert manager.stats()["firehose_connections"] == 1
+        assert manager.stats()["subscription_routes"] == 0
+
+    def test_invalid_filter_rejected(self):
+        """Test that unknown fields are rejected."""
+        manager = WebSocketManager()
+        assert manager.subscribe(object(), "case_id=TW-1") is False
+        assert parse_subscription("color=red") is None
+        assert parse_subscription("run_id=") is None
+        assert parse_subscription("run_id=run-1") == ("run_id", "run-1")
+
+    def test_subscribe_over_websocket(self, client, sample_case_create):
+        """Test the subscribe: protocol end to end."""
+        with client.websocket_connect("/ws/timeline") as ws:
+            ws.receive_json()  # welcome
+            ws.send_text("subscribe:type=case_updated")
+            assert ws.receive_json()["message"] == "subscribed: type=case_updated"
+
+            body = sample_case_create.model_dump(mode="json")
+            case_id = client.post("/api/cases", json=body).json()["case_id"]
+            client.patch(f"/api/cases/{case_id}", json={"status": "IN_PROGRESS"})
+
+            event = ws.receive_json()
+            assert event["type"] == "case_updated"
+            assert event["case_id"] == case_id
+
+
+class TestResume:
+    """Tests for sequence numbers and replay after reconnect."""
+
+    async def _reconnect_after(self, manager, events, hold=False):
+        first = _FakeSocket()
+        await manager.connect(first)
+        await manager.broadcast({"type": "case_created", "case_id": "TW-0"})
+        await _drain()
+        last_seq = json.loads(first.sent[-1])["seq"]
+        manager.disconnect(first)
+
+        for event in events:
+            await manager.broadcast(event)
+
+        second = _FakeSocket()
+        await manager.connect(second, hold=hold)
+        return second, last_seq
+
+    async def test_resume_replays_only_the_gap(self):
+        """Test that a reconnecting client gets exactly the missed events."""
+        manager = WebSocketManager()
+        missed = [{"type": "case_updated", "case_id": f"TW-{i}"} for i in (1, 2)]
+        socket, last_seq = await self._reconnect_after(manager, missed)
+
+        assert manager.resume(socket, f"{manager.stream_id}:{last_seq}") == 2
+        await _drain()
+
+        replayed = [json.loads(m) for m in socket.sent[1:]]
+        assert [e["case_id"] for e in replayed] == ["TW-1", "TW-2"]
+        assert [e["seq"] for e in replayed] == [last_seq + 1, last_seq + 2]
+
+    async def test_resume_respects_filters(self):
+        """Test that replay skips events the client's filters reject."""
+        manager = WebSocketManager()
+        missed = [{"type": "case_updated", "case_id": f"TW-{i}"} for i in (1, 2)]
+        socket, last_seq = await self._reconnect_after(manager, missed)
+
+        manager.subscribe(socket, "case_id=TW-2")
+        assert manager.resume(socket, str(last_seq)) == 1
+
+    async def test_held_live_events_follow_the_replay(self):
+        """Test that events broadcast before the resume arrive after the replay."""
+        manager = WebSocketManager()
+        missed = [{"type": "case_updated", "case_id": f"TW-{i}"} for i in (1, 2)]
+        socket, last_seq = await self._reconnect_after(manager, missed, hold=True)
+
+        await manager.broadcast({"type": "case_updated", "case_id": "TW-3"})
+        await _drain()
+        assert len(socket.sent) == 1  # welcome only, live event held
+
+        assert manager.resume(socket, f"{manager.stream_id}:{last_seq}") == 2
+        await manager.broadcast({"type": "case_updated", "case_id": "TW-4"})
+        await _drain()
+
+        events = [json.loads(m) for m in socket.sent[1:]]
+        assert [e["case_id"] for e in events] == ["TW-1", "TW-2", "TW-3", "TW-4"]
+        assert [e["seq"] for e in events] == list(range(last_seq + 1, last_seq + 5))
+
+    async def test_hold_without_resume_ends(self):
+        """Test that a held client that never resumes still goes live."""
+        manager = WebSocketManager(send_queue_size=4)
+        socket = _FakeSocket()
+        await manager.connect(socket, hold=True)
+        for i in range(3):
+            await manager.broadcast({"type": "case_updated", "case_id": f"TW-{i}"})
+        await _drain()
+
+        assert [json.loads(m).get("case_id") for m in socket.sent] == [None, "TW-0", "TW-1", "TW-2"]
+        # The live events already went out, so a late replay would be out of order
+        assert manager.resume(socket, "0") is None
+
+    async def test_hold_times_out_on_a_quiet_stream(self):
+        """Test that a held client that never resumes goes live after the timeout."""
+        manager = WebSocketManager(resume_hold_seconds=0.05)
+        socket = _FakeSocket()
+        await manager.connect(socket, hold=True)
+        await manager.broadcast({"type": "case_updated", "case_id": "TW-1"})
+        await _drain()
+        assert len(socket.sent) == 1
+
+        await asyncio.sleep(0.1)
+        await _drain()
+        assert json.loads(socket.sent[-1])["case_id"] == "TW-1"
+        assert manager.resume(socket, "0") is None
+
+    async def test_gap_outside_ring_requires_resync(self):
+        """Test that an evicted gap, new stream or future seq needs a resync."""
+        manager = WebSocketManager(replay_buffer_size=2)
+        missed = [{"type": "case_updated", "case_id": f"TW-{i}"} for i in range(5)]
+        socket, last_seq = await self._reconnect_after(manager, missed)
+
+        assert manager.resume(socket, str(last_seq)) is None
+        assert manager.resume(socket, f"other-stream:{manager.stats()['seq']}") is None
+        assert manager.resume(socket, "999") is None
+        assert manager.resume(socket, str(manager.stats()["seq"])) == 0
+
+    def test_parse_resume(self):
+        """Test resume spec parsing."""
+        assert parse_resume("42") == (None, 42)
+        assert parse_resume("abc123:7") == ("abc123", 7)
+        assert parse_resume("abc") is None
+        assert parse_resume("-1") is None
+
+    def test_resume_over_websocket(self, client):
+        """Test the resume: protocol end to end."""
+        with client.websocket_connect("/ws/timeline") as ws:
+            welcome = ws.receive_json()
+            assert "stream_id" in welcome and "seq" in welcome
+
+            ws.send_text(f"resume:{welcome['stream_id']}:{welcome['seq']}")
+            ack = ws.receive_json()
+            assert ack["message"] == "resumed"
+            assert ack["resync"] is False
+
+            ws.send_text("resume:not-this-server:0")
+            assert ws.receive_json()["message"] == "resync_required"
+
+        with client.websocket_connect("/ws/timeline?resume=1") as ws:
+            welcome = ws.receive_json()
+            ws.send_text(f"resume:{welcome['stream_id']}:{welcome['seq']}")
+            assert ws.receive_json()["message"] == "resumed"
+
+
+class TestCoalescing:
+    """Tests for negotiated array frames."""
+
+    async def test_burst_is_packed_into_one_frame(self):
+        """Test that a coalescing client gets a burst as one array frame."""
+        manager = WebSocketManager()
+        socket = _FakeSocket()
+        await manager.connect(socket)
+        await _drain()
+        assert manager.set_coalescing(socket, "20")
+
+        for i in range(5):
+            await manager.broadcast({"type": "case_created", "case_id": f"TW-{i}"})
+        await asyncio.sleep(0.05)
+
+        frames = [json.loads(m) for m in socket.sent[1:]]
+        assert len(frames) == 1
+        assert [e["case_id"] for e in frames[0]] == [f"TW-{i}" for i in range(5)]
+        assert manager.stats()["frames_saved"] == 4
+
+    async def test_batch_size_flushes_early(self):
+        """Test that reaching the event cap flushes before the interval."""
+        manager = WebSocketManager()
+        socket = _FakeSocket()
+        await manager.connect(socket)
+        await _drain()
+        manager.set_coalescing(socket, "1000,2")
+
+        for i in range(4):
+            await manager.broadcast({"type": "case_created", "case_id": f"TW-{i}"})
+        await _drain()
+
+        assert [len(json.loads(m)) for m in socket.sent[1:]] == [2, 2]
+
+    def test_parse_coalesce(self):
+        """Test coalescing spec parsing and the server cap."""
+        assert parse_coalesce("50", 200) == (0.05, 200)
+        assert parse_coalesce("10,500", 200) == (0.01, 200)
+        assert parse_coalesce("off", 200) == (0.0, 1)
+        assert parse_coalesce("fast", 200) is None
+        assert parse_coalesce("5000", 200) is None
+
+
+@pytest.mark.skipif(msgpack is None, reason="msgpack not installed")
+class TestFrameEncodings:
+    """Tests for negotiated MessagePack frames."""
+
+    async def test_msgpack_client_gets_binary_frames(self):
+        """Test that JSON and MessagePack clients share one broadcast."""
+        manager = WebSocketManager()
+        text, binary = _FakeSocket(), _FakeSocket()
+        await manager.connect(text)
+        await manager.connect(binary, FrameEncoding.MSGPACK)
+        await manager.broadcast({"type": "case_created", "case_id": "TW-1"})
+        await _drain()
+
+        assert msgpack.unpackb(binary.sent[0])["encoding"] == "msgpack"
+        decoded = msgpack.unpackb(binary.sent[1])
+        assert decoded == json.loads(text.sent[1])
+        assert manager.stats()["msgpack_connections"] == 1
+
+    async def test_msgpack_coalesced_frame_is_an_array(self):
+        """Test that coalesced MessagePack payloads form a valid array."""
+        manager = WebSocketManager()
+        socket = _FakeSocket()
+        await manager.connect(socket, FrameEncoding.MSGPACK)
+        await _drain()
+        manager.set_coalescing(socket, "1000,3")
+
+        for i in range(3):
+            await manager.broadcast({"type": "case_created", "case_id": f"TW-{i}"})
+        await _drain()
+
+        batch = msgpack.unpackb(socket.sent[1])
+        assert [e["case_id"] for e in batch] == ["TW-0", "TW-1", "TW-2"]
+
+    async def test_unavailable_encoding_falls_back_to_json(self, monkeypatch):
+        """Test that msgpack requests fall back to JSON without the package."""
+        monkeypatch.setattr(websocket_module, "msgpack", None)
+        manager = WebSocketManager()
+        socket = _FakeSocket()
+        await manager.connect(socket, FrameEncoding.MSGPACK)
+        await _drain()
+        assert json.loads(socket.sent[0])["encoding"] == "json"
+
+    @pytest.mark.parametrize("encoding", ["json", "msgpack"])
+    def test_encoding_query_param(self, client, encoding):
+        """Test ?encoding= negotiation over a real WebSocket."""
+        with client.websocket_connect(f"/ws/timeline?encoding={encoding}") as ws:
+            if encoding == "msgpack":
+                welcome = msgpack.unpackb(ws.receive_bytes())
+            else:
+                welcome = ws.receive_json()
+            assert welcome["encoding"] == encoding
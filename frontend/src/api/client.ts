@@ -102,16 +102,34 @@ export async function getRun(runId: string): Promise<Run> {
 // ============================================
 // Ledger API
 // ============================================
-export async function getLedgerEntries(params?: {
+export interface LedgerQuery {
   case_id?: string
   run_id?: string
   agent_name?: AgentName
   limit?: number
-}): Promise<LedgerEntry[]> {
+}
+
+export async function getLedgerEntries(params?: LedgerQuery): Promise<LedgerEntry[]> {
   const response = await api.get<LedgerEntry[]>('/ledger', { params })
   return response.data
 }
 
+export interface LedgerPage {
+  entries: LedgerEntry[]
+  nextCursor: string | null
+}
+
+// One page of entries; pass nextCursor back to continue where the page ended
+export async function getLedgerPage(
+  params?: LedgerQuery & { cursor?: string }
+): Promise<LedgerPage> {
+  const response = await api.get<LedgerEntry[]>('/ledger', { params })
+  return {
+    entries: response.data,
+    nextCursor: (response.headers['x-next-cursor'] as string | undefined) ?? null,
+  }
+}
+
 // ============================================
 // Events API
 // ============================================
@@ -153,6 +171,38 @@ export async function getExecutiveStats(): Promise<ExecutiveStats> {
   return response.data
 }
 
+export type AnalyticsDimension = 'brand' | 'product' | 'category' | 'severity' | 'status' | 'case_type'
+
+export interface AnalyticsQuery {
+  group_by: AnalyticsDimension[]
+  bucket?: 'hour' | 'day' | 'week'
+  days?: number
+  brand?: string
+  product?: string
+  category?: string
+  severity?: CaseSeverity
+  status?: CaseStatus
+  case_type?: CaseType
+}
+
+export interface AnalyticsAggregate {
+  group_by: AnalyticsDimension[]
+  bucket: string | null
+  since: string | null
+  filters: Record<string, string>
+  total: number
+  groups: Array<Partial<Record<AnalyticsDimension | 'bucket', string | null>> & { count: number }>
+}
+
+export async function getAnalyticsAggregate(query: AnalyticsQuery): Promise<AnalyticsAggregate> {
+  const response = await api.get<AnalyticsAggregate>('/analytics/aggregate', {
+    params: query,
+    // FastAPI reads repeated keys (group_by=brand&group_by=category) as a list
+    paramsSerializer: { indexes: null },
+  })
+  return response.data
+}
+
 // ============================================
 // Memory API
 // ============================================
@@ -226,11 +276,61 @@ export interface CSVPackResult {
   status: string
 }
 
-export async function generateCSVPack(): Promise<CSVPackResult> {
-  const response = await api.post<CSVPackResult>('/csv-pack')
+export interface CSVPackJob {
+  job_id: string
+  status: 'queued' | 'running' | 'complete' | 'failed'
+  completed_steps: number
+  total_steps: number
+  current_step: string | null
+  cached: boolean
+  input_hash: string
+  error: string | null
+  result?: CSVPackResult
+}
+
+export async function startCSVPack(): Promise<CSVPackJob> {
+  const response = await api.post<CSVPackJob>('/csv-pack')
   return response.data
 }
 
+export async function getCSVPackJob(jobId: string): Promise<CSVPackJob> {
+  const response = await api.get<CSVPackJob>(`/csv-pack/${jobId}`)
+  return response.data
+}
+
+export function csvPackDownloadUrl(jobId: string): string {
+  return `${API_BASE_URL}/csv-pack/${jobId}/download`
+}
+
+// Starts a pack job and polls until it finishes; unchanged packs come back at once
+export async function generateCSVPack(
+  onProgress?: (job: CSVPackJob) => void,
+  pollIntervalMs = 300
+): Promise<CSVPackJob> {
+  let job = await startCSVPack()
+  onProgress?.(job)
+  while (job.status === 'queued' || job.status === 'running') {
+    await new Promise((resolve) => setTimeout(resolve, pollIntervalMs))
+    job = await getCSVPackJob(job.job_id)
+    onProgress?.(job)
+  }
+  if (job.status === 'failed' || !job.result) {
+    throw new Error(job.error ?? 'CSV pack job failed')
+  }
+  return job
+}
+
+// ============================================
+// Export API
+// ============================================
+export type ExportKind = 'cases' | 'events' | 'ledger'
+
+// Streamed NDJSON download; accepts the same filters as the matching list call
+export function exportUrl(kind: ExportKind, params?: Record<string, string>): string {
+  const query = params ? `?${new URLSearchParams(params).toString()}` : ''
+  return `${API_BASE_URL}/export/${kind}.ndjson${query}`
+}
+
 // ============================================
 // Scenario API
 // ============================================
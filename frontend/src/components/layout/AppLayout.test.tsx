@@ -25,6 +25,10 @@ vi.mock('@/hooks/useRealtimeSync', () => ({
   useRealtimeSync: () => undefined,
 }))
 
+vi.mock('@/hooks/useWebSocket', () => ({
+  useWebSocket: () => undefined,
+}))
+
 vi.mock('@/hooks/useSacSimulator', () => ({
   useSacSimulator: () => undefined,
 }))
@@ -10,6 +10,7 @@ import { Toaster } from 'sonner'
 import { useExecutiveStats } from '@/hooks'
 import { useRealtimeSync } from '@/hooks/useRealtimeSync'
 import { useSacSimulator } from '@/hooks/useSacSimulator'
+import { useWebSocket } from '@/hooks/useWebSocket'
 import { useTimelineStore } from '@/stores'
 import type { AgentName } from '@/types'
 import { CommandPalette } from './CommandPalette'
@@ -47,6 +48,7 @@ function toAgentName(agent?: string): AgentName | undefined {
 }
 
 export function AppLayout() {
+  useWebSocket()
   useRealtimeSync()
   useSacSimulator()
 
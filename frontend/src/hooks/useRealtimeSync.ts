@@ -6,9 +6,11 @@
 import { useEffect, useRef } from 'react'
 import { useQueryClient } from '@tanstack/react-query'
 
+import type { ExecutiveStats } from '@/api/client'
 import { useTimelineStore } from '@/stores'
+import type { Statistics } from '@/types'
 import { caseKeys } from './useCases'
-import { statsKeys, executiveKeys } from './useStats'
+import { statsKeys, executiveKeys, memoryKeys } from './useStats'
 import { runKeys, ledgerKeys } from './useCaseDetail'
 
 // Event types that trigger cache invalidation
@@ -21,6 +23,10 @@ const CASE_EVENTS = new Set([
   'agent_completed',
 ])
 
+// Memory is derived from case state and has no delta of its own; during
+// activity it is refetched at most this often (the old poll interval)
+const MEMORY_REFRESH_INTERVAL = 10000
+
 /**
  * useRealtimeSync
  *
@@ -29,11 +35,52 @@ const CASE_EVENTS = new Set([
  *
  * This makes the UI reactively update when agents process cases
  * without requiring manual refresh or aggressive polling.
+ *
+ * Dashboard counters arrive as throttled `stats_delta` pushes and are
+ * written straight into the stats caches instead of being refetched.
+ * Memory is refetched after a push too, but at most once per
+ * MEMORY_REFRESH_INTERVAL, with a trailing refetch for the last change.
  */
 export function useRealtimeSync() {
   const queryClient = useQueryClient()
   const events = useTimelineStore((s) => s.events)
+  const liveStats = useTimelineStore((s) => s.liveStats)
   const lastProcessedRef = useRef(0)
+  const memoryRefreshedAtRef = useRef(0)
+  const memoryTimerRef = useRef<number | null>(null)
+
+  useEffect(() => {
+    return () => {
+      if (memoryTimerRef.current) {
+        clearTimeout(memoryTimerRef.current)
+      }
+    }
+  }, [])
+
+  useEffect(() => {
+    if (!liveStats) return
+
+    queryClient.setQueryData<Statistics>(statsKeys.all, (old) =>
+      old ? { ...old, ...liveStats.stats } : old
+    )
+    queryClient.setQueryData<ExecutiveStats>(executiveKeys.all, (old) =>
+      old ? { ...old, ...liveStats.executive } : old
+    )
+
+    // Memory is derived from case state; refresh it, throttled
+    if (memoryTimerRef.current) return
+    const refreshMemory = () => {
+      memoryTimerRef.current = null
+      memoryRefreshedAtRef.current = Date.now()
+      queryClient.invalidateQueries({ queryKey: memoryKeys.all })
+    }
+    const wait = memoryRefreshedAtRef.current + MEMORY_REFRESH_INTERVAL - Date.now()
+    if (wait <= 0) {
+      refreshMemory()
+    } else {
+      memoryTimerRef.current = window.setTimeout(refreshMemory, wait)
+    }
+  }, [liveStats, queryClient])
 
   useEffect(() => {
     // Only process new events since last check
@@ -48,13 +95,17 @@ export function useRealtimeSync() {
     lastProcessedRef.current = events.length
 
     let shouldInvalidateCases = false
-    let shouldInvalidateStats = false
     const caseIdsToInvalidate = new Set<string>()
 
     for (const event of newEvents) {
+      // The server could not replay what we missed while offline
+      if (event.type === 'system_message' && event.resync) {
+        queryClient.invalidateQueries()
+        return
+      }
+
       if (CASE_EVENTS.has(event.type)) {
         shouldInvalidateCases = true
-        shouldInvalidateStats = true
 
         if (event.case_id) {
           caseIdsToInvalidate.add(event.case_id)
@@ -67,11 +118,6 @@ export function useRealtimeSync() {
       queryClient.invalidateQueries({ queryKey: caseKeys.lists() })
     }
 
-    if (shouldInvalidateStats) {
-      queryClient.invalidateQueries({ queryKey: statsKeys.all })
-      queryClient.invalidateQueries({ queryKey: executiveKeys.all })
-    }
-
     // Invalidate specific case details and their associated runs/ledger
     for (const caseId of caseIdsToInvalidate) {
       queryClient.invalidateQueries({ queryKey: caseKeys.detail(caseId) })
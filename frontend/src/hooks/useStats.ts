@@ -6,6 +6,7 @@
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query'
 
 import * as api from '@/api/client'
+import { useTimelineStore } from '@/stores'
 import type { BatchCreate } from '@/types'
 
 // Query keys
@@ -21,12 +22,19 @@ export const memoryKeys = {
   all: ['memory'] as const,
 }
 
+// Live counters are pushed as stats_delta over /ws/timeline (see
+// useRealtimeSync); polling is only a fallback while the socket is down.
+function useFallbackInterval(ms: number) {
+  const isConnected = useTimelineStore((state) => state.isConnected)
+  return isConnected ? false : ms
+}
+
 // Get statistics
 export function useStats() {
   return useQuery({
     queryKey: statsKeys.all,
     queryFn: api.getStats,
-    refetchInterval: 5000, // Refetch every 5 seconds
+    refetchInterval: useFallbackInterval(5000),
   })
 }
 
@@ -39,7 +47,7 @@ export function useExecutiveStats() {
   return useQuery({
     queryKey: executiveKeys.all,
     queryFn: api.getExecutiveStats,
-    refetchInterval: 5000,
+    refetchInterval: useFallbackInterval(5000),
   })
 }
 
@@ -61,7 +69,7 @@ export function useMemory() {
   return useQuery({
     queryKey: memoryKeys.all,
     queryFn: api.getMemory,
-    refetchInterval: 10000, // Refetch every 10 seconds (memory changes less frequently)
+    refetchInterval: useFallbackInterval(10000), // memory changes less frequently
   })
 }
 
@@ -13,12 +13,31 @@ const WS_URL = `${WS_BASE}/ws/timeline`
 const RECONNECT_DELAY = 3000
 const PING_INTERVAL = 30000
 
-export function useWebSocket() {
+/**
+ * useWebSocket
+ *
+ * Opens the /ws/timeline connection. Pass server-side filters such as
+ * `['case_id=TW-123']` to receive only matching events instead of the
+ * firehose (fields: type, case_id, run_id, agent).
+ *
+ * On reconnect it sends `resume:<stream_id>:<seq>` so the server replays
+ * only the events missed while offline; if the gap is gone the server
+ * answers `resync_required` and useRealtimeSync refetches everything.
+ * It reconnects with `?resume=1`, so the server holds live events until
+ * the replay is queued and events always arrive in seq order.
+ *
+ * Pass `coalesceMs` to have bursts delivered as array frames flushed at
+ * most every `coalesceMs` milliseconds instead of one frame per event.
+ */
+export function useWebSocket(subscriptions: string[] = [], coalesceMs = 0) {
+  const subscriptionKey = subscriptions.join(',')
   const wsRef = useRef<WebSocket | null>(null)
   const reconnectTimeoutRef = useRef<number | null>(null)
   const pingIntervalRef = useRef<number | null>(null)
+  const streamIdRef = useRef<string | null>(null)
+  const lastSeqRef = useRef(0)
 
-  const { addEvent, setConnected } = useTimelineStore()
+  const { addEvent, applyStatsDelta, setConnected } = useTimelineStore()
 
   const connect = useCallback(() => {
     // Clean up existing connection
@@ -27,12 +46,28 @@ export function useWebSocket() {
     }
 
     try {
-      const ws = new WebSocket(WS_URL)
+      // Have live events held until the replay when resuming
+      const ws = new WebSocket(streamIdRef.current ? `${WS_URL}?resume=1` : WS_URL)
 
       ws.onopen = () => {
         console.log('[WebSocket] Connected')
         setConnected(true)
 
+        // Apply server-side subscription filters
+        for (const filter of subscriptionKey ? subscriptionKey.split(',') : []) {
+          ws.send(`subscribe:${filter}`)
+        }
+
+        // Opt into coalesced array frames
+        if (coalesceMs > 0) {
+          ws.send(`coalesce:${coalesceMs}`)
+        }
+
+        // Ask for the events missed while disconnected
+        if (streamIdRef.current) {
+          ws.send(`resume:${streamIdRef.current}:${lastSeqRef.current}`)
+        }
+
         // Start ping interval
         pingIntervalRef.current = window.setInterval(() => {
           if (ws.readyState === WebSocket.OPEN) {
@@ -46,8 +81,27 @@ export function useWebSocket() {
         if (event.data === 'pong') return
 
         try {
-          const data = JSON.parse(event.data) as TimelineEvent
-          addEvent(data)
+          const parsed = JSON.parse(event.data) as TimelineEvent | TimelineEvent[]
+          for (const data of Array.isArray(parsed) ? parsed : [parsed]) {
+            if (data.stream_id) {
+              // First connect or a restarted server: start counting from
+              // the welcome. On the same stream the welcome's seq is the
+              // server's, not ours: the replay of the gap is still to come.
+              if (data.stream_id !== streamIdRef.current) {
+                streamIdRef.current = data.stream_id
+                lastSeqRef.current = data.seq ?? 0
+              }
+            } else if (data.seq !== undefined) {
+              // Only events actually received move the resume point
+              if (data.seq <= lastSeqRef.current) continue
+              lastSeqRef.current = data.seq
+            }
+            if (data.type === 'stats_delta') {
+              applyStatsDelta(data)
+            } else {
+              addEvent(data)
+            }
+          }
         } catch (e) {
           console.error('[WebSocket] Failed to parse message:', e)
         }
@@ -83,7 +137,7 @@ export function useWebSocket() {
         connect()
       }, RECONNECT_DELAY)
     }
-  }, [addEvent, setConnected])
+  }, [addEvent, applyStatsDelta, setConnected, subscriptionKey, coalesceMs])
 
   const disconnect = useCallback(() => {
     // Clear reconnect timeout
@@ -98,8 +152,9 @@ export function useWebSocket() {
       pingIntervalRef.current = null
     }
 
-    // Close WebSocket
+    // Close WebSocket (without triggering the reconnect handler)
     if (wsRef.current) {
+      wsRef.current.onclose = null
       wsRef.current.close()
       wsRef.current = null
     }
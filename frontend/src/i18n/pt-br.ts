@@ -394,6 +394,9 @@ export const csvPack = {
   subtitle: 'Validação de Sistema Computadorizado — Pronto para auditoria externa (21 CFR Parte 11)',
   generatePack: 'Gerar Pacote',
   generating: 'Gerando...',
+  progress: (completed: number, total: number, step: string | null) =>
+    step ? `Gerando ${step} (${completed}/${total})` : `Gerando (${completed}/${total})`,
+  downloadZip: 'Baixar ZIP',
   packGenerated: 'Pacote CSV Gerado',
   readyForAudit: 'Documentação de conformidade pronta para auditoria externa',
   auditReady: 'Pronto para Auditoria Externa',
@@ -416,6 +419,7 @@ export const csvPack = {
   },
   toasts: {
     success: 'Pacote CSV gerado com sucesso',
+    cached: 'Pacote CSV inalterado — reutilizado do cache',
     error: 'Falha ao gerar Pacote CSV',
     downloaded: (title: string) => `${title} baixado`,
   },
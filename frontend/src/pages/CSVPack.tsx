@@ -7,7 +7,13 @@ import { useState } from 'react'
 import { Shield, FileText, Database, Download, Loader2, CheckCircle2, Rocket } from 'lucide-react'
 import { cn } from '@/lib/utils'
 import { csvPack as t, DATE_LOCALE } from '@/i18n'
-import { generateCSVPack, type CSVPackResult, type CSVPackArtifact } from '@/api/client'
+import {
+  csvPackDownloadUrl,
+  generateCSVPack,
+  type CSVPackArtifact,
+  type CSVPackJob,
+  type CSVPackResult,
+} from '@/api/client'
 import { GlassPanel } from '@/components/domain/GlassPanel'
 import { EmptyState } from '@/components/domain/EmptyState'
 import { Button } from '@/components/ui/button'
@@ -66,22 +72,30 @@ function downloadArtifact(artifact: CSVPackArtifact) {
 // ============================================
 export default function CSVPack() {
   const [result, setResult] = useState<CSVPackResult | null>(null)
+  const [jobId, setJobId] = useState<string | null>(null)
+  const [progress, setProgress] = useState<CSVPackJob | null>(null)
   const [isGenerating, setIsGenerating] = useState(false)
 
   const handleGenerate = async () => {
     setIsGenerating(true)
     try {
-      const packResult = await generateCSVPack()
-      setResult(packResult)
-      toast.success(t.toasts.success)
+      const job = await generateCSVPack(setProgress)
+      setResult(job.result ?? null)
+      setJobId(job.job_id)
+      toast.success(job.cached ? t.toasts.cached : t.toasts.success)
     } catch (error) {
       console.error('Failed to generate CSV Pack:', error)
       toast.error(t.toasts.error)
     } finally {
       setIsGenerating(false)
+      setProgress(null)
     }
   }
 
+  const generatingLabel = progress
+    ? t.progress(progress.completed_steps, progress.total_steps, progress.current_step)
+    : t.generating
+
   return (
     <div className="flex flex-col h-full gap-[var(--float-gap)]">
       {/* Header */}
@@ -102,7 +116,7 @@ export default function CSVPack() {
             {isGenerating ? (
               <>
                 <Loader2 className="w-4 h-4 animate-spin" />
-                {t.generating}
+                {generatingLabel}
               </>
             ) : (
               <>
@@ -126,7 +140,7 @@ export default function CSVPack() {
                 {isGenerating ? (
                   <>
                     <Loader2 className="w-4 h-4 animate-spin" />
-                    {t.generating}
+                    {generatingLabel}
                   </>
                 ) : (
                   <>
@@ -151,6 +165,14 @@ export default function CSVPack() {
                   </p>
                 </div>
                 <div className="flex items-center gap-2">
+                  {jobId && (
+                    <Button asChild variant="outline" size="sm" className="gap-1">
+                      <a href={csvPackDownloadUrl(jobId)} download>
+                        <Download className="w-3 h-3" />
+                        {t.downloadZip}
+                      </a>
+                    </Button>
+                  )}
                   <Badge
                     variant="outline"
                     className="bg-green-500/10 backdrop-blur-sm text-green-400 border-green-400/30"
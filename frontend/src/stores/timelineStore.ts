@@ -5,14 +5,16 @@
 
 import { create } from 'zustand'
 
-import type { TimelineEvent } from '@/types'
+import type { StatsDelta, TimelineEvent } from '@/types'
 
 interface TimelineState {
   events: TimelineEvent[]
   isConnected: boolean
   autoScroll: boolean
   filter: string | null
+  liveStats: StatsDelta | null
   addEvent: (event: TimelineEvent) => void
+  applyStatsDelta: (event: TimelineEvent) => void
   clearEvents: () => void
   setConnected: (connected: boolean) => void
   setAutoScroll: (autoScroll: boolean) => void
@@ -26,12 +28,26 @@ export const useTimelineStore = create<TimelineState>((set) => ({
   isConnected: false,
   autoScroll: true,
   filter: null,
+  liveStats: null,
 
   addEvent: (event) =>
     set((state) => ({
       events: [event, ...state.events].slice(0, MAX_EVENTS),
     })),
 
+  // Deltas carry absolute values, so merging them is order-safe
+  applyStatsDelta: (event) =>
+    set((state) => {
+      const data = (event.data ?? {}) as Partial<StatsDelta>
+      return {
+        liveStats: {
+          version: event.version ?? 0,
+          stats: { ...state.liveStats?.stats, ...data.stats },
+          executive: { ...state.liveStats?.executive, ...data.executive },
+        },
+      }
+    }),
+
   clearEvents: () => set({ events: [] }),
 
   setConnected: (isConnected) => set({ isConnected }),
@@ -141,6 +141,8 @@ export type TimelineEventType =
   | 'pattern_matched'
   | 'human_review_requested'
   | 'human_feedback_received'
+  | 'stats_delta'
+  | 'csv_pack_progress'
   | 'system_message'
   | 'error'
 
@@ -152,6 +154,17 @@ export interface TimelineEvent {
   agent?: string
   message?: string
   data?: Record<string, unknown>
+  seq?: number
+  stream_id?: string
+  resync?: boolean
+  version?: number
+}
+
+// Dashboard counters pushed over the timeline (new values of changed keys)
+export interface StatsDelta {
+  version: number
+  stats: Partial<Statistics>
+  executive: Record<string, number>
 }
 
 // ============================================